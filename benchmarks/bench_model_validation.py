@@ -0,0 +1,81 @@
+"""Benchmark bulk model validation throughput.
+
+Compares the previous per-item path (``json.loads`` then ``Model(**item)`` in a
+Python loop) with the cached ``TypeAdapter(list[Model])`` validating the raw
+bytes in one pass.
+
+Usage:
+    python -m benchmarks.bench_model_validation --count 20000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Type
+
+from pydantic import BaseModel
+
+from core.utils.file import FileUtils
+from core.utils.json import JsonUtils
+from services.api.models.response.standard_ip_lookup.hostname_response_model import (
+    HostnameResponse,
+)
+from services.api.models.response.standard_ip_lookup.ip_response_model import IPResponse
+
+FIXTURES = {
+    IPResponse: "data/test_data/ip_stack/lookup.json",
+    HostnameResponse: "data/test_data/ip_stack/hostname.json",
+}
+
+
+def build_payload(model_class: Type[BaseModel], count: int) -> bytes:
+    """Repeat the fixture records until ``count`` items are in the payload."""
+    records = JsonUtils.read_json_file(FileUtils.get_file_path(FIXTURES[model_class]))
+    items = [
+        dict(
+            records[i % len(records)], ip=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+        )
+        for i in range(count)
+    ]
+    return json.dumps(items).encode("utf-8")
+
+
+def measure(label: str, count: int, repeat: int, run: Callable[[], list]) -> float:
+    best = min(_timed(run) for _ in range(repeat))
+    rate = count / best
+    print(f"  {label:<28} {best * 1000:9.1f} ms  {rate:12,.0f} models/sec")
+    return rate
+
+
+def _timed(run: Callable[[], list]) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for model_class in FIXTURES:
+        payload = build_payload(model_class, args.count)
+        print(f"{model_class.__name__} x {args.count} ({len(payload) / 1e6:.1f} MB)")
+        before = measure(
+            "json.loads + Model(**item)",
+            args.count,
+            args.repeat,
+            lambda: [model_class(**item) for item in json.loads(payload)],
+        )
+        after = measure(
+            "TypeAdapter.validate_json",
+            args.count,
+            args.repeat,
+            lambda: JsonUtils.read_json_bytes_as_list_model(payload, model_class),
+        )
+        print(f"  speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark pytest startup with ``python -X importtime``.
+
+Collects a suite in a subprocess, sums the import time of every module and
+lists the slowest top-level imports. The run fails when the total exceeds
+the threshold or a module that the suite should not need (Playwright and
+psycopg2 for the API suite) was imported.
+
+Usage:
+    python -m benchmarks.bench_startup --paths tests/api --max-ms 1500
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+# "import time: self [us] | cumulative | imported package", nesting by indent
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+DEFAULT_FORBIDDEN = ("playwright", "psycopg2")
+# Import time allowed for collecting the API suite, about twice the current cost
+DEFAULT_MAX_MS = 1500.0
+
+
+@dataclass
+class ImportProfile:
+    """Modules imported by one collection run, times in microseconds."""
+
+    self_us: Dict[str, int] = field(default_factory=dict)
+    top_level: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.self_us.values()) / 1000
+
+    def imported(self, package: str) -> bool:
+        """Whether ``package`` or any of its submodules was imported."""
+        return any(
+            name == package or name.startswith(f"{package}.") for name in self.self_us
+        )
+
+    def slowest(self, count: int = 10) -> List[Tuple[str, int]]:
+        return sorted(self.top_level, key=lambda item: -item[1])[:count]
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    profile = ImportProfile()
+    for line in output.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        profile.self_us[name] = int(self_us)
+        if len(indent) == 1:
+            profile.top_level.append((name, int(cumulative_us)))
+    return profile
+
+
+def profile_collection(
+    paths: Sequence[str] = ("tests/api",), extra_args: Iterable[str] = ()
+) -> ImportProfile:
+    """Collect ``paths`` in a fresh interpreter and profile its imports.
+
+    Output capturing is disabled (``-s``), otherwise pytest swallows the
+    importtime lines of conftest and test modules.
+    """
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-m",
+        "pytest",
+        *paths,
+        "--collect-only",
+        "-q",
+        "-s",
+        "-o",
+        "addopts=",
+        "-p",
+        "no:cacheprovider",
+        *extra_args,
+    ]
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Collection failed:\n{result.stdout}\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", nargs="+", default=["tests/api"])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-ms", type=float, default=DEFAULT_MAX_MS)
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN))
+    parser.add_argument(
+        "--with-playwright",
+        action="store_true",
+        help="Keep the pytest-playwright plugin loaded",
+    )
+    args = parser.parse_args()
+
+    extra_args = [] if args.with_playwright else ["-p", "no:playwright"]
+    profiles = [profile_collection(args.paths, extra_args) for _ in range(args.runs)]
+    best = min(profiles, key=lambda profile: profile.total_ms)
+    print(
+        f"{' '.join(args.paths)}: {best.total_ms:.1f} ms of imports (best of {args.runs})"
+    )
+    for name, cumulative_us in best.slowest():
+        print(f"  {name:<48} {cumulative_us / 1000:9.1f} ms")
+
+    failures = [f"{name} was imported" for name in args.forbid if best.imported(name)]
+    if best.total_ms > args.max_ms:
+        failures.append(f"imports took {best.total_ms:.1f} ms (max {args.max_ms} ms)")
+    if failures:
+        sys.exit("Startup regression: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
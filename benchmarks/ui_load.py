@@ -0,0 +1,57 @@
+"""Replay the UI smoke flow with concurrent virtual users.
+
+Runs ``LoginPage.login`` and the home page checks for N users, each in its
+own browser context, and prints per-step latency percentiles, successful and
+failed iterations and the throughput of successful ones. ``--stub`` targets an in-process stand-in for saucedemo, so the
+run needs no network access.
+
+Usage:
+    python -m benchmarks.ui_load --stub --users 20 --duration 30
+"""
+
+import argparse
+
+from configs.configs import Configs
+from core.page.async_base_page import run_async
+from core.page.load_runner import LoadProfile, LoadRunner
+from core.server.saucedemo_stub import saucedemo_stub
+
+
+def main() -> None:
+    defaults = LoadProfile.from_configs()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--ramp-up", type=float, default=defaults.ramp_up)
+    parser.add_argument("--duration", type=float, default=defaults.duration)
+    parser.add_argument("--think-time", type=float, default=defaults.think_time)
+    parser.add_argument("--base-url", default=Configs().BASE_URL)
+    parser.add_argument("--stub", action="store_true", help="Use a local stub")
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--output", default="reports/load/ui_load.json")
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        users=args.users,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        think_time=args.think_time,
+    )
+    server = saucedemo_stub().start() if args.stub else None
+    try:
+        runner = LoadRunner(
+            server.url if server else args.base_url,
+            profile=profile,
+            browser_name=args.browser,
+            headless=not args.headed,
+        )
+        report = run_async(runner.run())
+    finally:
+        if server:
+            server.stop()
+    print(report)
+    print(f"Report written to {report.write_json(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,29 @@
-"""Configuration management module."""
+"""Configuration management module.
+
+Settings are read from ``configs/.env.{ACTIVE_ENV}`` once per process and
+cached by environment and file modification time; the file is checked for
+changes at most once a second, so ``Configs().X`` is otherwise a lookup and
+an attribute read. A value comes from the env file, then
+from ``os.environ``, then from the field default; an empty value counts as
+unset. Values are converted to the field types and validated when the file
+is loaded. The process environment is never modified.
+"""
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+_TRUE = {"true", "1", "yes", "on"}
+_FALSE = {"false", "0", "no", "off"}
+# How often the env file is checked for changes
+RECHECK_SECONDS = 1.0
+
+
+def _one_of(default: str, *choices: str) -> Any:
+    """A setting that only accepts ``choices``, checked when the file is loaded."""
+    return field(default=default, metadata={"choices": (default, *choices)})
 
 
 @dataclass
@@ -10,77 +31,165 @@ class Configs:
     """Environment configuration class."""
 
     # URLs
-    BASE_URL: str
+    BASE_URL: str = ""
 
     # Authentication
-    AUTH_USERNAME: str
-    AUTH_PASSWORD: str
+    AUTH_USERNAME: str = ""
+    AUTH_PASSWORD: str = ""
+    AUTH_STATE_DIR: str = "reports/.auth"
+    AUTH_STATE_TTL: int = 1800
 
     # Ip Stack
-    IP_STACK_BASE_URL: str
-    IP_STACK_ACCESS_KEY: str
+    IP_STACK_BASE_URL: str = ""
+    IP_STACK_ACCESS_KEY: str = ""
+    IP_STACK_MODE: str = _one_of("live", "record", "replay")
+    IP_STACK_ARCHIVE: str = "data/recordings/ip_stack.json.gz"
+    IP_STACK_REPLAY_LATENCY_MS: float = 0.0
+    IP_STACK_REPLAY_CONCURRENCY: int = 0
 
     # Browser Configuration
-    HEADLESS: bool
-    RECORD_VIDEO: bool
+    HEADLESS: bool = False
+    RECORD_VIDEO: bool = False
+    UI_WORKERS: int = 0
+    UI_BLOCK_RESOURCES: str = ""
+    UI_BLOCK_DOMAINS: str = ""
+    UI_ASSET_CACHE_DIR: str = ""
+    UI_ASSET_CACHE_TTL: int = 3600
+    UI_STEP_LOG: str = _one_of("all", "failures", "off")
+    UI_WEB_VITALS: bool = False
+    UI_FAILURE_CAPTURE: str = _one_of("screenshot", "dom", "off")
+    UI_SCREENSHOT_TYPE: str = _one_of("jpeg", "png")
+    UI_SCREENSHOT_QUALITY: int = 70
+    UI_SCREENSHOT_FULL_PAGE: bool = False
+    UI_CAPTURE_MODE: str = _one_of("sampled", "failures", "retries", "always", "off")
+    UI_CAPTURE_KINDS: str = "trace"
+    UI_CAPTURE_SAMPLE_PERCENT: float = 10.0
+    UI_CAPTURE_KEEP: int = 20
+    UI_CAPTURE_DIR: str = "reports/traces"
+
+    # Load generator
+    LOAD_USERS: int = 10
+    LOAD_RAMP_UP: float = 5.0
+    LOAD_DURATION: float = 30.0
+    LOAD_THINK_TIME: float = 0.0
 
     # API Configuration
-    API_TIMEOUT: int
-    API_RETRY_COUNT: int
-    API_DEBUG: bool
-
-    DB_HOST: str
-    DB_PORT: int
-    DB_USER: str
-    DB_PASSWORD: str
-    DB_NAME: str
-
-    _instance: Optional["Configs"] = None
+    API_TIMEOUT: int = 30
+    API_RETRY_COUNT: int = 3
+    API_CONNECT_TIMEOUT: int = 5
+    API_DEADLINE: int = 60
+    API_DEBUG: bool = False
+    API_MAX_CONNECTIONS: int = 20
+    API_CONCURRENCY: int = 10
+    API_CACHE_ENABLED: bool = False
+    API_CACHE_TTL: int = 300
+    API_CACHE_TTL_OVERRIDES: str = ""
+    API_CACHE_MAX_MB: int = 64
+    API_CACHE_DIR: str = ""
+    API_ATTACH_MODE: str = _one_of("always", "on_failure", "bench")
+    API_ATTACH_MAX_KB: int = 64
+    API_ATTACH_OVERSIZE: str = _one_of("truncate", "sample")
+    API_ATTACH_FILE_KB: int = 1024
+
+    # Database Configuration
+    DB_HOST: str = "localhost"
+    DB_PORT: int = 5432
+    DB_USER: str = ""
+    DB_PASSWORD: str = ""
+    DB_NAME: str = ""
+    DB_POOL_MIN: int = 1
+    DB_POOL_MAX: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+
+    # Loaded settings by (env file, modification time)
+    _cache: ClassVar[Dict[Tuple[str, int], "Configs"]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    # (env, recheck deadline, settings) of the last lookup
+    _current: ClassVar[Optional[Tuple[str, float, "Configs"]]] = None
 
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        env = os.getenv("ACTIVE_ENV", "dev")
+    def __new__(cls):
+        """Get the settings of the active environment, loading them once."""
+        env = os.environ.get("ACTIVE_ENV", "dev")
+        current = cls._current
+        if current is not None and current[0] == env and time.monotonic() < current[1]:
+            return current[2]
         env_file = f"configs/.env.{env}"
+        try:
+            key = (env_file, os.stat(env_file).st_mtime_ns)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Env file not found: {env_file}") from None
+        instance = cls._cache.get(key)
+        if instance is None:
+            with cls._lock:
+                instance = cls._cache.get(key)
+                if instance is None:
+                    instance = cls._cache[key] = cls._load(env_file)
+        cls._current = (env, time.monotonic() + RECHECK_SECONDS, instance)
+        return instance
 
-        if not os.path.exists(env_file):
-            raise FileNotFoundError(f"Env file not found: {env_file}")
-
-        # Load environment variables from file
+    def __init__(self):
+        """Settings are assigned by ``_load``, ``Configs()`` only looks them up."""
+
+    @classmethod
+    def _load(cls, env_file: str) -> "Configs":
+        """Parse and validate ``env_file``.
+
+        Raises:
+            ValueError: On malformed lines, values of the wrong type or values
+                outside a setting's choices, all problems of the file reported
+                at once.
+        """
+        values, errors = cls._read_env_file(env_file)
+        instance = object.__new__(cls)
+        for config_field in fields(cls):
+            name = config_field.name
+            raw = values.get(name) or os.environ.get(name, "")
+            if not raw.strip():
+                setattr(instance, name, config_field.default)
+                continue
+            try:
+                value = cls._convert(raw.strip(), config_field.type)
+            except ValueError:
+                errors.append(
+                    f"{name}={raw!r} is not a valid {config_field.type.__name__}"
+                )
+                continue
+            choices = config_field.metadata.get("choices")
+            if choices and value not in choices:
+                errors.append(f"{name}={raw!r} is not one of {', '.join(choices)}")
+                continue
+            setattr(instance, name, value)
+        if errors:
+            raise ValueError(f"Invalid settings in {env_file}: " + "; ".join(errors))
+        return instance
+
+    @staticmethod
+    def _read_env_file(env_file: str) -> Tuple[Dict[str, str], List[str]]:
+        values, errors = {}, []
         with open(env_file) as f:
-            for line in f:
+            for number, line in enumerate(f, start=1):
                 line = line.strip()
-                if line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    os.environ[key.strip()] = value.strip()
-
-        # URLs
-        self.BASE_URL = os.getenv("BASE_URL", "")
-
-        # Ip Stack
-        self.IP_STACK_BASE_URL = os.getenv("IP_STACK_BASE_URL", "")
-        self.IP_STACK_ACCESS_KEY = os.getenv("IP_STACK_ACCESS_KEY", "")
-
-        # Authentication
-        self.AUTH_USERNAME = os.getenv("AUTH_USERNAME", "")
-        self.AUTH_PASSWORD = os.getenv("AUTH_PASSWORD", "")
-
-        # Browser Configuration
-        self.HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
-        self.RECORD_VIDEO = os.getenv("RECORD_VIDEO", "false").lower() == "true"
-
-        # API Configuration
-        self.API_TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))
-        self.API_RETRY_COUNT = int(os.getenv("API_RETRY_COUNT", "3"))
-        self.API_DEBUG = os.getenv("API_DEBUG", "false").lower() == "true"
-        # Database Configuration
-        self.DB_HOST = os.getenv("DB_HOST", "localhost")
-        self.DB_PORT = int(os.getenv("DB_PORT", ""))
-        self.DB_USER = os.getenv("DB_USER", "")
-        self.DB_PASSWORD = os.getenv("DB_PASSWORD", "")
-        self.DB_NAME = os.getenv("DB_NAME", "")
-
-    def __new__(cls):
-        """Get singleton instance of Configs."""
-        if not cls._instance:
-            cls._instance = super(Configs, cls).__new__(cls)
-        return cls._instance
+                if not line or line.startswith("#"):
+                    continue
+                key, separator, value = line.partition("=")
+                if not separator:
+                    errors.append(f"line {number} is not KEY=VALUE: {line!r}")
+                    continue
+                values[key.strip()] = value.strip()
+        return values, errors
+
+    @staticmethod
+    def _convert(raw: str, type_: type) -> Any:
+        if type_ is bool:
+            lowered = raw.lower()
+            if lowered not in _TRUE | _FALSE:
+                raise ValueError(raw)
+            return lowered in _TRUE
+        return type_(raw)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget loaded settings so the next ``Configs()`` reads the file again."""
+        with cls._lock:
+            cls._cache.clear()
+            cls._current = None
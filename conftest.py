@@ -15,7 +15,11 @@ def pytest_html_report_title(report):
 
 
 def pytest_configure(config):
-    """Add environment info to HTML report."""
+    """Add environment info to HTML report.
+
+    Settings of the environment are added by ``init_config`` once ``--env``
+    is applied, so collection alone does not load them.
+    """
     # Create reports directory
     os.makedirs("reports/html", exist_ok=True)
 
@@ -23,13 +27,20 @@ def pytest_configure(config):
     config.stash["metadata"] = {
         "Project Name": "Python Demo",
         "Environment": os.getenv("ACTIVE_ENV", "dev"),
-        "Base URL": Configs().BASE_URL,
         "Python Version": platform.python_version(),
         "Platform": platform.platform(),
-        "Headless": str(not bool(config.getoption("--headed"))),
+        "Headless": str(not config.getoption("--headed")),
     }
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Scale `-n auto` to the CPUs available, or to UI_WORKERS when set."""
+    from core.page.browser_pool import available_workers
+
+    return available_workers(Configs().UI_WORKERS)
+
+
 def pytest_metadata(metadata):
     metadata.pop("JAVA_HOME", None)
     metadata.pop("Plugins", None)
@@ -38,11 +49,16 @@ def pytest_metadata(metadata):
     metadata.pop("Python", None)
 
 
-def pytest_addoption(parser):
+def pytest_addoption(parser, pluginmanager):
     """Add command line options."""
     parser.addoption(
         "--env", action="store", default="dev", help="Environment: dev/staging/prod"
     )
+    if not pluginmanager.has_plugin("playwright"):
+        # Keep addopts valid when API-only runs skip Playwright (-p no:playwright)
+        parser.addoption(
+            "--headed", action="store_true", help="Unused without Playwright"
+        )
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -50,3 +66,7 @@ def init_config(request):
     """Initialize test configuration."""
     env = request.config.getoption("--env")
     os.environ["ACTIVE_ENV"] = env
+    metadata = request.config.stash.get("metadata", None)
+    if metadata is not None:
+        metadata["Environment"] = env
+        metadata["Base URL"] = Configs().BASE_URL
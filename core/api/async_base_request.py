@@ -0,0 +1,325 @@
+"""Asynchronous counterpart of BaseRequest.
+
+Requests share one keep-alive connection pool per client instance and are
+throttled by a semaphore, so many lookups can be in flight at once without
+opening an unbounded number of sockets. Retries, the circuit breaker and the
+response cache follow the same policies as BaseRequest.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Type, TypeVar
+
+import httpx
+from httpx import Response
+from pydantic import BaseModel
+
+from core.api.attachment_policy import AttachmentPolicy, AttachmentRecorder
+from core.api.resilience import (
+    AttemptRecord,
+    CircuitBreaker,
+    RetryPolicy,
+    describe_attempts,
+)
+from core.api.response_cache import CachedResponse, ResponseCache
+from core.utils.json import JsonUtils
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseRequest:
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 20,
+        concurrency: int = 10,
+        keepalive_expiry: float = 30.0,
+        attachment_policy: Optional[AttachmentPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """Initialize an async HTTP client.
+
+        Args:
+            base_url: Base URL that every endpoint is joined to
+            headers: Default headers sent with every request
+            max_connections: Upper bound of open connections in the pool
+            concurrency: Maximum number of requests in flight at the same time
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+            attachment_policy: Which Allure attachments to record (API_ATTACH_* by default)
+            cache: Response cache for GET requests, shared with sync clients
+            retry_policy: Timeouts and retries (API_TIMEOUT and friends by default)
+            circuit_breaker: Breaker of the upstream, shared per base URL by default
+        """
+        self.base_url = base_url
+        self.cache = cache
+        self.attachment_policy = attachment_policy or AttachmentPolicy.from_configs()
+        self.retry_policy = retry_policy or RetryPolicy.from_configs()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.for_upstream(base_url)
+        # Timing of the most recent attempts, retries included
+        self.attempts: Deque[AttemptRecord] = deque(maxlen=1000)
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            timeout=httpx.Timeout(
+                self.retry_policy.read_timeout,
+                connect=self.retry_policy.connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncBaseRequest":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        await self.session.aclose()
+
+    async def request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """Send an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: The endpoint path (will be joined with base_url)
+            **kwargs: Additional arguments to pass to the request (params, data, json, headers, etc.)
+
+        Returns:
+            Response object
+        """
+        # Ensure clean URL joining by stripping slashes
+        base = self.base_url.rstrip("/")
+        path = endpoint.lstrip("/")
+        url = f"{base}/{path}"
+        recorder = self.attachment_policy.recorder()
+        recorder.add("Request URL", lambda: url)
+        if "params" in kwargs:
+            recorder.add("Request Params", lambda: str(kwargs["params"]))
+        if "data" in kwargs:
+            recorder.add("Request Data", lambda: str(kwargs["data"]))
+        if "json" in kwargs:
+            recorder.add("Request JSON", lambda: str(kwargs["json"]))
+        cacheable = self.cache is not None and method.upper() == "GET"
+        entry = (
+            self.cache.get_entry(method, url, kwargs.get("params"))
+            if cacheable
+            else None
+        )
+        response = None
+        try:
+            if entry is not None:
+                response = self._from_cache(method, entry)
+                recorder.add("Response Cache", lambda: "HIT")
+            else:
+                response = await self._send_with_retries(
+                    method.upper(), url, recorder, **kwargs
+                )
+                response.raise_for_status()
+                if cacheable:
+                    self.cache.set(method, url, kwargs.get("params"), response)
+        except Exception:
+            if response is not None:
+                self._record_response(recorder, response)
+            recorder.commit(failed=True)
+            raise
+        self._record_response(recorder, response)
+        recorder.commit(failed=False)
+        return response
+
+    @staticmethod
+    def _record_response(recorder: AttachmentRecorder, response: Response) -> None:
+        recorder.add("Response Status Code", lambda: str(response.status_code))
+        recorder.add("Response Content", lambda: response.content)
+
+    @staticmethod
+    def _from_cache(method: str, entry: CachedResponse) -> Response:
+        # The cached body is already decoded
+        headers = {
+            name: value
+            for name, value in entry.headers.items()
+            if name.lower() not in ("content-encoding", "content-length")
+        }
+        return Response(
+            entry.status_code,
+            headers=headers,
+            content=entry.content,
+            request=httpx.Request(method.upper(), entry.url),
+        )
+
+    async def _send_with_retries(
+        self, method: str, url: str, recorder: AttachmentRecorder, **kwargs: Any
+    ) -> Response:
+        """Send a request, retrying transient failures like BaseRequest does.
+
+        Network errors, timeouts and retryable status codes of idempotent
+        requests are retried with exponential backoff within the deadline;
+        every failed call is reported to the circuit breaker.
+        """
+        policy = self.retry_policy
+        max_retries = policy.retries_for(method)
+        self.circuit_breaker.before_call(self.base_url)
+        caller_timeout = kwargs.pop("timeout", None)
+        started = time.monotonic()
+        records: List[AttemptRecord] = []
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = (
+                policy.deadline - (time.monotonic() - started)
+                if policy.deadline
+                else None
+            )
+            if caller_timeout is not None:
+                timeout = caller_timeout
+            else:
+                connect, read = policy.timeout(remaining)
+                timeout = httpx.Timeout(read, connect=connect)
+            attempt_started = time.perf_counter()
+            response, error = None, None
+            try:
+                async with self._semaphore:
+                    response = await self.session.request(
+                        method=method, url=url, timeout=timeout, **kwargs
+                    )
+            except (httpx.NetworkError, httpx.TimeoutException) as exc:
+                error = exc
+            except Exception:
+                self.circuit_breaker.record_failure()
+                raise
+            record = AttemptRecord(
+                method=method,
+                url=url,
+                attempt=attempt,
+                elapsed=time.perf_counter() - attempt_started,
+                status_code=response.status_code if response is not None else None,
+                error=repr(error) if error else None,
+            )
+            records.append(record)
+            self.attempts.append(record)
+
+            if error is None and response.status_code not in policy.retry_statuses:
+                self.circuit_breaker.record_success()
+                break
+            delay = policy.backoff(attempt)
+            out_of_time = (
+                policy.deadline is not None
+                and time.monotonic() - started + delay >= policy.deadline
+            )
+            if attempt > max_retries or out_of_time:
+                self.circuit_breaker.record_failure()
+                if error is not None:
+                    self._record_attempts(recorder, records)
+                    raise error
+                break
+            record.backoff = delay
+            logger.warning(
+                "Retrying %s %s in %.2fs (attempt %d: %s)",
+                method,
+                url,
+                delay,
+                attempt,
+                record.error or record.status_code,
+            )
+            await asyncio.sleep(delay)
+
+        self._record_attempts(recorder, records)
+        return response
+
+    @staticmethod
+    def _record_attempts(
+        recorder: AttachmentRecorder, records: List[AttemptRecord]
+    ) -> None:
+        if len(records) > 1:
+            recorder.add("Request Attempts", lambda: describe_attempts(records))
+
+    async def get(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> Response:
+        """Send a GET request.
+
+        Args:
+            endpoint: The endpoint path (will be joined with base_url)
+            params: Query parameters to include in the request
+            **kwargs: Additional arguments to pass to the request (headers, etc.)
+
+        Returns:
+            Response object
+        """
+        return await self.request("GET", endpoint, params=params, **kwargs)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a POST request.
+
+        Args:
+            endpoint: The endpoint path (will be joined with base_url)
+            data: Form data to include in the request
+            json: JSON data to include in the request
+            **kwargs: Additional arguments to pass to the request (headers, etc.)
+
+        Returns:
+            Response object
+        """
+        return await self.request("POST", endpoint, data=data, json=json, **kwargs)
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a PUT request.
+
+        Args:
+            endpoint: The endpoint path (will be joined with base_url)
+            data: Form data to include in the request
+            json: JSON data to include in the request
+            **kwargs: Additional arguments to pass to the request (headers, etc.)
+
+        Returns:
+            Response object
+        """
+        return await self.request("PUT", endpoint, data=data, json=json, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> Response:
+        """Send a DELETE request.
+
+        Args:
+            endpoint: The endpoint path (will be joined with base_url)
+            **kwargs: Additional arguments to pass to the request (headers, etc.)
+
+        Returns:
+            Response object
+        """
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    def convert_response_to_model(self, response: Response, model_class: Type[T]) -> T:
+        """Convert response JSON to a specified model.
+
+        Args:
+            response: The Response object from httpx
+            model_class: The model class to convert the JSON into
+
+        Returns:
+            An instance of the model populated with the response data
+        """
+        return JsonUtils.read_json_bytes_as_model(response.content, model_class)
@@ -0,0 +1,122 @@
+"""Policy deciding which request/response details are attached to Allure.
+
+Attachment bodies are passed as callables and only rendered when the policy
+actually keeps them, so a green run in "on_failure" or "bench" mode never
+formats params or decodes response bodies.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, List, Tuple, Union
+
+import allure
+
+Body = Union[str, bytes]
+
+ATTACH_ALWAYS = "always"
+ATTACH_ON_FAILURE = "on_failure"
+ATTACH_BENCH = "bench"
+
+OVERSIZE_TRUNCATE = "truncate"
+OVERSIZE_SAMPLE = "sample"
+
+
+@dataclass
+class AttachmentPolicy:
+    """How request/response attachments are recorded.
+
+    Attributes:
+        mode: "always" attaches every call, "on_failure" only calls that raise,
+            "bench" attaches nothing
+        max_body_bytes: Inline bodies above this size are truncated or sampled
+        oversize: "truncate" keeps the head, "sample" keeps head and tail
+        file_threshold_bytes: Bodies above this size are written whole to a
+            file and attached with allure.attach.file instead (0 disables it)
+    """
+
+    mode: str = ATTACH_ALWAYS
+    max_body_bytes: int = 64 * 1024
+    oversize: str = OVERSIZE_TRUNCATE
+    file_threshold_bytes: int = 1024 * 1024
+
+    def __post_init__(self):
+        if self.mode not in (ATTACH_ALWAYS, ATTACH_ON_FAILURE, ATTACH_BENCH):
+            raise ValueError(f"Unknown attachment mode: {self.mode}")
+        if self.oversize not in (OVERSIZE_TRUNCATE, OVERSIZE_SAMPLE):
+            raise ValueError(f"Unknown oversize handling: {self.oversize}")
+
+    @classmethod
+    def from_configs(cls) -> "AttachmentPolicy":
+        """Build the policy from the API_ATTACH_* settings."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            mode=configs.API_ATTACH_MODE,
+            max_body_bytes=configs.API_ATTACH_MAX_KB * 1024,
+            oversize=configs.API_ATTACH_OVERSIZE,
+            file_threshold_bytes=configs.API_ATTACH_FILE_KB * 1024,
+        )
+
+    def recorder(self) -> "AttachmentRecorder":
+        """Return a recorder collecting the attachments of a single call."""
+        return AttachmentRecorder(self)
+
+    def render(self, body: Body) -> Body:
+        """Shrink a body that exceeds max_body_bytes."""
+        size = len(body)
+        if size <= self.max_body_bytes:
+            return body
+        half = self.max_body_bytes // 2
+        # With less than two bytes to keep, sampling degrades to truncation
+        if self.oversize == OVERSIZE_SAMPLE and half > 0:
+            marker = f"\n... {size - 2 * half} bytes omitted ...\n"
+            if isinstance(body, bytes):
+                return body[:half] + marker.encode() + body[-half:]
+            return body[:half] + marker + body[-half:]
+        marker = f"\n... truncated, {size} bytes in total"
+        if isinstance(body, bytes):
+            return body[: self.max_body_bytes] + marker.encode()
+        return body[: self.max_body_bytes] + marker
+
+    def attach(self, name: str, body: Body) -> None:
+        """Attach a body, writing very large ones whole to a file."""
+        if self.file_threshold_bytes and len(body) > self.file_threshold_bytes:
+            data = body if isinstance(body, bytes) else body.encode("utf-8")
+            fd, path = tempfile.mkstemp(suffix=".txt")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                allure.attach.file(
+                    path, name=name, attachment_type=allure.attachment_type.TEXT
+                )
+            finally:
+                os.remove(path)
+            return
+        body = self.render(body)
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        allure.attach(name=name, body=body)
+
+
+class AttachmentRecorder:
+    """Collects the lazy attachments of one request according to a policy."""
+
+    def __init__(self, policy: AttachmentPolicy):
+        self.policy = policy
+        self._pending: List[Tuple[str, Callable[[], Body]]] = []
+
+    def add(self, name: str, body: Callable[[], Body]) -> None:
+        """Record an attachment whose body is only built when it is kept."""
+        if self.policy.mode == ATTACH_ALWAYS:
+            self.policy.attach(name, body())
+        elif self.policy.mode == ATTACH_ON_FAILURE:
+            self._pending.append((name, body))
+
+    def commit(self, failed: bool) -> None:
+        """Attach buffered entries of a failed call and drop the rest."""
+        if failed:
+            for name, body in self._pending:
+                self.policy.attach(name, body())
+        self._pending.clear()
@@ -1,10 +1,20 @@
 import logging
-from typing import Any, Dict, Optional, TypeVar
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, TypeVar
 
-import allure
 from pydantic import BaseModel
-from requests import Response, Session
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response, Session, Timeout
 
+from core.api.attachment_policy import AttachmentPolicy, AttachmentRecorder
+from core.api.resilience import (
+    AttemptRecord,
+    CircuitBreaker,
+    RetryPolicy,
+    describe_attempts,
+)
+from core.api.response_cache import ResponseCache
 from core.utils.json import JsonUtils
 
 T = TypeVar("T", bound=BaseModel)
@@ -14,8 +24,22 @@ logger = logging.getLogger(__name__)
 
 
 class BaseRequest:
-    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        attachment_policy: Optional[AttachmentPolicy] = None,
+    ):
         self.base_url = base_url
+        self.cache = cache
+        self.attachment_policy = attachment_policy or AttachmentPolicy.from_configs()
+        self.retry_policy = retry_policy or RetryPolicy.from_configs()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.for_upstream(base_url)
+        # Timing of the most recent attempts, retries included
+        self.attempts: Deque[AttemptRecord] = deque(maxlen=1000)
         self.session = Session()
         if headers:
             self.session.headers.update(headers)
@@ -35,19 +59,125 @@ class BaseRequest:
         base = self.base_url.rstrip("/")
         path = endpoint.lstrip("/")
         url = f"{base}/{path}"
-        allure.attach(name="Request URL", body=url)
+        recorder = self.attachment_policy.recorder()
+        recorder.add("Request URL", lambda: url)
         if "params" in kwargs:
-            allure.attach(name="Request Params", body=str(kwargs["params"]))
+            recorder.add("Request Params", lambda: str(kwargs["params"]))
         if "data" in kwargs:
-            allure.attach(name="Request Data", body=str(kwargs["data"]))
+            recorder.add("Request Data", lambda: str(kwargs["data"]))
         if "json" in kwargs:
-            allure.attach(name="Request JSON", body=str(kwargs["json"]))
-        response = self.session.request(method=method.upper(), url=url, **kwargs)
-        response.raise_for_status()
-        allure.attach(name="Response Status Code", body=str(response.status_code))
-        allure.attach(name="Response Content", body=response.text)
+            recorder.add("Request JSON", lambda: str(kwargs["json"]))
+        cacheable = self.cache is not None and method.upper() == "GET"
+        response = (
+            self.cache.get(method, url, kwargs.get("params")) if cacheable else None
+        )
+        try:
+            if response is not None:
+                recorder.add("Response Cache", lambda: "HIT")
+            else:
+                response = self._send_with_retries(
+                    method.upper(), url, recorder, **kwargs
+                )
+                response.raise_for_status()
+                if cacheable:
+                    self.cache.set(method, url, kwargs.get("params"), response)
+        except Exception:
+            if response is not None:
+                self._record_response(recorder, response)
+            recorder.commit(failed=True)
+            raise
+        self._record_response(recorder, response)
+        recorder.commit(failed=False)
+        return response
+
+    @staticmethod
+    def _record_response(recorder: AttachmentRecorder, response: Response) -> None:
+        recorder.add("Response Status Code", lambda: str(response.status_code))
+        recorder.add("Response Content", lambda: response.content)
+
+    def _send_with_retries(
+        self, method: str, url: str, recorder: AttachmentRecorder, **kwargs: Any
+    ) -> Response:
+        """Send a request, retrying transient failures within the deadline budget.
+
+        Connection errors, timeouts and retryable status codes of idempotent
+        requests are retried with exponential backoff. The last response is
+        returned once it is final or the retries/deadline run out; connection
+        errors are re-raised. Every failed call, whatever the exception, is
+        reported to the circuit breaker.
+        """
+        policy = self.retry_policy
+        max_retries = policy.retries_for(method)
+        self.circuit_breaker.before_call(self.base_url)
+        caller_timeout = kwargs.pop("timeout", None)
+        started = time.monotonic()
+        records: List[AttemptRecord] = []
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = (
+                policy.deadline - (time.monotonic() - started)
+                if policy.deadline
+                else None
+            )
+            timeout = caller_timeout or policy.timeout(remaining)
+            attempt_started = time.perf_counter()
+            response, error = None, None
+            try:
+                response = self.session.request(
+                    method=method, url=url, timeout=timeout, **kwargs
+                )
+            except (RequestsConnectionError, Timeout) as exc:
+                error = exc
+            except Exception:
+                self.circuit_breaker.record_failure()
+                raise
+            record = AttemptRecord(
+                method=method,
+                url=url,
+                attempt=attempt,
+                elapsed=time.perf_counter() - attempt_started,
+                status_code=response.status_code if response is not None else None,
+                error=repr(error) if error else None,
+            )
+            records.append(record)
+            self.attempts.append(record)
+
+            if error is None and response.status_code not in policy.retry_statuses:
+                self.circuit_breaker.record_success()
+                break
+            delay = policy.backoff(attempt)
+            out_of_time = (
+                policy.deadline is not None
+                and time.monotonic() - started + delay >= policy.deadline
+            )
+            if attempt > max_retries or out_of_time:
+                self.circuit_breaker.record_failure()
+                if error is not None:
+                    self._record_attempts(recorder, records)
+                    raise error
+                break
+            record.backoff = delay
+            logger.warning(
+                "Retrying %s %s in %.2fs (attempt %d: %s)",
+                method,
+                url,
+                delay,
+                attempt,
+                record.error or record.status_code,
+            )
+            time.sleep(delay)
+
+        self._record_attempts(recorder, records)
         return response
 
+    @staticmethod
+    def _record_attempts(
+        recorder: AttachmentRecorder, records: List[AttemptRecord]
+    ) -> None:
+        if len(records) > 1:
+            recorder.add("Request Attempts", lambda: describe_attempts(records))
+
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Response:
@@ -125,4 +255,4 @@ class BaseRequest:
         Returns:
             An instance of the model populated with the response data
         """
-        return JsonUtils.read_json_as_model(response.json(), model_class)
+        return JsonUtils.read_json_bytes_as_model(response.content, model_class)
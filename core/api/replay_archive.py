@@ -0,0 +1,181 @@
+"""Compact, indexed archive of recorded HTTP responses.
+
+Responses are indexed by method, path and sorted query parameters, so a
+replay lookup is a single dict access. Secrets such as ``access_key`` are
+left out of the key and never stored. The archive is a gzip-compressed JSON
+file and can be seeded from HAR files (browser DevTools, Playwright
+``record_har_path``) as well as recorded from live ``requests`` traffic.
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import Response
+
+ARCHIVE_VERSION = 1
+# Query parameters that identify the caller rather than the request
+SECRET_PARAMS = frozenset({"access_key", "api_key", "token"})
+# How long a save waits for another process to finish saving
+LOCK_TIMEOUT = 30.0
+# A lock file older than this belongs to a process that died while saving
+STALE_LOCK_SECONDS = 60.0
+
+
+@contextmanager
+def _file_lock(path: Path, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold ``path`` as an exclusive lock file shared by every process.
+
+    Raises:
+        TimeoutError: If the lock was not acquired within ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - path.stat().st_mtime > STALE_LOCK_SECONDS
+            except FileNotFoundError:
+                continue
+            if stale:
+                path.unlink(missing_ok=True)
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout}s")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+
+
+def make_key(
+    method: str, url: str, secret_params: Iterable[str] = SECRET_PARAMS
+) -> str:
+    """Index key of a request: ``METHOD /path?sorted&params`` without secrets."""
+    parts = urlsplit(url)
+    secrets = set(secret_params)
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in secrets
+    )
+    query = "&".join(f"{name}={value}" for name, value in params)
+    path = parts.path or "/"
+    return f"{method.upper()} {path}?{query}" if query else f"{method.upper()} {path}"
+
+
+class ReplayArchive:
+    """Recorded responses keyed by ``make_key``."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the archive, loading ``path`` if it exists.
+
+        Args:
+            path (str): The ``.json.gz`` file backing the archive.
+        """
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self.entries = self._read(self.path)
+
+    @staticmethod
+    def _read(path: Path) -> Dict[str, Dict[str, Any]]:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported replay archive version in {path}")
+        return data["entries"]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded ``{status, content_type, body}`` for a request."""
+        return self.entries.get(make_key(method, url))
+
+    def add(
+        self, method: str, url: str, status: int, content_type: str, body: str
+    ) -> str:
+        """Store a response and return its key."""
+        key = make_key(method, url)
+        with self._lock:
+            self.entries[key] = {
+                "status": status,
+                "content_type": content_type,
+                "body": body,
+            }
+        return key
+
+    def record(self, response: Response, *args: Any, **kwargs: Any) -> Response:
+        """``requests`` response hook storing every response it sees."""
+        self.add(
+            response.request.method,
+            response.request.url,
+            response.status_code,
+            response.headers.get("Content-Type", "application/json"),
+            response.text,
+        )
+        return response
+
+    def import_har(self, har_path: str, host: Optional[str] = None) -> int:
+        """Add the entries of a HAR file, optionally only those for ``host``.
+
+        Returns:
+            int: The number of entries imported.
+        """
+        with open(har_path, encoding="utf-8") as f:
+            har = json.load(f)
+        imported = 0
+        for entry in har.get("log", {}).get("entries", []):
+            request, response = entry["request"], entry["response"]
+            if host and urlsplit(request["url"]).hostname != host:
+                continue
+            content = response.get("content", {})
+            body = content.get("text", "")
+            if content.get("encoding") == "base64":
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            self.add(
+                request["method"],
+                request["url"],
+                response["status"],
+                content.get("mimeType", "application/json"),
+                body,
+            )
+            imported += 1
+        return imported
+
+    def save(self, path: Optional[str] = None) -> Path:
+        """Write the archive, merged with entries saved by other processes.
+
+        The read-merge-write runs under a lock file next to the archive, so
+        xdist workers saving at the same time never drop each other's entries.
+        """
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No path to save the replay archive to")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, _file_lock(target.with_name(f"{target.name}.lock")):
+            entries = self._read(target) if target.exists() else {}
+            entries.update(self.entries)
+            tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(
+                    {"version": ARCHIVE_VERSION, "entries": entries},
+                    f,
+                    separators=(",", ":"),
+                    sort_keys=True,
+                )
+            os.replace(tmp_path, target)
+        return target
@@ -0,0 +1,163 @@
+"""Retry, timeout and circuit breaker primitives used by BaseRequest."""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Only idempotent requests are retried, a retried POST could apply twice
+RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how patiently a request is retried.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        connect_timeout: Seconds allowed to open a connection
+        read_timeout: Seconds allowed between bytes of the response
+        deadline: Total seconds budget for one call, retries and backoff included
+        backoff_factor: Base delay in seconds, doubled on every retry
+        backoff_max: Upper bound of a single backoff delay
+        jitter: Fraction of the delay that is randomized (0 = no jitter)
+        retry_statuses: Status codes that are worth retrying
+        retry_methods: HTTP methods that may be retried
+    """
+
+    max_retries: int = 3
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    deadline: Optional[float] = None
+    backoff_factor: float = 0.5
+    backoff_max: float = 10.0
+    jitter: float = 0.5
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    retry_methods: FrozenSet[str] = RETRYABLE_METHODS
+
+    @classmethod
+    def from_configs(cls) -> "RetryPolicy":
+        """Build the policy from API_TIMEOUT / API_RETRY_COUNT and friends."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            max_retries=configs.API_RETRY_COUNT,
+            connect_timeout=configs.API_CONNECT_TIMEOUT,
+            read_timeout=configs.API_TIMEOUT,
+            deadline=configs.API_DEADLINE or None,
+        )
+
+    def retries_for(self, method: str) -> int:
+        """Return how many retries a request with ``method`` may use."""
+        return self.max_retries if method.upper() in self.retry_methods else 0
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay before the given retry (1-based)."""
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def timeout(self, remaining: Optional[float]) -> Tuple[float, float]:
+        """Return the (connect, read) timeout, shrunk to fit the remaining budget."""
+        if remaining is None:
+            return self.connect_timeout, self.read_timeout
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+
+@dataclass
+class AttemptRecord:
+    """Timing of one attempt of a request."""
+
+    method: str
+    url: str
+    attempt: int
+    elapsed: float
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    backoff: float = 0.0
+
+
+def describe_attempts(records: List[AttemptRecord]) -> str:
+    """One line per attempt, for the "Request Attempts" attachment."""
+    return "\n".join(
+        f"#{r.attempt} status={r.status_code} error={r.error} "
+        f"elapsed={r.elapsed:.3f}s backoff={r.backoff:.3f}s"
+        for r in records
+    )
+
+
+@dataclass
+class CircuitBreaker:
+    """Fails fast once an upstream has failed repeatedly.
+
+    After ``failure_threshold`` consecutive failed calls the circuit opens and
+    every call raises CircuitOpenError until ``reset_timeout`` seconds passed.
+    Then a single trial call is let through while concurrent callers keep
+    failing fast: success closes the circuit, failure opens it again.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    _registry: ClassVar[Dict[str, "CircuitBreaker"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def for_upstream(
+        cls, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> "CircuitBreaker":
+        """Return the process-wide breaker for an upstream (e.g. a base URL)."""
+        with cls._registry_lock:
+            if name not in cls._registry:
+                cls._registry[name] = cls(failure_threshold, reset_timeout)
+            return cls._registry[name]
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self, name: str = "upstream") -> None:
+        """Raise CircuitOpenError when calls should not reach the upstream.
+
+        In half-open state the first caller gets the trial call; it must
+        report back through ``record_success`` or ``record_failure``.
+        """
+        with self._lock:
+            state = self.state
+            if state == "open" or (state == "half_open" and self.probing):
+                raise CircuitOpenError(
+                    f"Circuit open for {name} after {self.failures} consecutive failures"
+                )
+            if state == "half_open":
+                self.probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if (
+                self.probing
+                or self.state == "half_open"
+                or self.failures >= self.failure_threshold
+            ):
+                self.opened_at = time.monotonic()
+            self.probing = False
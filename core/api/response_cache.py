@@ -0,0 +1,298 @@
+"""Opt-in response cache for BaseRequest.
+
+Successful GET responses are cached by method, URL and normalized query
+params. JSON bodies reporting ``"success": false`` (ipstack returns quota and
+key errors with HTTP 200) are not cached. Entries expire after a per-endpoint
+TTL, the in-memory store is capped by body size with LRU eviction, and an
+optional directory backend keeps entries across pytest runs as JSON files.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how the cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    stores: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+@dataclass
+class CachedResponse:
+    """Snapshot of the parts of a Response the framework reads."""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    url: str
+    encoding: Optional[str]
+    reason: Optional[str]
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, response: Any, ttl: float) -> "CachedResponse":
+        """Snapshot a ``requests`` or ``httpx`` response."""
+        return cls(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            url=str(response.url),
+            encoding=response.encoding,
+            reason=getattr(response, "reason", None)
+            or getattr(response, "reason_phrase", None),
+            expires_at=time.time() + ttl,
+        )
+
+    def to_response(self) -> Response:
+        response = Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = self.encoding
+        response.reason = self.reason
+        return response
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "content": base64.b64encode(self.content).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CachedResponse":
+        return cls(**{**data, "content": base64.b64decode(data["content"])})
+
+
+class DiskCacheBackend:
+    """Stores one JSON entry per cache key inside a directory."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with self._path(key).open(encoding="utf-8") as f:
+                return CachedResponse.from_json(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(entry.to_json(), f)
+        # Atomic rename so parallel workers never read a half written entry
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of GET responses."""
+
+    def __init__(
+        self,
+        default_ttl: float = 300.0,
+        ttl_overrides: Optional[Mapping[str, float]] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            default_ttl: Seconds an entry stays valid when no override matches
+            ttl_overrides: TTL per endpoint, keyed by a glob on the URL path (e.g. "/check*")
+            max_bytes: Memory cap on cached bodies; least recently used entries are evicted
+            directory: Directory for the on-disk backend; memory only when None
+        """
+        self.default_ttl = default_ttl
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self.max_bytes = max_bytes
+        self.disk = DiskCacheBackend(directory) if directory else None
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configs(cls) -> "ResponseCache":
+        """Build a cache from the API_CACHE_* settings of the active environment."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            default_ttl=configs.API_CACHE_TTL,
+            ttl_overrides=cls.parse_ttl_overrides(configs.API_CACHE_TTL_OVERRIDES),
+            max_bytes=configs.API_CACHE_MAX_MB * 1024 * 1024,
+            directory=configs.API_CACHE_DIR or None,
+        )
+
+    @staticmethod
+    def parse_ttl_overrides(value: str) -> Dict[str, float]:
+        """Parse ``"/check*=60,/bulk/*=0"`` into ``{pattern: ttl}``."""
+        overrides = {}
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            pattern, separator, ttl = item.rpartition("=")
+            if not separator or not pattern.strip():
+                raise ValueError(
+                    f"Invalid TTL override, expected PATTERN=SECONDS: {item!r}"
+                )
+            overrides[pattern.strip()] = float(ttl)
+        return overrides
+
+    @staticmethod
+    def is_error_payload(content: bytes) -> bool:
+        """Whether a JSON body reports ``"success": false``."""
+        if b'"success"' not in content:
+            return False
+        try:
+            payload = json.loads(content)
+        except ValueError:
+            return False
+        return isinstance(payload, dict) and payload.get("success") is False
+
+    @staticmethod
+    def make_key(
+        method: str, url: str, params: Optional[Mapping[str, Any]] = None
+    ) -> str:
+        """Build a stable key from method, URL and normalized query params."""
+        normalized: Tuple[Tuple[str, str], ...] = tuple(
+            sorted(
+                (str(name), str(value))
+                for name, value in (params or {}).items()
+                if value is not None
+            )
+        )
+        raw = repr((method.upper(), url, normalized)).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL of the first override matching the URL path."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttl_overrides.items():
+            if fnmatch(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Response]:
+        """Return a cached response, or None when missing or expired."""
+        entry = self.get_entry(method, url, params)
+        return entry.to_response() if entry is not None else None
+
+    def get_entry(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]] = None
+    ) -> Optional[CachedResponse]:
+        """Return the cached snapshot, for clients not built on ``requests``."""
+        key = self.make_key(method, url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expired:
+                self._remove(key)
+                entry = None
+            if entry is None and self.disk:
+                entry = self.disk.get(key)
+                if entry is not None and entry.expired:
+                    self.disk.delete(key)
+                    entry = None
+                if entry is not None:
+                    self.stats.disk_hits += 1
+                    self._store(key, entry)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        response: Any,
+    ) -> None:
+        """Cache a response under the TTL configured for its endpoint.
+
+        Bodies reporting ``"success": false`` are errors and are not cached.
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or self.is_error_payload(response.content):
+            return
+        key = self.make_key(method, url, params)
+        entry = CachedResponse.from_response(response, ttl)
+        with self._lock:
+            self._store(key, entry)
+            self.stats.stores += 1
+            if self.disk:
+                self.disk.set(key, entry)
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            if self.disk:
+                self.disk.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if len(entry.content) > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._size += len(entry.content)
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.content)
@@ -1,19 +1,304 @@
+import io
+import logging
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
 import psycopg2
-from typing import List, Dict
+from psycopg2 import sql
+from psycopg2.extensions import connection as Connection
+from psycopg2.extensions import cursor as Cursor
+from psycopg2.extras import execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+# Prepared statement names are interpolated into PREPARE/EXECUTE
+_STATEMENT_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+logger = logging.getLogger(__name__)
+
+
+def _end_transaction(conn: Connection, rollback: bool) -> None:
+    """Roll back if asked and restore autocommit before the pool gets ``conn``.
+
+    A connection the server already closed is left alone, and one that fails
+    to reset is closed, so the pool discards it. Such errors are logged, never
+    raised, so they cannot hide the exception that ended the transaction.
+    """
+    if conn.closed:
+        return
+    try:
+        if rollback:
+            conn.rollback()
+        conn.autocommit = True
+    except psycopg2.Error as error:
+        logger.warning("Closing a connection that failed to reset: %s", error)
+        conn.close()
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk operation."""
+
+    rows: int
+    seconds: float
+    chunks: int
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else float(self.rows)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.rows} rows in {self.chunks} chunks, {self.seconds:.3f}s "
+            f"({self.rows_per_sec:,.0f} rows/sec)"
+        )
+
+
+# Backslash first, so the escapes added after it are not escaped again
+_COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value for COPY text format, where only ``\\N`` is NULL."""
+    if value is None:
+        return "\\N"
+    text = str(value)
+    for raw, escaped in _COPY_ESCAPES:
+        text = text.replace(raw, escaped)
+    return text
+
+
+def _chunks(rows: Iterable[Sequence[Any]], size: int) -> Iterator[List[Sequence[Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class PooledConnection(Connection):
+    """Connection that remembers which statements were prepared on it."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Statement name -> query text it was prepared with
+        self.prepared: Dict[str, str] = {}
 
 
 class PostgresClient:
-    def __init__(self, host, port, user, password, db):
-        self.conn = psycopg2.connect(
-            host=host, port=port, user=user, password=password, dbname=db
+    """Thread-safe PostgreSQL client backed by a connection pool.
+
+    Pooled connections run in autocommit mode, so a single statement costs one
+    round trip and read-only queries never pay for a COMMIT. Use
+    ``transaction()`` to group several statements atomically.
+
+    Checkouts beyond ``max_connections`` wait up to ``checkout_timeout``
+    seconds for a connection to be returned instead of failing at once.
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        user,
+        password,
+        db,
+        min_connections: int = 1,
+        max_connections: int = 10,
+        checkout_timeout: float = 30.0,
+    ):
+        self.pool = ThreadedConnectionPool(
+            min_connections,
+            max_connections,
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            dbname=db,
+            connection_factory=PooledConnection,
         )
-        self.cursor = self.conn.cursor()
+        self._statements: Dict[str, str] = {}
+        # ThreadedConnectionPool raises PoolError when exhausted, so callers
+        # queue here for a free connection instead
+        self._available = threading.BoundedSemaphore(max_connections)
+        self.checkout_timeout = checkout_timeout
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Check a connection out of the pool and return it afterwards.
+
+        Raises:
+            PoolError: If no connection was returned within ``checkout_timeout``.
+        """
+        if not self._available.acquire(timeout=self.checkout_timeout):
+            raise PoolError(
+                f"No pooled connection available after {self.checkout_timeout}s"
+            )
+        try:
+            conn = self.pool.getconn()
+        except Exception:
+            self._available.release()
+            raise
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            self.pool.putconn(conn, close=bool(conn.closed))
+            self._available.release()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Cursor]:
+        """Yield a cursor whose statements are committed together.
+
+        The transaction is rolled back if the block raises; a connection
+        closed meanwhile (e.g. by the server) is dropped from the pool.
+        """
+        with self.connection() as conn:
+            conn.autocommit = False
+            rollback = True
+            try:
+                with conn.cursor() as cursor:
+                    yield cursor
+                conn.commit()
+                rollback = False
+            finally:
+                _end_transaction(conn, rollback)
+
+    def execute_query(self, query: str, params: Optional[Sequence[Any]] = None):
+        """Run one statement with bound parameters and return its rows.
+
+        Args:
+            query: SQL using ``%s`` placeholders.
+            params: Values bound to the placeholders.
+
+        Returns:
+            list: Fetched rows, or an empty list for statements without a result.
+        """
+        with self.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall() if cursor.description else []
+
+    def stream_query(
+        self, query: str, params: Optional[Sequence[Any]] = None, itersize: int = 2000
+    ) -> Iterator[tuple]:
+        """Yield rows lazily from a named server-side cursor.
+
+        Rows are fetched from the server ``itersize`` at a time, so memory stays
+        bounded however large the result is. The pooled connection is held
+        until the generator is exhausted or closed.
+        """
+        for chunk in self.stream_query_chunks(query, params, itersize):
+            yield from chunk
+
+    def stream_query_chunks(
+        self, query: str, params: Optional[Sequence[Any]] = None, chunk_size: int = 2000
+    ) -> Iterator[List[tuple]]:
+        """Yield lists of up to ``chunk_size`` rows from a named server-side cursor.
+
+        The cursor runs in a read-only transaction that is rolled back once the
+        generator is exhausted or closed.
+        """
+        with self.connection() as conn:
+            # Named cursors only live inside a transaction
+            conn.autocommit = False
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION READ ONLY")
+                with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = chunk_size
+                    cursor.execute(query, params)
+                    while rows := cursor.fetchmany(chunk_size):
+                        yield rows
+            finally:
+                _end_transaction(conn, rollback=True)
+
+    def prepare(self, name: str, query: str) -> None:
+        """Register a server-side prepared statement.
+
+        The statement is prepared lazily on each pooled connection the first
+        time it is executed there, and prepared again when ``query`` changed.
+
+        Args:
+            name: Statement name, used with ``execute_prepared``.
+            query: SQL using ``$1, $2, ...`` placeholders.
+
+        Raises:
+            ValueError: If ``name`` is not a plain SQL identifier.
+        """
+        if not _STATEMENT_NAME.fullmatch(name):
+            raise ValueError(f"Invalid prepared statement name: {name!r}")
+        self._statements[name] = query
+
+    def execute_prepared(self, name: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Execute a statement registered with ``prepare`` and return its rows."""
+        query = self._statements[name]
+        with self.connection() as conn, conn.cursor() as cursor:
+            prepared = conn.prepared.get(name)
+            if prepared != query:
+                if prepared is not None:
+                    cursor.execute(f"DEALLOCATE {name}")
+                    del conn.prepared[name]
+                cursor.execute(f"PREPARE {name} AS {query}")
+                conn.prepared[name] = query
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(
+                f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}",
+                params,
+            )
+            return cursor.fetchall() if cursor.description else []
+
+    def copy_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        chunk_size: int = 10000,
+    ) -> BulkResult:
+        """Load rows with COPY FROM STDIN, one text-format buffer per chunk.
+
+        None is loaded as NULL and empty strings stay empty strings. All chunks
+        are loaded in one transaction, so a failure leaves the table untouched.
+        """
+        started = time.perf_counter()
+        total = chunks = 0
+        with self.transaction() as cursor:
+            statement = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT text)").format(
+                sql.Identifier(table),
+                sql.SQL(", ").join(map(sql.Identifier, columns)),
+            )
+            for chunk in _chunks(rows, chunk_size):
+                buffer = io.StringIO(
+                    "".join("\t".join(map(_copy_value, row)) + "\n" for row in chunk)
+                )
+                cursor.copy_expert(statement.as_string(cursor), buffer)
+                total += len(chunk)
+                chunks += 1
+        return BulkResult(total, time.perf_counter() - started, chunks)
+
+    def execute_batch_values(
+        self,
+        query: str,
+        rows: Iterable[Sequence[Any]],
+        chunk_size: int = 1000,
+        template: Optional[str] = None,
+    ) -> BulkResult:
+        """Run a multi-row statement (``VALUES %s``) once per chunk of rows.
 
-    def execute_query(self, query: str):
-        self.cursor.execute(query)
-        self.conn.commit()
-        return self.cursor.fetchall()
+        All chunks run in one transaction.
+        """
+        started = time.perf_counter()
+        total = chunks = 0
+        with self.transaction() as cursor:
+            for chunk in _chunks(rows, chunk_size):
+                execute_values(
+                    cursor, query, chunk, template=template, page_size=len(chunk)
+                )
+                total += len(chunk)
+                chunks += 1
+        return BulkResult(total, time.perf_counter() - started, chunks)
 
     def close(self):
-        self.cursor.close()
-        self.conn.close()
+        self.pool.closeall()
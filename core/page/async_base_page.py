@@ -0,0 +1,313 @@
+"""Async base page class for common page operations.
+This is the ``playwright.async_api`` counterpart of BasePage. One event loop
+can drive many AsyncBasePage instances concurrently, e.g. one page per
+virtual user in a single browser.
+
+Allure steps are not used here: ``allure.step`` does not support coroutines
+and its step stack assumes one test thread, so concurrent pages would nest
+into each other's steps. Actions are recorded through ``step_log`` instead.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, Optional, Sequence, TypeVar
+
+from playwright.async_api import Locator, Page, expect
+from typing_extensions import Literal
+
+from core.page import step_log
+from core.page.element_queries import ELEMENTS_READY_JS, QUERY_ELEMENTS_JS, ElementState
+from core.page.step_timing import instrument, record_navigation_async
+
+T = TypeVar("T")
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """Run a coroutine to completion from synchronous code, e.g. a test.
+
+    The sync Playwright API leaves its own event loop registered as running on
+    the thread that used it, so ``asyncio.run`` would refuse to start there.
+    The coroutine gets a fresh loop on a separate thread instead.
+    """
+
+    async def main() -> Any:
+        return await awaitable
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-pages") as pool:
+        return pool.submit(asyncio.run, main()).result()
+
+
+class AsyncBasePage:
+    """Async base page with common functionality.
+    This class implements the Page Object Model pattern and contains methods
+    that are common across all pages in the application.
+    """
+
+    def __init__(self, page: Page):
+        """Initialize a new async base page.
+
+        Args:
+            page (Page): The async Playwright page object to interact with.
+        """
+        self.page = page
+        self._locators: Dict[str, Locator] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Time the public coroutines (page-object steps) of every page."""
+        super().__init_subclass__(**kwargs)
+        instrument(cls, kind="step")
+
+    def locator(self, selector: str) -> Locator:
+        """Return the Locator for a selector, created once per page object.
+
+        Args:
+            selector (str): The locator string to find the element.
+
+        Returns:
+            Locator: The cached Playwright locator.
+        """
+        try:
+            return self._locators[selector]
+        except KeyError:
+            locator = self._locators[selector] = self.page.locator(selector)
+            return locator
+
+    async def query_elements(
+        self, selectors: Sequence[str], attributes: Sequence[str] = ()
+    ) -> Dict[str, ElementState]:
+        """Read visibility, enabled state, text and attributes in one round trip.
+
+        Only plain CSS selectors are supported, see ``BasePage.query_elements``.
+
+        Args:
+            selectors (Sequence[str]): CSS selectors to inspect.
+            attributes (Sequence[str]): Attribute names to read from each element.
+
+        Returns:
+            Dict[str, ElementState]: The state of each selector's first match.
+        """
+        results = await self.page.evaluate(
+            QUERY_ELEMENTS_JS,
+            {"selectors": list(selectors), "attributes": list(attributes)},
+        )
+        states = {result["selector"]: ElementState(**result) for result in results}
+        step_log.log("Elements Queried", "{}", list(states.values()))
+        return states
+
+    async def query_element(
+        self, selector: str, attributes: Sequence[str] = ()
+    ) -> ElementState:
+        """Read the state of a single selector in one round trip.
+
+        Args:
+            selector (str): The CSS selector to inspect.
+            attributes (Sequence[str]): Attribute names to read from the element.
+
+        Returns:
+            ElementState: The state of the selector's first match.
+        """
+        return (await self.query_elements([selector], attributes))[selector]
+
+    async def wait_for_elements(
+        self,
+        selectors: Iterable[str] = (),
+        texts: Optional[Dict[str, str]] = None,
+        timeout: int = 5000,
+    ) -> None:
+        """Wait until all selectors are visible and all texts match.
+
+        Args:
+            selectors (Iterable[str]): CSS selectors that must be visible.
+            texts (Dict[str, str]): Expected text per CSS selector.
+            timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
+        """
+        selectors = list(selectors)
+        texts = texts or {}
+        await self.page.wait_for_function(
+            ELEMENTS_READY_JS,
+            arg={"selectors": selectors, "texts": texts},
+            timeout=timeout,
+        )
+        step_log.log(
+            "Elements Waited",
+            "Visible: {}, texts: {} within {}ms",
+            selectors,
+            texts,
+            timeout,
+        )
+
+    async def goto(self, url: str):
+        """Navigate to a specified URL.
+
+        Args:
+            url (str): The URL to navigate to.
+        """
+        await self.page.goto(url)
+        await record_navigation_async(self.page, url)
+
+    async def get_title(self) -> str:
+        """Get the current page title.
+
+        Returns:
+            str: The title of the current page.
+        """
+        title = await self.page.title()
+        step_log.log("Page Title", "{}", title)
+        return title
+
+    def get_current_url(self) -> str:
+        """Get the current page URL.
+
+        Returns:
+            str: The current URL of the page.
+        """
+        current_url = self.page.url
+        step_log.log("Current URL", "{}", current_url)
+        return current_url
+
+    async def fill_input(self, locator: str, text: str) -> None:
+        """Fill an input field with specified text.
+
+        Args:
+            locator (str): The locator string to find the input element.
+            text (str): The text to fill into the input field.
+        """
+        await self.locator(locator).fill(text)
+        step_log.log("Input Filled", "Filled input '{}' with text: {}", locator, text)
+
+    async def click_element(self, locator: str) -> None:
+        """Click on an element specified by the locator.
+
+        Args:
+            locator (str): The locator string to find the element to click.
+        """
+        await self.locator(locator).click()
+        step_log.log("Element Clicked", "Clicked on element '{}'", locator)
+
+    async def get_element_text(self, locator: str) -> str:
+        """Get the text content of an element.
+
+        Args:
+            locator (str): The locator string to find the element.
+
+        Returns:
+            str: The text content of the element.
+        """
+        text = await self.locator(locator).inner_text()
+        step_log.log(
+            "Element Text Retrieved", "Text of element '{}': {}", locator, text
+        )
+        return text
+
+    async def wait_for_element(self, locator: str, timeout: int = 5000) -> None:
+        """Wait for an element to be visible on the page.
+
+        Args:
+            locator (str): The locator string to find the element.
+            timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
+        """
+        await self.page.wait_for_selector(locator, state="visible", timeout=timeout)
+        step_log.log(
+            "Element Waited",
+            "Waited for element '{}' to be visible within {}ms",
+            locator,
+            timeout,
+        )
+
+    async def wait_for_load_state(
+        self,
+        state: Literal["load", "domcontentloaded", "networkidle"],
+        timeout: int = 5000,
+    ) -> None:
+        """Wait for the page to reach a specific load state.
+
+        Args:
+            state (str): The load state to wait for ('load', 'domcontentloaded', 'networkidle').
+            timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
+        """
+        await self.page.wait_for_load_state(state=state, timeout=timeout)
+        step_log.log(
+            "Load State Waited",
+            "Waited for page to reach load state '{}' within {}ms",
+            state,
+            timeout,
+        )
+
+    async def is_element_present(self, locator: str) -> bool:
+        """Check if an element is present in the DOM.
+
+        Args:
+            locator (str): The locator string to find the element.
+
+        Returns:
+            bool: True if the element is present, False otherwise.
+        """
+        step_log.log(
+            "Element Presence Check",
+            "Checking presence of element '{}' in the DOM",
+            locator,
+        )
+        return await self.locator(locator).count() > 0
+
+    async def is_element_visible(self, locator: str) -> bool:
+        """Check if an element is visible on the page.
+
+        Args:
+            locator (str): The locator string to find the element.
+
+        Returns:
+            bool: True if the element is visible, False otherwise.
+        """
+        step_log.log(
+            "Element Visibility Check", "Checking visibility of element '{}'", locator
+        )
+        return await self.locator(locator).is_visible()
+
+    async def is_element_interactable(self, locator: str) -> bool:
+        """Check if an element is interactable (visible and enabled) on the page.
+
+        Args:
+            locator (str): The locator string to find the element.
+
+        Returns:
+            bool: True if the element is interactable, False otherwise.
+        """
+        step_log.log(
+            "Element Interactivity Check",
+            "Checking interactivity of element '{}' on the page",
+            locator,
+        )
+        element = self.locator(locator)
+        return await element.is_visible() and await element.is_enabled()
+
+    async def expect_element_text(self, locator: str, expected_text: str) -> None:
+        """Assert that an element contains the expected text.
+
+        Args:
+            locator (str): The locator string to find the element.
+            expected_text (str): The expected text to compare against the element's content.
+        """
+        await expect(self.locator(locator)).to_have_text(expected_text)
+        step_log.log(
+            "Element Text Assertion",
+            "Element '{}' contains expected text: '{}'",
+            locator,
+            expected_text,
+        )
+
+    async def expect_element_visible(self, locator: str) -> None:
+        """Assert that an element is visible on the page.
+
+        Args:
+            locator (str): The locator string to find the element.
+        """
+        await expect(self.locator(locator)).to_be_visible()
+        step_log.log(
+            "Element Visibility Assertion",
+            "Element '{}' is visible on the page",
+            locator,
+        )
+
+
+# Every AsyncBasePage method wraps a Playwright call, time them as actions
+instrument(AsyncBasePage, kind="action", exclude={"locator"})
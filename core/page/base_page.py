@@ -3,10 +3,16 @@ This class serves as a foundation for all page objects in the test framework,
 providing common methods for interacting with web pages using Playwright.
 """
 
+from typing import Dict, Iterable, Optional, Sequence
+
 import allure
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 from typing_extensions import Literal
 
+from core.page import step_log
+from core.page.element_queries import ELEMENTS_READY_JS, QUERY_ELEMENTS_JS, ElementState
+from core.page.step_timing import instrument, record_navigation
+
 
 class BasePage:
     """Base page with common functionality.
@@ -21,6 +27,100 @@ class BasePage:
             page (Page): The Playwright page object to interact with.
         """
         self.page = page
+        self._locators: Dict[str, Locator] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Time the public methods (page-object steps) of every page."""
+        super().__init_subclass__(**kwargs)
+        instrument(cls, kind="step")
+
+    def locator(self, selector: str) -> Locator:
+        """Return the Locator for a selector, created once per page object.
+
+        Args:
+            selector (str): The locator string to find the element.
+
+        Returns:
+            Locator: The cached Playwright locator.
+        """
+        try:
+            return self._locators[selector]
+        except KeyError:
+            locator = self._locators[selector] = self.page.locator(selector)
+            return locator
+
+    def query_elements(
+        self, selectors: Sequence[str], attributes: Sequence[str] = ()
+    ) -> Dict[str, ElementState]:
+        """Read visibility, enabled state, text and attributes in one round trip.
+
+        The selectors run through ``document.querySelectorAll``, so only plain
+        CSS is supported: Playwright selectors (``text=``, ``xpath=``, ``>>``,
+        ``:has-text()``) fail here and need ``locator()`` instead. The state is
+        a snapshot, nothing is awaited or retried.
+
+        Args:
+            selectors (Sequence[str]): CSS selectors to inspect.
+            attributes (Sequence[str]): Attribute names to read from each element.
+
+        Returns:
+            Dict[str, ElementState]: The state of each selector's first match.
+        """
+        results = self.page.evaluate(
+            QUERY_ELEMENTS_JS,
+            {"selectors": list(selectors), "attributes": list(attributes)},
+        )
+        states = {result["selector"]: ElementState(**result) for result in results}
+        step_log.log("Elements Queried", "{}", list(states.values()))
+        return states
+
+    def query_element(
+        self, selector: str, attributes: Sequence[str] = ()
+    ) -> ElementState:
+        """Read the state of a single CSS selector in one round trip.
+
+        See ``query_elements`` for the selector restrictions.
+
+        Args:
+            selector (str): The CSS selector to inspect.
+            attributes (Sequence[str]): Attribute names to read from the element.
+
+        Returns:
+            ElementState: The state of the selector's first match.
+        """
+        return self.query_elements([selector], attributes)[selector]
+
+    def wait_for_elements(
+        self,
+        selectors: Iterable[str] = (),
+        texts: Optional[Dict[str, str]] = None,
+        timeout: int = 5000,
+    ) -> None:
+        """Wait until all selectors are visible and all texts match.
+
+        The condition is polled inside the browser, so verifying several
+        elements costs a single round trip. Selectors must be plain CSS, as
+        for ``query_elements``.
+
+        Args:
+            selectors (Iterable[str]): CSS selectors that must be visible.
+            texts (Dict[str, str]): Expected text per CSS selector.
+            timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
+        """
+        selectors = list(selectors)
+        texts = texts or {}
+        self.page.wait_for_function(
+            ELEMENTS_READY_JS,
+            arg={"selectors": selectors, "texts": texts},
+            timeout=timeout,
+        )
+        step_log.log(
+            "Elements Waited",
+            "Visible: {}, texts: {} within {}ms",
+            selectors,
+            texts,
+            timeout,
+        )
 
     def goto(self, url: str):
         """Navigate to a specified URL.
@@ -29,6 +129,7 @@ class BasePage:
             url (str): The URL to navigate to.
         """
         self.page.goto(url)
+        record_navigation(self.page, url)
 
     def get_title(self) -> str:
         """Get the current page title.
@@ -36,8 +137,9 @@ class BasePage:
         Returns:
             str: The title of the current page.
         """
-        allure.attach(name="Page Title", body=self.page.title())
-        return self.page.title()
+        title = self.page.title()
+        step_log.log("Page Title", "{}", title)
+        return title
 
     def is_element_text(self, locator: str, text: str) -> bool:
         """Check if an element contains specific text.
@@ -49,11 +151,10 @@ class BasePage:
         Returns:
             bool: True if the element's text matches, False otherwise.
         """
-        allure.attach(
-            name="Element Text Check",
-            body=f"Checking if element '{locator}' has text: {text}",
+        step_log.log(
+            "Element Text Check", "Checking if element '{}' has text: {}", locator, text
         )
-        return self.page.locator(locator).inner_text() == text
+        return self.locator(locator).inner_text() == text
 
     def is_element_visible(self, locator: str) -> bool:
         """Check if an element is visible on the page.
@@ -64,11 +165,10 @@ class BasePage:
         Returns:
             bool: True if the element is visible, False otherwise.
         """
-        allure.attach(
-            name="Element Visibility Check",
-            body=f"Checking visibility of element '{locator}'",
+        step_log.log(
+            "Element Visibility Check", "Checking visibility of element '{}'", locator
         )
-        return self.page.locator(locator).is_visible()
+        return self.locator(locator).is_visible()
 
     def take_screenshot(self, name: str = "screenshot") -> None:
         """Take a screenshot of the current page state.
@@ -90,10 +190,7 @@ class BasePage:
             text (str): The text to fill into the input field.
         """
         self.page.fill(locator, text)
-        allure.attach(
-            name="Input Filled",
-            body=f"Filled input '{locator}' with text: {text}",
-        )
+        step_log.log("Input Filled", "Filled input '{}' with text: {}", locator, text)
 
     def click_element(self, locator: str) -> None:
         """Click on an element specified by the locator.
@@ -102,10 +199,7 @@ class BasePage:
             locator (str): The locator string to find the element to click.
         """
         self.page.click(locator)
-        allure.attach(
-            name="Element Clicked",
-            body=f"Clicked on element '{locator}'",
-        )
+        step_log.log("Element Clicked", "Clicked on element '{}'", locator)
 
     def get_element_text(self, locator: str) -> str:
         """Get the text content of an element.
@@ -116,10 +210,9 @@ class BasePage:
         Returns:
             str: The text content of the element.
         """
-        text = self.page.locator(locator).inner_text()
-        allure.attach(
-            name="Element Text Retrieved",
-            body=f"Text of element '{locator}': {text}",
+        text = self.locator(locator).inner_text()
+        step_log.log(
+            "Element Text Retrieved", "Text of element '{}': {}", locator, text
         )
         return text
 
@@ -131,29 +224,27 @@ class BasePage:
             timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
         """
         self.page.wait_for_selector(locator, state="visible", timeout=timeout)
-        allure.attach(
-            name="Element Waited",
-            body=f"Waited for element '{locator}' to be visible within {timeout}ms",
+        step_log.log(
+            "Element Waited",
+            "Waited for element '{}' to be visible within {}ms",
+            locator,
+            timeout,
         )
 
     def refresh_page(self) -> None:
         """Refresh the current page."""
         self.page.reload()
-        allure.attach(name="Page Refreshed", body="The page has been refreshed.")
+        step_log.log("Page Refreshed", "The page has been refreshed.")
 
     def go_back(self) -> None:
         """Navigate back to the previous page."""
         self.page.go_back()
-        allure.attach(
-            name="Navigated Back", body="Navigated back to the previous page."
-        )
+        step_log.log("Navigated Back", "Navigated back to the previous page.")
 
     def go_forward(self) -> None:
         """Navigate forward to the next page."""
         self.page.go_forward()
-        allure.attach(
-            name="Navigated Forward", body="Navigated forward to the next page."
-        )
+        step_log.log("Navigated Forward", "Navigated forward to the next page.")
 
     def get_current_url(self) -> str:
         """Get the current page URL.
@@ -162,7 +253,7 @@ class BasePage:
             str: The current URL of the page.
         """
         current_url = self.page.url
-        allure.attach(name="Current URL", body=current_url)
+        step_log.log("Current URL", "{}", current_url)
         return current_url
 
     def clear_input(self, locator: str) -> None:
@@ -172,10 +263,7 @@ class BasePage:
             locator (str): The locator string to find the input element.
         """
         self.page.fill(locator, "")
-        allure.attach(
-            name="Input Cleared",
-            body=f"Cleared input field '{locator}'",
-        )
+        step_log.log("Input Cleared", "Cleared input field '{}'", locator)
 
     def hover_over_element(self, locator: str) -> None:
         """Hover over an element specified by the locator.
@@ -184,10 +272,7 @@ class BasePage:
             locator (str): The locator string to find the element to hover over.
         """
         self.page.hover(locator)
-        allure.attach(
-            name="Element Hovered",
-            body=f"Hovered over element '{locator}'",
-        )
+        step_log.log("Element Hovered", "Hovered over element '{}'", locator)
 
     def scroll_to_element(self, locator: str) -> None:
         """Scroll to an element specified by the locator.
@@ -195,11 +280,8 @@ class BasePage:
         Args:
             locator (str): The locator string to find the element to scroll to.
         """
-        self.page.locator(locator).scroll_into_view_if_needed()
-        allure.attach(
-            name="Scrolled to Element",
-            body=f"Scrolled to element '{locator}'",
-        )
+        self.locator(locator).scroll_into_view_if_needed()
+        step_log.log("Scrolled to Element", "Scrolled to element '{}'", locator)
 
     def select_option(self, locator: str, value: str) -> None:
         """Select an option from a dropdown or select element.
@@ -209,9 +291,8 @@ class BasePage:
             value (str): The value of the option to select.
         """
         self.page.select_option(locator, value)
-        allure.attach(
-            name="Option Selected",
-            body=f"Selected option '{value}' from element '{locator}'",
+        step_log.log(
+            "Option Selected", "Selected option '{}' from element '{}'", value, locator
         )
 
     def get_element_count(self, locator: str) -> int:
@@ -223,17 +304,16 @@ class BasePage:
         Returns:
             int: The count of matching elements.
         """
-        count = self.page.locator(locator).count()
-        allure.attach(
-            name="Element Count",
-            body=f"Count of elements matching '{locator}': {count}",
+        count = self.locator(locator).count()
+        step_log.log(
+            "Element Count", "Count of elements matching '{}': {}", locator, count
         )
         return count
 
     def clear_cookies(self) -> None:
         """Clear all cookies for the current page."""
         self.page.context.clear_cookies()
-        allure.attach(name="Cookies Cleared", body="All cookies have been cleared.")
+        step_log.log("Cookies Cleared", "All cookies have been cleared.")
 
     def set_cookie(self, name: str, value: str) -> None:
         """Set a cookie for the current page.
@@ -245,9 +325,7 @@ class BasePage:
         self.page.context.add_cookies(
             [{"name": name, "value": value, "url": self.page.url}]
         )
-        allure.attach(
-            name="Cookie Set", body=f"Set cookie '{name}' with value '{value}'."
-        )
+        step_log.log("Cookie Set", "Set cookie '{}' with value '{}'.", name, value)
 
     def get_cookies(self) -> list:
         """Get all cookies for the current page.
@@ -256,7 +334,7 @@ class BasePage:
             list: A list of cookies.
         """
         cookies = self.page.context.cookies()
-        allure.attach(name="Cookies Retrieved", body=str(cookies))
+        step_log.log("Cookies Retrieved", "{}", cookies)
         return cookies
 
     def wait_for_timeout(self, timeout: int) -> None:
@@ -266,7 +344,7 @@ class BasePage:
             timeout (int): Time to wait in milliseconds.
         """
         self.page.wait_for_timeout(timeout)
-        allure.attach(name="Waited", body=f"Waited for {timeout} milliseconds.")
+        step_log.log("Waited", "Waited for {} milliseconds.", timeout)
 
     def clear_and_fill_input(self, locator: str, text: str) -> None:
         """Clear an input field and fill it with specified text.
@@ -277,9 +355,11 @@ class BasePage:
         """
         self.page.fill(locator, "")
         self.page.fill(locator, text)
-        allure.attach(
-            name="Input Cleared and Filled",
-            body=f"Cleared and filled input '{locator}' with text: {text}",
+        step_log.log(
+            "Input Cleared and Filled",
+            "Cleared and filled input '{}' with text: {}",
+            locator,
+            text,
         )
 
     def double_click_element(self, locator: str) -> None:
@@ -289,9 +369,8 @@ class BasePage:
             locator (str): The locator string to find the element to double click.
         """
         self.page.dblclick(locator)
-        allure.attach(
-            name="Element Double Clicked",
-            body=f"Double clicked on element '{locator}'",
+        step_log.log(
+            "Element Double Clicked", "Double clicked on element '{}'", locator
         )
 
     def right_click_element(self, locator: str) -> None:
@@ -301,10 +380,7 @@ class BasePage:
             locator (str): The locator string to find the element to right click.
         """
         self.page.click(locator, button="right")
-        allure.attach(
-            name="Element Right Clicked",
-            body=f"Right clicked on element '{locator}'",
-        )
+        step_log.log("Element Right Clicked", "Right clicked on element '{}'", locator)
 
     def type_text(self, locator: str, text: str, delay: int = 0) -> None:
         """Type text into an input field with an optional delay between keystrokes.
@@ -315,9 +391,12 @@ class BasePage:
             delay (int): Delay in milliseconds between each keystroke. Default is 0.
         """
         self.page.type(locator, text, delay=delay)
-        allure.attach(
-            name="Text Typed",
-            body=f"Typed text '{text}' into input '{locator}' with delay {delay}ms",
+        step_log.log(
+            "Text Typed",
+            "Typed text '{}' into input '{}' with delay {}ms",
+            text,
+            locator,
+            delay,
         )
 
     def press_key(self, locator: str, key: str) -> None:
@@ -328,10 +407,7 @@ class BasePage:
             key (str): The key to press (e.g., 'Enter', 'Tab').
         """
         self.page.press(locator, key)
-        allure.attach(
-            name="Key Pressed",
-            body=f"Pressed key '{key}' on element '{locator}'",
-        )
+        step_log.log("Key Pressed", "Pressed key '{}' on element '{}'", key, locator)
 
     def clear_and_type(self, locator: str, text: str, delay: int = 0) -> None:
         """Clear an input field and type text into it with an optional delay.
@@ -343,9 +419,12 @@ class BasePage:
         """
         self.page.fill(locator, "")
         self.page.type(locator, text, delay=delay)
-        allure.attach(
-            name="Input Cleared and Typed",
-            body=f"Cleared and typed text '{text}' into input '{locator}' with delay {delay}ms",
+        step_log.log(
+            "Input Cleared and Typed",
+            "Cleared and typed text '{}' into input '{}' with delay {}ms",
+            text,
+            locator,
+            delay,
         )
 
     def wait_for_element_hidden(self, locator: str, timeout: int = 5000) -> None:
@@ -356,9 +435,11 @@ class BasePage:
             timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
         """
         self.page.wait_for_selector(locator, state="hidden", timeout=timeout)
-        allure.attach(
-            name="Element Hidden Waited",
-            body=f"Waited for element '{locator}' to be hidden within {timeout}ms",
+        step_log.log(
+            "Element Hidden Waited",
+            "Waited for element '{}' to be hidden within {}ms",
+            locator,
+            timeout,
         )
 
     def is_element_enabled(self, locator: str) -> bool:
@@ -370,11 +451,10 @@ class BasePage:
         Returns:
             bool: True if the element is enabled, False otherwise.
         """
-        allure.attach(
-            name="Element Enabled Check",
-            body=f"Checked if element '{locator}' is enabled",
+        step_log.log(
+            "Element Enabled Check", "Checked if element '{}' is enabled", locator
         )
-        return self.page.locator(locator).is_enabled()
+        return self.locator(locator).is_enabled()
 
     def is_element_disabled(self, locator: str) -> bool:
         """Check if an element is disabled on the page.
@@ -385,11 +465,10 @@ class BasePage:
         Returns:
             bool: True if the element is disabled, False otherwise.
         """
-        allure.attach(
-            name="Element Disabled Check",
-            body=f"Checked if element '{locator}' is disabled",
+        step_log.log(
+            "Element Disabled Check", "Checked if element '{}' is disabled", locator
         )
-        return self.page.locator(locator).is_disabled()
+        return self.locator(locator).is_disabled()
 
     def get_element_attribute(self, locator: str, attribute: str) -> str:
         """Get the value of a specific attribute from an element.
@@ -401,11 +480,13 @@ class BasePage:
         Returns:
             str: The value of the attribute, or an empty string if not found.
         """
-        allure.attach(
-            name="Element Attribute Retrieved",
-            body=f"Retrieved attribute '{attribute}' from element '{locator}'",
+        step_log.log(
+            "Element Attribute Retrieved",
+            "Retrieved attribute '{}' from element '{}'",
+            attribute,
+            locator,
         )
-        return self.page.locator(locator).get_attribute(attribute) or ""
+        return self.locator(locator).get_attribute(attribute) or ""
 
     def get_element_value(self, locator: str) -> str:
         """Get the value of an input element.
@@ -416,10 +497,9 @@ class BasePage:
         Returns:
             str: The value of the input element.
         """
-        value = self.page.locator(locator).input_value()
-        allure.attach(
-            name="Element Value Retrieved",
-            body=f"Value of input element '{locator}': {value}",
+        value = self.locator(locator).input_value()
+        step_log.log(
+            "Element Value Retrieved", "Value of input element '{}': {}", locator, value
         )
         return value
 
@@ -427,9 +507,9 @@ class BasePage:
         """Clear all cookies and local storage for the current page."""
         self.page.context.clear_cookies()
         self.page.evaluate("() => localStorage.clear()")
-        allure.attach(
-            name="Cookies and Local Storage Cleared",
-            body="All cookies and local storage have been cleared.",
+        step_log.log(
+            "Cookies and Local Storage Cleared",
+            "All cookies and local storage have been cleared.",
         )
 
     def execute_script(self, script: str, *args) -> bool:
@@ -443,16 +523,19 @@ class BasePage:
             any: The result of the script execution.
         """
         result = self.page.evaluate(script, *args)
-        allure.attach(
-            name="Script Executed",
-            body=f"Executed script: {script} with args: {args}. Result: {result}",
+        step_log.log(
+            "Script Executed",
+            "Executed script: {} with args: {}. Result: {}",
+            script,
+            args,
+            result,
         )
         return result
 
     def reload_page(self) -> None:
         """Reload the current page."""
         self.page.reload()
-        allure.attach(name="Page Reloaded", body="The page has been reloaded.")
+        step_log.log("Page Reloaded", "The page has been reloaded.")
 
     def wait_for_load_state(
         self,
@@ -466,9 +549,11 @@ class BasePage:
             timeout (int): Maximum wait time in milliseconds. Default is 5000ms.
         """
         self.page.wait_for_load_state(state=state, timeout=timeout)
-        allure.attach(
-            name="Load State Waited",
-            body=f"Waited for page to reach load state '{state}' within {timeout}ms",
+        step_log.log(
+            "Load State Waited",
+            "Waited for page to reach load state '{}' within {}ms",
+            state,
+            timeout,
         )
 
     def take_full_page_screenshot(self, name: str = "full_page_screenshot") -> None:
@@ -482,9 +567,10 @@ class BasePage:
         allure.attach.file(
             screenshot_path, name=name, attachment_type=allure.attachment_type.PNG
         )
-        allure.attach(
-            name="Full Page Screenshot Taken",
-            body=f"Full page screenshot saved as '{screenshot_path}'",
+        step_log.log(
+            "Full Page Screenshot Taken",
+            "Full page screenshot saved as '{}'",
+            screenshot_path,
         )
 
     def get_element_css_value(self, locator: str, property_name: str) -> str:
@@ -497,12 +583,16 @@ class BasePage:
         Returns:
             str: The value of the CSS property.
         """
-        value = self.page.locator(locator).evaluate(
-            f"getComputedStyle(document.querySelector('{locator}')).getPropertyValue('{property_name}')"
+        value = self.locator(locator).evaluate(
+            "(element, name) => getComputedStyle(element).getPropertyValue(name)",
+            property_name,
         )
-        allure.attach(
-            name="Element CSS Value Retrieved",
-            body=f"Value of CSS property '{property_name}' for element '{locator}': {value}",
+        step_log.log(
+            "Element CSS Value Retrieved",
+            "Value of CSS property '{}' for element '{}': {}",
+            property_name,
+            locator,
+            value,
         )
         return value
 
@@ -515,10 +605,12 @@ class BasePage:
         Returns:
             bool: True if the element is checked, False otherwise.
         """
-        is_checked = self.page.locator(locator).evaluate("element => element.checked")
-        allure.attach(
-            name="Element Checked State Retrieved",
-            body=f"Element '{locator}' checked state: {is_checked}",
+        is_checked = self.locator(locator).evaluate("element => element.checked")
+        step_log.log(
+            "Element Checked State Retrieved",
+            "Element '{}' checked state: {}",
+            locator,
+            is_checked,
         )
         return is_checked
 
@@ -529,10 +621,7 @@ class BasePage:
             locator (str): The locator string to find the checkbox or radio button element.
         """
         self.page.check(locator)
-        allure.attach(
-            name="Element Checked",
-            body=f"Checked element '{locator}'",
-        )
+        step_log.log("Element Checked", "Checked element '{}'", locator)
 
     def uncheck_element(self, locator: str) -> None:
         """Uncheck a checkbox element.
@@ -541,10 +630,7 @@ class BasePage:
             locator (str): The locator string to find the checkbox element.
         """
         self.page.uncheck(locator)
-        allure.attach(
-            name="Element Unchecked",
-            body=f"Unchecked element '{locator}'",
-        )
+        step_log.log("Element Unchecked", "Unchecked element '{}'", locator)
 
     def drag_and_drop(self, source_locator: str, target_locator: str) -> None:
         """Drag an element from source to target.
@@ -554,9 +640,11 @@ class BasePage:
             target_locator (str): The locator string to find the target element.
         """
         self.page.drag_and_drop(source_locator, target_locator)
-        allure.attach(
-            name="Element Dragged and Dropped",
-            body=f"Dragged element '{source_locator}' and dropped on '{target_locator}'",
+        step_log.log(
+            "Element Dragged and Dropped",
+            "Dragged element '{}' and dropped on '{}'",
+            source_locator,
+            target_locator,
         )
 
     def expect_element_text(self, locator: str, expected_text: str) -> None:
@@ -566,10 +654,12 @@ class BasePage:
             locator (str): The locator string to find the element.
             expected_text (str): The expected text to compare against the element's content.
         """
-        expect(self.page.locator(locator)).to_have_text(expected_text)
-        allure.attach(
-            name="Element Text Assertion",
-            body=f"Element '{locator}' contains expected text: '{expected_text}'",
+        expect(self.locator(locator)).to_have_text(expected_text)
+        step_log.log(
+            "Element Text Assertion",
+            "Element '{}' contains expected text: '{}'",
+            locator,
+            expected_text,
         )
 
     def expect_element_visible(self, locator: str) -> None:
@@ -578,10 +668,11 @@ class BasePage:
         Args:
             locator (str): The locator string to find the element.
         """
-        expect(self.page.locator(locator)).to_be_visible()
-        allure.attach(
-            name="Element Visibility Assertion",
-            body=f"Element '{locator}' is visible on the page",
+        expect(self.locator(locator)).to_be_visible()
+        step_log.log(
+            "Element Visibility Assertion",
+            "Element '{}' is visible on the page",
+            locator,
         )
 
     def expect_element_hidden(self, locator: str) -> None:
@@ -590,10 +681,9 @@ class BasePage:
         Args:
             locator (str): The locator string to find the element.
         """
-        expect(self.page.locator(locator)).to_be_hidden()
-        allure.attach(
-            name="Element Hidden Assertion",
-            body=f"Element '{locator}' is hidden on the page",
+        expect(self.locator(locator)).to_be_hidden()
+        step_log.log(
+            "Element Hidden Assertion", "Element '{}' is hidden on the page", locator
         )
 
     def expect_element_enabled(self, locator: str) -> None:
@@ -602,10 +692,9 @@ class BasePage:
         Args:
             locator (str): The locator string to find the element.
         """
-        expect(self.page.locator(locator)).to_be_enabled()
-        allure.attach(
-            name="Element Enabled Assertion",
-            body=f"Element '{locator}' is enabled on the page",
+        expect(self.locator(locator)).to_be_enabled()
+        step_log.log(
+            "Element Enabled Assertion", "Element '{}' is enabled on the page", locator
         )
 
     def expect_element_disabled(self, locator: str) -> None:
@@ -614,10 +703,11 @@ class BasePage:
         Args:
             locator (str): The locator string to find the element.
         """
-        expect(self.page.locator(locator)).to_be_disabled()
-        allure.attach(
-            name="Element Disabled Assertion",
-            body=f"Element '{locator}' is disabled on the page",
+        expect(self.locator(locator)).to_be_disabled()
+        step_log.log(
+            "Element Disabled Assertion",
+            "Element '{}' is disabled on the page",
+            locator,
         )
 
     def is_element_present(self, locator: str) -> bool:
@@ -629,11 +719,12 @@ class BasePage:
         Returns:
             bool: True if the element is present, False otherwise.
         """
-        allure.attach(
-            name="Element Presence Check",
-            body=f"Checking presence of element '{locator}' in the DOM",
+        step_log.log(
+            "Element Presence Check",
+            "Checking presence of element '{}' in the DOM",
+            locator,
         )
-        return self.page.locator(locator).count() > 0
+        return self.locator(locator).count() > 0
 
     def is_element_interactable(self, locator: str) -> bool:
         """Check if an element is interactable (visible and enabled) on the page.
@@ -644,12 +735,14 @@ class BasePage:
         Returns:
             bool: True if the element is interactable, False otherwise.
         """
-        allure.attach(
-            name="Element Interactivity Check",
-            body=f"Checking interactivity of element '{locator}' on the page",
-        )
-        return (
-            self.page.locator(locator).count() > 0
-            and self.page.locator(locator).is_visible()
-            and self.page.locator(locator).is_enabled()
+        step_log.log(
+            "Element Interactivity Check",
+            "Checking interactivity of element '{}' on the page",
+            locator,
         )
+        element = self.locator(locator)
+        return element.is_visible() and element.is_enabled()
+
+
+# Every BasePage method wraps a Playwright call, time them as actions
+instrument(BasePage, kind="action", exclude={"locator"})
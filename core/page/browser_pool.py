@@ -0,0 +1,90 @@
+"""Worker-scoped browser pool.
+
+Each pytest(-xdist) worker launches its browser once; tests get fresh,
+isolated contexts from it through pytest-playwright's ``new_context``
+fixture, which reports their creation time here. Launch and context creation
+times are recorded so the setup cost of a UI run can be tracked.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.sync_api import Browser
+
+
+@dataclass
+class SetupTimings:
+    """Setup cost of one worker."""
+
+    worker: str
+    launch_seconds: float = 0.0
+    context_seconds: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        contexts = self.context_seconds
+        return {
+            **asdict(self),
+            "contexts": len(contexts),
+            "context_seconds_total": round(sum(contexts), 4),
+            "context_seconds_avg": (
+                round(sum(contexts) / len(contexts), 4) if contexts else 0.0
+            ),
+        }
+
+
+class BrowserPool:
+    """Launches one browser per worker and keeps its setup timings.
+
+    ``launch`` starts or connects to the browser, e.g. pytest-playwright's
+    ``launch_browser`` fixture, which applies the launch and connect options.
+    """
+
+    def __init__(self, launch: Callable[[], Browser], worker: Optional[str] = None):
+        self.launch = launch
+        self.timings = SetupTimings(
+            worker=worker or os.getenv("PYTEST_XDIST_WORKER", "main")
+        )
+        self._browser: Optional[Browser] = None
+
+    @property
+    def browser(self) -> Browser:
+        """The worker's browser, launched on first use."""
+        if self._browser is None or not self._browser.is_connected():
+            started = time.perf_counter()
+            self._browser = self.launch()
+            self.timings.launch_seconds += time.perf_counter() - started
+        return self._browser
+
+    def record_context(self, seconds: float) -> None:
+        self.timings.context_seconds.append(seconds)
+
+    def write_timings(self, directory: str) -> Path:
+        """Write this worker's setup timings as JSON and return the file path."""
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        file_path = path / f"{self.timings.worker}.json"
+        file_path.write_text(json.dumps(self.timings.as_dict(), indent=4))
+        return file_path
+
+    def close(self) -> None:
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+def available_workers(requested: int = 0) -> int:
+    """Return the number of UI workers to start.
+
+    Args:
+        requested: Explicit worker count; 0 scales to the CPUs this process may use.
+    """
+    if requested > 0:
+        return requested
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
@@ -0,0 +1,69 @@
+"""In-page element queries shared by the sync and async base pages.
+
+Both scripts take plain CSS selectors, evaluated with ``querySelector(All)``
+in the page, so several elements are inspected in one round trip.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# Reads the state of several CSS selectors in a single evaluate call
+QUERY_ELEMENTS_JS = """
+({ selectors, attributes }) => selectors.map((selector) => {
+    const elements = document.querySelectorAll(selector);
+    const element = elements[0];
+    if (!element) {
+        return { selector, count: 0, visible: false, enabled: false, text: null, attributes: {} };
+    }
+    const style = getComputedStyle(element);
+    const rect = element.getBoundingClientRect();
+    return {
+        selector,
+        count: elements.length,
+        visible: style.visibility !== "hidden" && rect.width > 0 && rect.height > 0,
+        enabled: !element.matches(":disabled"),
+        text: element.innerText,
+        attributes: Object.fromEntries(
+            attributes.map((name) => [name, element.getAttribute(name)])
+        ),
+    };
+})
+"""
+
+# Resolves once every selector is visible and every expected text matches
+ELEMENTS_READY_JS = """
+({ selectors, texts }) => {
+    const visible = (selector) => {
+        const element = document.querySelector(selector);
+        if (!element) return false;
+        const rect = element.getBoundingClientRect();
+        return getComputedStyle(element).visibility !== "hidden"
+            && rect.width > 0 && rect.height > 0;
+    };
+    const hasText = ([selector, text]) => {
+        const element = document.querySelector(selector);
+        return !!element && element.innerText.trim() === text;
+    };
+    return selectors.every(visible) && Object.entries(texts).every(hasText);
+}
+"""
+
+
+@dataclass
+class ElementState:
+    """State of the first element matching a selector."""
+
+    selector: str
+    count: int = 0
+    visible: bool = False
+    enabled: bool = False
+    text: Optional[str] = None
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @property
+    def present(self) -> bool:
+        return self.count > 0
+
+    @property
+    def interactable(self) -> bool:
+        return self.present and self.visible and self.enabled
@@ -0,0 +1,198 @@
+"""Failure artifacts captured without blocking the test thread on disk I/O.
+
+On failure the pages of a test are captured in memory: a screenshot (JPEG or
+PNG, viewport or full page), or a cheaper DOM snapshot. The bytes are handed
+to an ArtifactWriter, whose background thread writes them to disk; identical
+frames are written once. The written files are attached to Allure when the
+test is torn down, instead of attaching a second in-memory copy.
+Playwright traces are handled by ``core.page.trace_capture``.
+"""
+
+import hashlib
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import allure
+from playwright.sync_api import BrowserContext
+
+# Capture modes
+CAPTURE_SCREENSHOT = "screenshot"
+CAPTURE_DOM = "dom"
+CAPTURE_OFF = "off"
+
+_ATTACHMENT_TYPES = {
+    "png": allure.attachment_type.PNG,
+    "jpeg": allure.attachment_type.JPG,
+    "html": allure.attachment_type.HTML,
+}
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactWriter:
+    """Writes artifacts from a queue on a background thread, deduplicated by hash.
+
+    A failed write is logged and the artifact skipped, the thread keeps going.
+    """
+
+    def __init__(self, directory: str, max_queue: int = 64):
+        """Initialize the writer.
+
+        Args:
+            directory (str): Where artifacts are written.
+            max_queue (int): Pending artifacts before ``submit`` blocks.
+        """
+        self.directory = Path(directory)
+        self._queue: "queue.Queue[Optional[Tuple[Path, bytes]]]" = queue.Queue(
+            max_queue
+        )
+        self._paths: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._write_artifacts, name="artifact-writer", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, name: str, data: bytes, extension: str) -> Path:
+        """Queue ``data`` for writing and return the path it will have.
+
+        A frame identical to one already submitted is not written again, its
+        existing path is returned instead.
+        """
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            path = self._paths.get(digest)
+            if path is not None:
+                return path
+            path = self._paths[digest] = (
+                self.directory / f"{name}_{digest[:12]}.{extension}"
+            )
+        self._queue.put((path, data))
+        return path
+
+    def _write_artifacts(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(data)
+                except OSError as error:
+                    logger.warning("Could not write artifact %s: %s", path, error)
+                    # Let an identical frame submitted later try again
+                    with self._lock:
+                        self._paths = {
+                            digest: known
+                            for digest, known in self._paths.items()
+                            if known != path
+                        }
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued artifact is on disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._worker.join()
+
+
+class FailureCapture:
+    """Captures the contexts of one test when it fails.
+
+    ``capture`` queues the frames, ``attach`` adds the written files to the
+    report once the writer has drained.
+    """
+
+    def __init__(
+        self,
+        writer: ArtifactWriter,
+        mode: str = CAPTURE_SCREENSHOT,
+        image_type: str = "jpeg",
+        quality: int = 70,
+        full_page: bool = False,
+    ):
+        """Initialize the capture.
+
+        Args:
+            writer (ArtifactWriter): Writes the captured bytes to disk.
+            mode (str): "screenshot", "dom" (HTML snapshot) or "off".
+            image_type (str): Screenshot encoding, "jpeg" or "png".
+            quality (int): JPEG quality, 0-100.
+            full_page (bool): Capture the full page instead of the viewport.
+        """
+        if mode not in (CAPTURE_SCREENSHOT, CAPTURE_DOM, CAPTURE_OFF):
+            raise ValueError(f"Unknown failure capture mode: {mode}")
+        self.writer = writer
+        self.mode = mode
+        self.image_type = image_type
+        self.quality = quality
+        self.full_page = full_page
+        self.contexts: List[BrowserContext] = []
+        # Written paths still to attach, mapped to their attachment name
+        self.pending: Dict[Path, str] = {}
+
+    def watch(self, context: BrowserContext) -> None:
+        """Register a context of the test."""
+        self.contexts.append(context)
+
+    def capture(self, name: str) -> List[Path]:
+        """Capture every open page and queue the frames for writing.
+
+        A page that cannot be captured (e.g. it crashed) is logged and skipped.
+        Identical frames share one path and are attached once.
+
+        Returns:
+            list: The paths the distinct frames are written to.
+        """
+        if self.mode == CAPTURE_OFF:
+            return []
+        pages = [page for context in self.contexts for page in context.pages]
+        for index, page in enumerate(pages):
+            if page.is_closed():
+                continue
+            try:
+                data, extension = self._capture_page(page)
+            except Exception as error:
+                logger.warning(
+                    "Could not capture page %s of %s: %s", index, name, error
+                )
+                continue
+            label = f"{name}_{index}" if index else name
+            path = self.writer.submit(label, data, extension)
+            self.pending.setdefault(path, f"Failure {self.mode} {label}")
+        return list(self.pending)
+
+    def attach(self) -> None:
+        """Wait for the writer and attach every captured file to the report.
+
+        A file the writer could not write is logged and left out.
+        """
+        if not self.pending:
+            return
+        self.writer.flush()
+        for path, name in self.pending.items():
+            if not path.exists():
+                logger.warning("Failure capture %s was not written", path)
+                continue
+            allure.attach.file(
+                str(path),
+                name=name,
+                attachment_type=_ATTACHMENT_TYPES[path.suffix[1:]],
+            )
+        self.pending.clear()
+
+    def _capture_page(self, page) -> Tuple[bytes, str]:
+        if self.mode == CAPTURE_DOM:
+            return page.content().encode("utf-8"), "html"
+        options = {"type": self.image_type, "full_page": self.full_page}
+        if self.image_type == "jpeg":
+            options["quality"] = self.quality
+        return page.screenshot(**options), self.image_type
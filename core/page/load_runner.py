@@ -0,0 +1,252 @@
+"""Load generator replaying async page-object flows with virtual users.
+
+N virtual users run in a single browser, each in its own context so they do
+not share cookies or storage. Users start spread over the ramp-up period and
+repeat their flow until the duration elapses. Each named step of the flow is
+timed, and the run is summarised as per-step latency percentiles, successful
+and failed iterations, and the throughput of successful ones.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, async_playwright
+
+from pages.pages.async_page_factory import AsyncPages
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list, 0.0 when empty."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+@dataclass
+class LoadProfile:
+    """Shape of a load run."""
+
+    users: int = 10
+    ramp_up: float = 5.0
+    duration: float = 30.0
+    think_time: float = 0.0
+
+    def __post_init__(self):
+        if self.users < 1:
+            raise ValueError("A load profile needs at least one user")
+
+    @classmethod
+    def from_configs(cls) -> "LoadProfile":
+        """Build a profile from the LOAD_* settings of the active environment."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            users=configs.LOAD_USERS,
+            ramp_up=configs.LOAD_RAMP_UP,
+            duration=configs.LOAD_DURATION,
+            think_time=configs.LOAD_THINK_TIME,
+        )
+
+
+@dataclass
+class StepStats:
+    """Latency and error summary of one step."""
+
+    name: str
+    count: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    max: float
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+class StepRecorder:
+    """Collects step latencies (in seconds) and errors of all virtual users."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    @asynccontextmanager
+    async def step(self, name: str) -> AsyncIterator[None]:
+        """Time the block as step ``name``; an exception counts as an error."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] += 1
+            raise
+        finally:
+            self.latencies[name].append(time.perf_counter() - started)
+
+    def summary(self) -> List[StepStats]:
+        stats = []
+        for name, values in self.latencies.items():
+            ordered = sorted(values)
+            stats.append(
+                StepStats(
+                    name=name,
+                    count=len(ordered),
+                    errors=self.errors[name],
+                    p50=percentile(ordered, 50),
+                    p95=percentile(ordered, 95),
+                    p99=percentile(ordered, 99),
+                    mean=sum(ordered) / len(ordered),
+                    max=ordered[-1],
+                )
+            )
+        return stats
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+
+    profile: LoadProfile
+    seconds: float
+    successful_iterations: int
+    failed_iterations: int
+    steps: List[StepStats]
+
+    @property
+    def iterations(self) -> int:
+        """Flow iterations started, successful or not."""
+        return self.successful_iterations + self.failed_iterations
+
+    @property
+    def throughput(self) -> float:
+        """Successful flow iterations per second."""
+        return self.successful_iterations / self.seconds if self.seconds else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed_iterations / self.iterations if self.iterations else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "profile": asdict(self.profile),
+            "seconds": round(self.seconds, 3),
+            "iterations": self.iterations,
+            "successful_iterations": self.successful_iterations,
+            "failed_iterations": self.failed_iterations,
+            "error_rate": self.error_rate,
+            "throughput_per_sec": round(self.throughput, 3),
+            "steps": [
+                {**asdict(step), "error_rate": step.error_rate} for step in self.steps
+            ],
+        }
+
+    def write_json(self, file_path: str) -> Path:
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=4))
+        return path
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.profile.users} users: {self.successful_iterations} successful "
+            f"and {self.failed_iterations} failed iterations in {self.seconds:.1f}s "
+            f"({self.throughput:.2f} successful/s, {self.error_rate:.1%} failed)",
+            f"  {'step':<16}{'count':>7}{'errors':>8}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for step in self.steps:
+            lines.append(
+                f"  {step.name:<16}{step.count:>7}{step.errors:>8}"
+                f"{step.p50 * 1000:>10.1f}{step.p95 * 1000:>10.1f}"
+                f"{step.p99 * 1000:>10.1f}{step.max * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+# A flow drives one virtual user's pages through the recorder's named steps
+Flow = Callable[[AsyncPages, StepRecorder, str], Awaitable[None]]
+
+
+async def smoke_flow(pages: AsyncPages, steps: StepRecorder, base_url: str) -> None:
+    """Open the login page, log in and verify the home page header."""
+    async with steps.step("open_login"):
+        await pages.login_page.goto(base_url)
+    async with steps.step("login"):
+        await pages.login_page.login()
+    async with steps.step("verify_home"):
+        await pages.home_page.verify_header_displayed("Swag Labs")
+
+
+class LoadRunner:
+    """Runs a flow with the virtual users of a LoadProfile."""
+
+    def __init__(
+        self,
+        base_url: str,
+        flow: Flow = smoke_flow,
+        profile: Optional[LoadProfile] = None,
+        browser_name: str = "chromium",
+        headless: bool = True,
+    ):
+        self.base_url = base_url
+        self.flow = flow
+        self.profile = profile or LoadProfile()
+        self.browser_name = browser_name
+        self.headless = headless
+        self.recorder = StepRecorder()
+        self.successful_iterations = 0
+        self.failed_iterations = 0
+
+    async def run(self) -> LoadReport:
+        """Launch one browser, run all virtual users and return the report."""
+        async with async_playwright() as playwright:
+            browser_type = getattr(playwright, self.browser_name)
+            browser = await browser_type.launch(headless=self.headless)
+            try:
+                started = time.perf_counter()
+                deadline = started + self.profile.ramp_up + self.profile.duration
+                await asyncio.gather(
+                    *(
+                        self._virtual_user(browser, user, deadline)
+                        for user in range(self.profile.users)
+                    )
+                )
+                seconds = time.perf_counter() - started
+            finally:
+                await browser.close()
+        return LoadReport(
+            profile=self.profile,
+            seconds=seconds,
+            successful_iterations=self.successful_iterations,
+            failed_iterations=self.failed_iterations,
+            steps=self.recorder.summary(),
+        )
+
+    async def _virtual_user(self, browser: Browser, user: int, deadline: float) -> None:
+        await asyncio.sleep(self.profile.ramp_up * user / self.profile.users)
+        # A context per user, so every user is an independent session
+        context = await browser.new_context()
+        pages = AsyncPages(await context.new_page())
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    await self.flow(pages, self.recorder, self.base_url)
+                except Exception:
+                    self.failed_iterations += 1
+                else:
+                    self.successful_iterations += 1
+                if self.profile.think_time:
+                    await asyncio.sleep(self.profile.think_time)
+        finally:
+            await context.close()
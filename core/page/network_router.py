@@ -0,0 +1,253 @@
+"""Request routing for pages and browser contexts.
+
+The router aborts resource types (images, fonts, media, ...) and third-party
+domains that UI assertions never look at, and serves repeated static assets
+from an on-disk cache instead of the network. Every decision is counted so
+the requests and bytes saved by a test can be reported.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Page, Request, Route
+
+# Resource types served from the asset cache when it is enabled
+CACHEABLE_TYPES = frozenset({"stylesheet", "script", "font", "image"})
+# Headers describing the wire encoding, invalid once the body is decoded
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)")
+
+
+def _split(value: Union[str, Iterable[str], None]) -> frozenset:
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        value = value.split(",")
+    return frozenset(item.strip().lower() for item in value if item.strip())
+
+
+@dataclass
+class RouteStats:
+    """Requests and bytes handled by a router.
+
+    Blocked requests are counted but carry no bytes, since their size is
+    unknown without downloading them. Revalidated requests went to the
+    network but their body was served from the cache.
+    """
+
+    blocked_requests: int = 0
+    cached_requests: int = 0
+    cached_bytes: int = 0
+    revalidated_requests: int = 0
+    network_requests: int = 0
+    network_bytes: int = 0
+
+    @property
+    def saved_requests(self) -> int:
+        return self.blocked_requests + self.cached_requests
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.cached_bytes
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            **asdict(self),
+            "saved_requests": self.saved_requests,
+            "saved_bytes": self.saved_bytes,
+        }
+
+
+class StaticAssetCache:
+    """Stores GET responses for static assets as body + metadata files.
+
+    Entries are fresh for the response's ``Cache-Control: max-age``, or for
+    ``ttl_seconds`` when it has none. ``no-store`` responses are not cached and
+    ``no-cache`` ones are revalidated on every use. Stale entries with an
+    ``ETag`` or ``Last-Modified`` are revalidated rather than downloaded again.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float = 3600):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.body", self.directory / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Return ``(meta, body)`` for a cached asset, or None."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            return meta, body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def is_fresh(meta: Dict[str, Any]) -> bool:
+        return meta.get("expires", 0) > time.time()
+
+    @staticmethod
+    def validators(meta: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional request headers revalidating a cached asset."""
+        headers = {k.lower(): v for k, v in meta["headers"].items()}
+        conditions = {}
+        if "etag" in headers:
+            conditions["if-none-match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditions["if-modified-since"] = headers["last-modified"]
+        return conditions
+
+    def _expires(self, headers: Dict[str, str]) -> Optional[float]:
+        """Expiry time from Cache-Control, None when it must not be stored."""
+        cache_control = next(
+            (v.lower() for k, v in headers.items() if k.lower() == "cache-control"), ""
+        )
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0.0
+        match = _MAX_AGE.search(cache_control)
+        max_age = int(match.group(1)) if match else self.ttl_seconds
+        return time.time() + max_age
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        expires = self._expires(headers)
+        if expires is None:
+            return
+        body_path, meta_path = self._paths(url)
+        headers = {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS}
+        meta = {"url": url, "status": status, "headers": headers, "expires": expires}
+        # Write both files atomically, the body first, so readers see either
+        # no entry or a complete one
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode())
+
+    def refresh(self, url: str, meta: Dict[str, Any], headers: Dict[str, str]) -> None:
+        """Extend a revalidated entry using the headers of the 304 response."""
+        expires = self._expires({**meta["headers"], **headers})
+        if expires is None:
+            self.invalidate(url)
+            return
+        _, meta_path = self._paths(url)
+        self._write(meta_path, json.dumps({**meta, "expires": expires}).encode())
+
+    def invalidate(self, url: str) -> None:
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+class NetworkRouter:
+    """Blocks, caches or forwards the requests of a page or context."""
+
+    def __init__(
+        self,
+        blocked_types: Union[str, Iterable[str], None] = None,
+        blocked_domains: Union[str, Iterable[str], None] = None,
+        asset_cache: Optional[StaticAssetCache] = None,
+        cacheable_types: Iterable[str] = CACHEABLE_TYPES,
+    ):
+        """Initialize the router.
+
+        Args:
+            blocked_types: Playwright resource types to abort, e.g. "image,font".
+            blocked_domains: Hosts (and their subdomains) to abort.
+            asset_cache: Cache serving repeated static assets, None to disable.
+            cacheable_types: Resource types eligible for the asset cache.
+        """
+        self.blocked_types = _split(blocked_types)
+        self.blocked_domains = _split(blocked_domains)
+        self.asset_cache = asset_cache
+        self.cacheable_types = _split(cacheable_types)
+        self.stats = RouteStats()
+
+    @classmethod
+    def from_configs(
+        cls, asset_cache: Optional[StaticAssetCache] = None
+    ) -> "NetworkRouter":
+        """Build a router from the UI_BLOCK_* settings of the active environment."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            blocked_types=configs.UI_BLOCK_RESOURCES,
+            blocked_domains=configs.UI_BLOCK_DOMAINS,
+            asset_cache=asset_cache,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.blocked_types or self.blocked_domains or self.asset_cache)
+
+    def attach(self, target: Union[Page, BrowserContext]) -> None:
+        """Route every request of a page or context through this router."""
+        if self.enabled:
+            target.route("**/*", self._handle)
+
+    def _is_blocked(self, request: Request) -> bool:
+        if request.resource_type in self.blocked_types:
+            return True
+        host = (urlsplit(request.url).hostname or "").lower()
+        return any(
+            host == domain or host.endswith(f".{domain}")
+            for domain in self.blocked_domains
+        )
+
+    def _handle(self, route: Route, request: Request) -> None:
+        url = request.url
+        if self._is_blocked(request):
+            self.stats.blocked_requests += 1
+            route.abort("blockedbyclient")
+            return
+
+        cacheable = (
+            self.asset_cache is not None
+            and request.method == "GET"
+            and request.resource_type in self.cacheable_types
+        )
+        if not cacheable:
+            route.continue_()
+            return
+
+        cached = self.asset_cache.get(url)
+        conditions = {}
+        if cached is not None:
+            meta, body = cached
+            if self.asset_cache.is_fresh(meta):
+                self.stats.cached_requests += 1
+                self.stats.cached_bytes += len(body)
+                route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                return
+            conditions = self.asset_cache.validators(meta)
+
+        if conditions:
+            response = route.fetch(headers={**request.headers, **conditions})
+            if response.status == 304:
+                self.asset_cache.refresh(url, meta, response.headers)
+                self.stats.revalidated_requests += 1
+                self.stats.cached_bytes += len(body)
+                route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                return
+        else:
+            response = route.fetch()
+        body = response.body()
+        self.stats.network_requests += 1
+        self.stats.network_bytes += len(body)
+        if response.ok:
+            self.asset_cache.put(url, response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
@@ -0,0 +1,113 @@
+"""Buffered logging of page actions.
+
+Page objects record what they did through ``log()``. While a StepLog is
+active the call only enqueues the raw values; a background thread formats
+them, and the collected lines are attached to Allure on the test thread when
+the test ends or fails. Without an active StepLog, ``log()`` attaches
+immediately as before.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, List, Optional
+
+import allure
+
+# Verbosity levels
+VERBOSITY_ALL = "all"  # keep the action log of every test
+VERBOSITY_FAILURES = "failures"  # keep it only for failed tests
+VERBOSITY_OFF = "off"  # record nothing
+
+
+class StepLog:
+    """Per-test buffer of page actions, formatted off the test thread."""
+
+    _active: Optional["StepLog"] = None
+
+    def __init__(self, verbosity: str = VERBOSITY_ALL):
+        if verbosity not in (VERBOSITY_ALL, VERBOSITY_FAILURES, VERBOSITY_OFF):
+            raise ValueError(f"Unknown step log verbosity: {verbosity}")
+        self.verbosity = verbosity
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._lines: List[str] = []
+        self._worker = threading.Thread(
+            target=self._format_entries, name="step-log", daemon=True
+        )
+        self._worker.start()
+
+    @classmethod
+    def start(cls, verbosity: str = VERBOSITY_ALL) -> "StepLog":
+        """Create a StepLog and make it the sink for ``log()``."""
+        cls._active = cls(verbosity)
+        return cls._active
+
+    @classmethod
+    def active(cls) -> Optional["StepLog"]:
+        return cls._active
+
+    def record(self, name: str, template: str, *args: Any) -> None:
+        """Enqueue an action; formatting happens on the background thread."""
+        if self.verbosity != VERBOSITY_OFF:
+            self._queue.put((time.time(), name, template, args))
+
+    def _format_entries(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            if isinstance(entry, threading.Event):
+                # Flush marker: everything queued before it is formatted
+                entry.set()
+                continue
+            timestamp, name, template, args = entry
+            try:
+                body = template.format(*args)
+            except (IndexError, KeyError, ValueError):
+                body = f"{template} {args!r}"
+            clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+            millis = int(timestamp % 1 * 1000)
+            self._lines.append(f"{clock}.{millis:03d} [{name}] {body}")
+
+    def flush(self, failed: bool = False) -> None:
+        """Attach the actions formatted so far, if the verbosity keeps them.
+
+        Must be called on the test thread, the Allure lifecycle is not
+        thread-safe.
+        """
+        formatted = threading.Event()
+        self._queue.put(formatted)
+        formatted.wait()
+        lines, self._lines = self._lines, []
+        keep = self.verbosity == VERBOSITY_ALL or (
+            failed and self.verbosity == VERBOSITY_FAILURES
+        )
+        if lines and keep:
+            allure.attach(
+                "\n".join(lines),
+                name="Page Actions",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+    def close(self, failed: bool = False) -> None:
+        """Flush, stop the background thread and deactivate this log."""
+        self.flush(failed)
+        self._queue.put(None)
+        self._worker.join()
+        if StepLog._active is self:
+            StepLog._active = None
+
+
+def log(name: str, template: str, *args: Any) -> None:
+    """Record a page action in the active StepLog, or attach it right away.
+
+    Args:
+        name (str): Attachment name, e.g. "Element Clicked".
+        template (str): ``str.format`` template for the body.
+        *args: Values substituted into the template.
+    """
+    step_log = StepLog._active
+    if step_log is not None:
+        step_log.record(name, template, *args)
+    else:
+        allure.attach(name=name, body=template.format(*args))
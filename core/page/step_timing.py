@@ -0,0 +1,236 @@
+"""Wall-time instrumentation and performance budgets for page objects.
+
+While a StepTimings registry is active, every instrumented page-object method
+records how long it took: BasePage and AsyncBasePage methods as "action"
+(they wrap one Playwright call each) and methods of page-object subclasses as
+"step". Coroutine methods are timed until they complete. When enabled,
+navigations additionally record the browser's Navigation Timing and Web
+Vitals. Budgets such as "LoginPage.login under 1.5s" are checked against the
+timings recorded while the test body ran.
+"""
+
+import functools
+import inspect
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Reads Navigation Timing, paint timings and (where supported) LCP and CLS
+WEB_VITALS_JS = """
+() => new Promise((resolve) => {
+    const navigation = performance.getEntriesByType("navigation")[0];
+    const paints = Object.fromEntries(
+        performance.getEntriesByType("paint").map((entry) => [entry.name, entry.startTime])
+    );
+    let largestContentfulPaint = null;
+    let cumulativeLayoutShift = null;
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true });
+        } catch (error) {}
+    };
+    observe("largest-contentful-paint", (entry) => {
+        largestContentfulPaint = entry.startTime;
+    });
+    observe("layout-shift", (entry) => {
+        if (!entry.hadRecentInput) {
+            cumulativeLayoutShift = (cumulativeLayoutShift || 0) + entry.value;
+        }
+    });
+    setTimeout(() => resolve({
+        ttfb: navigation ? navigation.responseStart - navigation.requestStart : null,
+        dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : null,
+        load: navigation ? navigation.loadEventEnd : null,
+        transfer_size: navigation ? navigation.transferSize : null,
+        first_paint: paints["first-paint"] ?? null,
+        first_contentful_paint: paints["first-contentful-paint"] ?? null,
+        largest_contentful_paint: largestContentfulPaint,
+        cumulative_layout_shift: cumulativeLayoutShift,
+    }), 0);
+})
+"""
+
+
+class BudgetExceeded(AssertionError):
+    """Raised when a step took longer than its budget."""
+
+
+@dataclass
+class StepTiming:
+    """One timed call."""
+
+    name: str
+    kind: str
+    started: float
+    seconds: float
+    metrics: Optional[Dict[str, Any]] = None
+    phase: str = "call"
+
+    def as_dict(self) -> Dict[str, Any]:
+        record = {
+            "name": self.name,
+            "kind": self.kind,
+            "phase": self.phase,
+            "started": round(self.started, 6),
+            "seconds": round(self.seconds, 6),
+        }
+        if self.metrics is not None:
+            record["metrics"] = self.metrics
+        return record
+
+
+@dataclass
+class StepTimings:
+    """Timings and budgets of one test.
+
+    ``phase`` is the pytest phase ("setup", "call", "teardown") new records
+    belong to; only "call" records count against budgets, so logins done by
+    fixtures do not fail the test.
+
+    The registry is process-wide rather than per thread or context, so async
+    page objects driven by ``run_async`` on another thread record into it too.
+    """
+
+    test: str = ""
+    web_vitals: bool = False
+    records: List[StepTiming] = field(default_factory=list)
+    budgets: List[Tuple[str, float]] = field(default_factory=list)
+    origin: float = field(default_factory=time.perf_counter)
+    phase: str = "setup"
+
+    _active = None
+
+    @classmethod
+    def start(cls, test: str = "", web_vitals: bool = False) -> "StepTimings":
+        """Create a registry and make it the target of instrumented methods."""
+        cls._active = cls(test=test, web_vitals=web_vitals)
+        return cls._active
+
+    @classmethod
+    def active(cls) -> Optional["StepTimings"]:
+        return cls._active
+
+    def stop(self) -> None:
+        if StepTimings._active is self:
+            StepTimings._active = None
+
+    def record(
+        self,
+        name: str,
+        kind: str,
+        started: float,
+        seconds: float,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.records.append(
+            StepTiming(name, kind, started - self.origin, seconds, metrics, self.phase)
+        )
+
+    def budget(self, pattern: str, seconds: float) -> None:
+        """Require every step matching ``pattern`` (fnmatch) to take <= seconds."""
+        self.budgets.append((pattern, seconds))
+
+    def violations(
+        self, budgets: Iterable[Tuple[str, float]] = ()
+    ) -> List[Tuple[StepTiming, float]]:
+        """Return ``(timing, budget)`` for every call-phase record over its budget."""
+        checks = [*self.budgets, *budgets]
+        return [
+            (timing, limit)
+            for pattern, limit in checks
+            for timing in self.records
+            if timing.phase == "call"
+            and timing.seconds > limit
+            and fnmatchcase(timing.name, pattern)
+        ]
+
+    def check_budgets(self, budgets: Iterable[Tuple[str, float]] = ()) -> None:
+        """Raise BudgetExceeded listing every step over its budget."""
+        violations = self.violations(budgets)
+        if violations:
+            raise BudgetExceeded(
+                "Performance budget exceeded: "
+                + "; ".join(
+                    f"{timing.name} took {timing.seconds:.3f}s (budget {limit}s)"
+                    for timing, limit in violations
+                )
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "test": self.test,
+            "records": [timing.as_dict() for timing in self.records],
+            "budgets": [list(budget) for budget in self.budgets],
+        }
+
+
+def timed(func: Callable, name: str, kind: str) -> Callable:
+    """Wrap ``func`` so calls are recorded in the active StepTimings."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            timings = StepTimings._active
+            if timings is None:
+                return await func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                timings.record(name, kind, started, time.perf_counter() - started)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        timings = StepTimings._active
+        if timings is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings.record(name, kind, started, time.perf_counter() - started)
+
+    return wrapper
+
+
+def instrument(cls: type, kind: str, exclude: Iterable[str] = ()) -> type:
+    """Time every public method defined directly on ``cls``.
+
+    Recorded names are ``ClassName.method``.
+    """
+    excluded = set(exclude)
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or attr in excluded or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, timed(value, f"{cls.__name__}.{attr}", kind))
+    return cls
+
+
+def record_navigation(page: Any, url: str) -> None:
+    """Record Navigation Timing and Web Vitals of the page just loaded."""
+    timings = StepTimings._active
+    if timings is None or not timings.web_vitals:
+        return
+    started = time.perf_counter()
+    _record_metrics(timings, url, started, page.evaluate(WEB_VITALS_JS))
+
+
+async def record_navigation_async(page: Any, url: str) -> None:
+    """``record_navigation`` for ``playwright.async_api`` pages."""
+    timings = StepTimings._active
+    if timings is None or not timings.web_vitals:
+        return
+    started = time.perf_counter()
+    _record_metrics(timings, url, started, await page.evaluate(WEB_VITALS_JS))
+
+
+def _record_metrics(
+    timings: StepTimings, url: str, started: float, metrics: Dict[str, Any]
+) -> None:
+    # The navigation's own duration is the browser's load time, when known
+    load_ms = metrics.get("load") or metrics.get("dom_content_loaded") or 0
+    timings.record(url, "navigation", started, load_ms / 1000, metrics)
@@ -0,0 +1,69 @@
+"""On-disk cache of authenticated Playwright storage states.
+
+Logging in through the UI once per user and environment, then seeding new
+contexts with the saved cookies/local storage, lets tests start already
+authenticated. Entries expire after a TTL and can be invalidated when a test
+lands on the login page again.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from playwright.sync_api import BrowserContext
+
+
+class StorageStateCache:
+    """Stores one ``storage_state`` JSON file per user and environment."""
+
+    def __init__(self, directory: str = "reports/.auth", ttl_seconds: float = 1800):
+        """Initialize the cache.
+
+        Args:
+            directory (str): Where storage state files are written.
+            ttl_seconds (float): Age after which a saved state is ignored.
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+
+    def path(self, user: str, env: str) -> Path:
+        """Return the storage state file for a user and environment."""
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{env}__{user or 'anonymous'}")
+        return self.directory / f"{slug}.json"
+
+    def get(self, user: str, env: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh storage state, or None when missing/expired.
+
+        The state is read into memory here, so another worker invalidating
+        the file afterwards cannot break ``new_context(storage_state=...)``.
+        """
+        path = self.path(user, env)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                self.invalidate(user, env)
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            # Invalidated by another worker in the meantime
+            return None
+        except ValueError:
+            self.invalidate(user, env)
+            return None
+
+    def save(self, context: BrowserContext, user: str, env: str) -> Dict[str, Any]:
+        """Save the context's storage state and return it."""
+        path = self.path(user, env)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        state = context.storage_state(path=tmp_path)
+        # Atomic rename so parallel workers never read a half written file
+        os.replace(tmp_path, path)
+        return state
+
+    def invalidate(self, user: str, env: str) -> None:
+        """Forget the saved state, forcing the next test to log in again."""
+        self.path(user, env).unlink(missing_ok=True)
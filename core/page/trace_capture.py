@@ -0,0 +1,203 @@
+"""Playwright trace, HAR and video capture driven by a sampling policy.
+
+Recording every test is expensive, so a policy decides per test whether to
+record at all and whether to keep what was recorded:
+
+- ``off``: record nothing.
+- ``always``: record and keep every test.
+- ``sampled``: record and keep a random percentage of tests.
+- ``failures``: record every test, keep only failed ones.
+- ``retries``: record only retried tests (pytest-rerunfailures'
+  ``execution_count``), keep them all.
+
+Kept files are attached to the Allure report and stay in a ring buffer
+directory that holds the last N artifacts.
+"""
+
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import allure
+from playwright.sync_api import BrowserContext
+
+# Capture policies
+CAPTURE_OFF = "off"
+CAPTURE_ALWAYS = "always"
+CAPTURE_SAMPLED = "sampled"
+CAPTURE_FAILURES = "failures"
+CAPTURE_RETRIES = "retries"
+
+# Capture kinds
+KIND_TRACE = "trace"
+KIND_HAR = "har"
+
+
+class ArtifactRing:
+    """Directory that keeps only the newest ``keep`` artifacts.
+
+    Pruning is not synchronized between processes, so each xdist worker gets
+    its own subdirectory (``worker``) and ``keep`` applies per worker.
+    """
+
+    def __init__(self, directory: str, keep: int = 20, worker: Optional[str] = None):
+        self.directory = Path(directory) / worker if worker else Path(directory)
+        self.keep = keep
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def add(self, path: Path) -> Path:
+        """Register a new artifact and delete the oldest ones beyond ``keep``."""
+        files = sorted(
+            (f for f in self.directory.iterdir() if f.is_file()),
+            key=lambda f: f.stat().st_mtime_ns,
+        )
+        for old in files[: max(len(files) - self.keep, 0)]:
+            if old != path:
+                old.unlink(missing_ok=True)
+        return path
+
+
+class TraceCapture:
+    """Records traces, HAR files and videos of one test's contexts."""
+
+    def __init__(
+        self,
+        ring: ArtifactRing,
+        mode: str = CAPTURE_FAILURES,
+        kinds: Iterable[str] = (KIND_TRACE,),
+        sample_percent: float = 10.0,
+        video_ring: Optional[ArtifactRing] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the capture.
+
+        Args:
+            ring (ArtifactRing): Where kept traces and HAR files go.
+            mode (str): Capture policy, see the module docstring.
+            kinds (Iterable[str]): "trace" and/or "har".
+            sample_percent (float): Share of tests recorded in "sampled" mode.
+            video_ring (ArtifactRing): Record a video of every page when set.
+            rng (random.Random): Source of sampling decisions.
+        """
+        if mode not in (
+            CAPTURE_OFF,
+            CAPTURE_ALWAYS,
+            CAPTURE_SAMPLED,
+            CAPTURE_FAILURES,
+            CAPTURE_RETRIES,
+        ):
+            raise ValueError(f"Unknown capture mode: {mode}")
+        self.ring = ring
+        self.mode = mode
+        self.kinds = {kind.strip() for kind in kinds if kind.strip()}
+        self.sample_percent = sample_percent
+        self.video_ring = video_ring
+        self.rng = rng or random.Random()
+        self.name = ""
+        self.recording = False
+        self.contexts: List[BrowserContext] = []
+        self.har_paths: List[Path] = []
+        self.videos: List[Any] = []
+
+    @classmethod
+    def from_configs(
+        cls,
+        ring: ArtifactRing,
+        video_ring: Optional[ArtifactRing] = None,
+        rng: Optional[random.Random] = None,
+    ) -> "TraceCapture":
+        """Build a capture from the UI_CAPTURE_* settings of the active environment."""
+        from configs.configs import Configs
+
+        configs = Configs()
+        return cls(
+            ring,
+            mode=configs.UI_CAPTURE_MODE,
+            kinds=configs.UI_CAPTURE_KINDS.split(","),
+            sample_percent=configs.UI_CAPTURE_SAMPLE_PERCENT,
+            video_ring=video_ring if configs.RECORD_VIDEO else None,
+            rng=rng,
+        )
+
+    def begin(self, name: str, retry: bool = False) -> bool:
+        """Decide whether this test is recorded."""
+        self.name = name
+        if self.mode == CAPTURE_SAMPLED:
+            self.recording = self.rng.random() * 100 < self.sample_percent
+        elif self.mode == CAPTURE_RETRIES:
+            self.recording = retry
+        else:
+            self.recording = self.mode in (CAPTURE_ALWAYS, CAPTURE_FAILURES)
+        return self.recording
+
+    def keep(self, failed: bool) -> bool:
+        """Whether what was recorded is worth keeping."""
+        return self.recording and (self.mode != CAPTURE_FAILURES or failed)
+
+    def context_args(self) -> Dict[str, Any]:
+        """Extra ``new_context`` arguments for HAR and video recording."""
+        args: Dict[str, Any] = {}
+        if self.recording and KIND_HAR in self.kinds:
+            path = self.ring.directory / f"{self.name}_{len(self.har_paths)}.har"
+            self.har_paths.append(path)
+            args["record_har_path"] = str(path)
+            args["record_har_content"] = "attach"
+        if self.video_ring is not None:
+            args["record_video_dir"] = str(self.video_ring.directory)
+        return args
+
+    def watch(self, context: BrowserContext) -> None:
+        """Register a context of the test and start its trace if recorded."""
+        self.contexts.append(context)
+        if self.video_ring is not None:
+            context.on("page", lambda page: self.videos.append(page.video))
+        if self.recording and KIND_TRACE in self.kinds:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+    def stop_traces(self, failed: bool) -> List[Path]:
+        """Stop the traces (contexts must still be open), saving kept ones."""
+        if not (self.recording and KIND_TRACE in self.kinds):
+            return []
+        keep = self.keep(failed)
+        paths = []
+        for index, context in enumerate(self.contexts):
+            path = self.ring.directory / f"{self.name}_{index}.zip" if keep else None
+            try:
+                context.tracing.stop(path=path)
+            except Exception:
+                # The context may already be closed by the test
+                continue
+            if path is not None:
+                paths.append(self._keep(self.ring, path, "Playwright trace", "zip"))
+        return paths
+
+    def finish(self, failed: bool) -> List[Path]:
+        """Keep or drop HAR files and videos once the contexts are closed."""
+        keep = self.keep(failed)
+        paths = []
+        for path in self.har_paths:
+            if not path.exists():
+                continue
+            if keep:
+                paths.append(self._keep(self.ring, path, "HAR", "har"))
+            else:
+                path.unlink()
+        for video in self.videos:
+            if video is None:
+                continue
+            path = Path(video.path())
+            if path.exists():
+                allure.attach.file(
+                    str(path),
+                    name=f"Video {path.name}",
+                    attachment_type=allure.attachment_type.WEBM,
+                )
+                paths.append(self.video_ring.add(path))
+        return paths
+
+    @staticmethod
+    def _keep(ring: ArtifactRing, path: Path, label: str, extension: str) -> Path:
+        # Attached as a copy, so the report outlives the ring's pruning
+        allure.attach.file(str(path), name=f"{label}: {path.name}", extension=extension)
+        ring.add(path)
+        return path
@@ -0,0 +1,84 @@
+"""In-process HTTP server for stand-in backends.
+
+Runs a ``ThreadingHTTPServer`` on a free local port in a background thread,
+so tests and load runs can target a stub instead of the real application.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Type
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Request handler that does not log every request to stderr."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def send_body(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str = "text/html; charset=utf-8",
+        headers: Optional[dict] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class LocalServer:
+    """Serves a handler class on ``host`` in a daemon thread."""
+
+    def __init__(
+        self,
+        handler_class: Type[BaseHTTPRequestHandler],
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            handler_class: Handler for every request.
+            host: Interface to bind.
+            port: Port to bind, 0 picks a free one.
+        """
+        self.handler_class = handler_class
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "LocalServer":
+        self._server = ThreadingHTTPServer((self.host, self.port), self.handler_class)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+        self._server = self._thread = None
+
+    def __enter__(self) -> "LocalServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
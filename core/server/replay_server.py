@@ -0,0 +1,82 @@
+"""Local HTTP server replaying a ReplayArchive.
+
+Every request is answered from the archive after an optional artificial
+latency. A concurrency limit makes excess requests queue like they would on
+a rate-limited upstream. Requests that were never recorded get a 404 with an
+ipstack-style error body.
+"""
+
+import json
+import threading
+import time
+from typing import Optional
+
+from core.api.replay_archive import ReplayArchive
+from core.server.local_server import LocalServer, QuietHandler
+
+
+class ReplayHandler(QuietHandler):
+    """Serves recorded responses; configured through class attributes."""
+
+    archive: ReplayArchive
+    latency: float = 0.0
+    slots: Optional[threading.BoundedSemaphore] = None
+
+    def do_GET(self) -> None:
+        if self.slots is None:
+            self._replay()
+            return
+        with self.slots:
+            self._replay()
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def _replay(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.latency:
+            time.sleep(self.latency)
+        entry = self.archive.get(self.command, self.path)
+        if entry is None:
+            body = {
+                "success": False,
+                "error": {
+                    "code": 404,
+                    "type": "not_recorded",
+                    "info": f"No recorded response for {self.command} {self.path}",
+                },
+            }
+            self.send_body(404, json.dumps(body).encode(), "application/json")
+            return
+        self.send_body(
+            entry["status"], entry["body"].encode("utf-8"), entry["content_type"]
+        )
+
+
+def replay_server(
+    archive: ReplayArchive,
+    latency_ms: float = 0,
+    concurrency: int = 0,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> LocalServer:
+    """Return a (not yet started) server replaying ``archive``.
+
+    Args:
+        archive (ReplayArchive): The recorded responses.
+        latency_ms (float): Delay added to every response.
+        concurrency (int): Requests served at once, 0 for no limit.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+    """
+    handler = type(
+        "ConfiguredReplayHandler",
+        (ReplayHandler,),
+        {
+            "archive": archive,
+            "latency": latency_ms / 1000,
+            "slots": threading.BoundedSemaphore(concurrency) if concurrency else None,
+        },
+    )
+    return LocalServer(handler, host, port)
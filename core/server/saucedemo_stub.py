@@ -0,0 +1,75 @@
+"""Stand-in for saucedemo.com with the elements the page objects use.
+
+The login form accepts any credentials, stores them in the
+``session-username`` cookie like the real site and opens the inventory page,
+which sends visitors without that cookie back to the login form.
+"""
+
+from core.server.local_server import LocalServer, QuietHandler
+
+LOGIN_HTML = b"""<!DOCTYPE html>
+<html>
+<head><title>Swag Labs</title></head>
+<body>
+<div class="login_logo">Swag Labs</div>
+<form id="login_form">
+    <input id="user-name" name="user-name" type="text" placeholder="Username">
+    <input id="password" name="password" type="password" placeholder="Password">
+    <input id="login-button" type="submit" value="Login">
+</form>
+<script>
+document.getElementById("login_form").addEventListener("submit", (event) => {
+    event.preventDefault();
+    const user = document.getElementById("user-name").value || "standard_user";
+    document.cookie = "session-username=" + encodeURIComponent(user) + "; path=/";
+    window.location.href = "/inventory.html";
+});
+</script>
+</body>
+</html>
+"""
+
+INVENTORY_HTML = b"""<!DOCTYPE html>
+<html>
+<head><title>Swag Labs</title></head>
+<body>
+<script>
+if (!document.cookie.includes("session-username=")) {
+    window.location.replace("/");
+}
+</script>
+<div class="primary_header">
+    <button id="react-burger-menu-btn">Open Menu</button>
+    <div class="app_logo">Swag Labs</div>
+    <div id="shopping_cart_container"><a class="shopping_cart_link">Cart</a></div>
+</div>
+<div class="inventory_list">
+    <div class="inventory_item">Sauce Labs Backpack</div>
+</div>
+</body>
+</html>
+"""
+
+PAGES = {
+    "/": LOGIN_HTML,
+    "/index.html": LOGIN_HTML,
+    "/inventory.html": INVENTORY_HTML,
+}
+
+
+class SauceDemoStubHandler(QuietHandler):
+    """Serves the login and inventory pages."""
+
+    def do_GET(self) -> None:
+        body = PAGES.get(self.path.split("?", 1)[0])
+        if body is None:
+            self.send_body(404, b"Not Found", "text/plain")
+        else:
+            self.send_body(200, body)
+
+    do_HEAD = do_GET
+
+
+def saucedemo_stub(host: str = "127.0.0.1", port: int = 0) -> LocalServer:
+    """Return a (not yet started) saucedemo stand-in server."""
+    return LocalServer(SauceDemoStubHandler, host, port)
@@ -0,0 +1,218 @@
+"""Column-oriented container for large result sets.
+
+A ColumnarTable stores one ``array`` (for int/float columns) or ``list`` per
+column instead of one object per row, which removes the per-row object and
+``__dict__`` overhead when comparing millions of records. Rows are exposed
+as lightweight views that read from the columns on demand.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# array typecodes used for homogeneous numeric columns
+_TYPECODES = {int: "q", float: "d"}
+
+
+def _new_column(sample: Any):
+    typecode = _TYPECODES.get(type(sample))
+    return array(typecode) if typecode else []
+
+
+def _append(data: Dict[str, Any], name: str, value: Any) -> None:
+    column = data[name]
+    if isinstance(column, array):
+        try:
+            column.append(value)
+            return
+        except (TypeError, OverflowError):
+            # Mixed or oversized values: fall back to a plain list
+            column = data[name] = list(column)
+    column.append(value)
+
+
+class RowView:
+    """Read-only view of one row of a ColumnarTable."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ColumnarTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._table.column(name)[self._index]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name: str) -> Any:
+        return self._table.column(name)[self._index]
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        return tuple(
+            self._table.column(name)[self._index] for name in self._table.columns
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._table.columns, self.as_tuple()))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RowView):
+            return self.as_tuple() == other.as_tuple()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RowView({self.as_dict()})"
+
+
+@dataclass
+class TableDiff:
+    """Differences between two tables matched by a key column."""
+
+    missing: List[Any] = field(default_factory=list)
+    extra: List[Any] = field(default_factory=list)
+    changed: List[Tuple[Any, str, Any, Any]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.extra or self.changed)
+
+
+class ColumnarTable:
+    """One array or list per column, with lazy row views."""
+
+    __slots__ = ("columns", "_data", "_length")
+
+    def __init__(self, columns: Sequence[str], data: Optional[Dict[str, Any]] = None):
+        self.columns = tuple(columns)
+        self._data: Dict[str, Any] = data or {name: [] for name in self.columns}
+        lengths = {len(self._data[name]) for name in self.columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {lengths}")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls, columns: Sequence[str], rows: Iterable[Sequence[Any]]
+    ) -> "ColumnarTable":
+        """Build a table from row tuples (e.g. database rows).
+
+        Raises:
+            ValueError: If a row does not have one value per column.
+        """
+        data: Dict[str, Any] = {}
+        for index, row in enumerate(rows):
+            if len(row) != len(columns):
+                raise ValueError(
+                    f"Row {index} has {len(row)} values for {len(columns)} columns"
+                )
+            if not data:
+                data = {name: _new_column(value) for name, value in zip(columns, row)}
+            for name, value in zip(columns, row):
+                _append(data, name, value)
+        return cls(columns, data or None)
+
+    @classmethod
+    def from_objects(
+        cls, columns: Sequence[str], objects: Iterable[Any]
+    ) -> "ColumnarTable":
+        """Build a table from the attributes of objects (entities, models)."""
+        return cls.from_rows(
+            columns, (tuple(getattr(obj, name) for name in columns) for obj in objects)
+        )
+
+    @classmethod
+    def from_dicts(
+        cls, columns: Sequence[str], records: Iterable[Dict[str, Any]]
+    ) -> "ColumnarTable":
+        """Build a table from mappings, missing keys become None."""
+        return cls.from_rows(
+            columns, (tuple(record.get(name) for name in columns) for record in records)
+        )
+
+    def column(self, name: str) -> Sequence[Any]:
+        return self._data[name]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, index) for index in range(self._length))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarTable):
+            return NotImplemented
+        return self.equals(other)
+
+    def equals(self, other: "ColumnarTable") -> bool:
+        """Compare column by column; same-typed arrays compare in C."""
+        if self.columns != other.columns or len(self) != len(other):
+            return False
+        for name in self.columns:
+            left, right = self._data[name], other._data[name]
+            if type(left) is not type(right):
+                left, right = list(left), list(right)
+            if left != right:
+                return False
+        return True
+
+    def mismatches(self, other: "ColumnarTable") -> Dict[str, List[int]]:
+        """Return positions whose values differ, per column, comparing row by row.
+
+        Rows present in only one table count as mismatches, and so does every
+        row of a column that only one of the tables has.
+        """
+        result: Dict[str, List[int]] = {}
+        longest = max(len(self), len(other))
+        names = self.columns + tuple(n for n in other.columns if n not in self._data)
+        for name in names:
+            if name not in self._data or name not in other._data:
+                if longest:
+                    result[name] = list(range(longest))
+                continue
+            left, right = self._data[name], other._data[name]
+            if left == right:
+                continue
+            positions = [i for i, (a, b) in enumerate(zip(left, right)) if a != b]
+            positions.extend(range(min(len(left), len(right)), longest))
+            if positions:
+                result[name] = positions
+        return result
+
+    def diff(self, other: "ColumnarTable", key: str) -> TableDiff:
+        """Match rows by ``key`` and report missing, extra and changed values.
+
+        ``self`` is the expected table, ``other`` the actual one.
+        """
+        positions = {value: i for i, value in enumerate(other.column(key))}
+        own_keys = self.column(key)
+        own_key_set = set(own_keys)
+        result = TableDiff(
+            missing=[value for value in own_keys if value not in positions],
+            extra=[value for value in positions if value not in own_key_set],
+        )
+        shared = [
+            (value, i, positions[value])
+            for i, value in enumerate(own_keys)
+            if value in positions
+        ]
+        for name in self.columns:
+            if name == key or name not in other.columns:
+                continue
+            left, right = self._data[name], other._data[name]
+            result.changed.extend(
+                (value, name, left[i], right[j])
+                for value, i, j in shared
+                if left[i] != right[j]
+            )
+        return result
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable(columns={self.columns}, rows={self._length})"
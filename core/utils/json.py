@@ -1,8 +1,9 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Iterable, Iterator, Optional, TypeVar, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from core.utils.file import FileUtils
 
@@ -28,6 +29,140 @@ class JsonUtils:
         with path.open("w", encoding="utf-8") as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
 
+    @staticmethod
+    def iter_json_lines(
+        file_path: str, model_class: Optional[Type[T]] = None
+    ) -> Iterator[Union[T, Any]]:
+        """Yield the items of a JSON Lines file one at a time.
+
+        Blank lines are skipped. Items are validated into ``model_class`` when
+        given, otherwise the decoded JSON values are yielded.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"JSON Lines file not found: {file_path}")
+
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    yield (
+                        JsonUtils.read_json_as_model(item, model_class)
+                        if model_class
+                        else item
+                    )
+
+    @staticmethod
+    def iter_json_array(
+        file_path: str,
+        model_class: Optional[Type[T]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Union[T, Any]]:
+        """Yield the items of a top-level JSON array without loading the file.
+
+        The file is read ``chunk_size`` characters at a time and each array item
+        is decoded as soon as it is complete, so memory use is bounded by the
+        largest single item rather than by the file size.
+
+        Raises:
+            ValueError: If the file is not a single well-formed JSON array, e.g.
+                it has empty elements (``[1,,2]``) or data after the ``]``.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+
+        decoder = json.JSONDecoder()
+        with path.open("r", encoding="utf-8") as f:
+            # What comes next: "[", "first" item or "]", "item", "," (or "]")
+            # after an item, "end" once the array is closed
+            buffer, pos, eof, expect = "", 0, False, "["
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                    pos += 1
+                if pos >= len(buffer):
+                    if eof:
+                        if expect == "end":
+                            return
+                        raise ValueError(f"Unexpected end of JSON array: {file_path}")
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                char = buffer[pos]
+                if expect == "end":
+                    raise ValueError(
+                        f"Unexpected data after the JSON array: {file_path}"
+                    )
+                if expect == "[":
+                    if char != "[":
+                        raise ValueError(f"JSON file is not an array: {file_path}")
+                    expect, pos = "first", pos + 1
+                    continue
+                if expect == ",":
+                    if char not in ",]":
+                        raise ValueError(
+                            f"Expected ',' or ']' in JSON array: {file_path}"
+                        )
+                    expect, pos = "item" if char == "," else "end", pos + 1
+                    continue
+                if char == "]" and expect == "first":
+                    expect, pos = "end", pos + 1
+                    continue
+                if char in ",]":
+                    raise ValueError(f"Empty element in JSON array: {file_path}")
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                    # A number cut by the chunk boundary still decodes ("2" of "2.5")
+                    complete = end < len(buffer) and buffer[end] in " \t\r\n,]"
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    complete = False
+                if not complete and not eof:
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                expect, pos = ",", end
+                yield (
+                    JsonUtils.read_json_as_model(item, model_class)
+                    if model_class
+                    else item
+                )
+
+    @staticmethod
+    def write_json_lines(file_path: str, items: Iterable[Any]) -> int:
+        """Stream items to a JSON Lines file and return how many were written."""
+        path = Path(file_path)
+        count = 0
+        with path.open("w", encoding="utf-8") as f:
+            for item in items:
+                f.write(JsonUtils._dump_item(item))
+                f.write("\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def write_json_array(file_path: str, items: Iterable[Any]) -> int:
+        """Stream items to a JSON array file and return how many were written."""
+        path = Path(file_path)
+        count = 0
+        with path.open("w", encoding="utf-8") as f:
+            f.write("[")
+            for item in items:
+                f.write(",\n" if count else "\n")
+                f.write(JsonUtils._dump_item(item))
+                count += 1
+            f.write("\n]" if count else "]")
+        return count
+
+    @staticmethod
+    def _dump_item(item: Any) -> str:
+        if isinstance(item, BaseModel):
+            return item.model_dump_json()
+        return json.dumps(item, ensure_ascii=False)
+
     @staticmethod
     def read_json_file_as_model(file_path: str, model_class: Type[T]) -> T:
         path = FileUtils.get_file_path(file_path)
@@ -36,14 +171,42 @@ class JsonUtils:
 
     @staticmethod
     def read_json_file_as_list_model(file_path: str, model_class: Type[T]) -> list[T]:
+        path = Path(FileUtils.get_file_path(file_path))
+        if not path.exists():
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        # Parse and validate the raw bytes in one native pass
+        return JsonUtils.read_json_bytes_as_list_model(path.read_bytes(), model_class)
+
+    @staticmethod
+    def iter_json_file_as_models(file_path: str, model_class: Type[T]) -> Iterator[T]:
+        """Stream validated models from a project relative .json or .jsonl file."""
         path = FileUtils.get_file_path(file_path)
-        data = JsonUtils.read_json_file(path)
-        return JsonUtils.read_json_as_list_model(data, model_class)
+        if path.endswith(".jsonl"):
+            return JsonUtils.iter_json_lines(path, model_class)
+        return JsonUtils.iter_json_array(path, model_class)
 
     @staticmethod
     def read_json_as_model(json_str: Any, model_class: Type[T]) -> T:
-        return model_class(**json_str)
+        return model_class.model_validate(json_str)
 
     @staticmethod
     def read_json_as_list_model(json_str: Any, model_class: Type[T]) -> list[T]:
-        return [model_class(**item) for item in json_str]
+        return JsonUtils.list_adapter(model_class).validate_python(json_str)
+
+    @staticmethod
+    def read_json_bytes_as_model(data: Union[str, bytes], model_class: Type[T]) -> T:
+        """Parse and validate raw JSON into a model without an intermediate dict."""
+        return model_class.model_validate_json(data)
+
+    @staticmethod
+    def read_json_bytes_as_list_model(
+        data: Union[str, bytes], model_class: Type[T]
+    ) -> list[T]:
+        """Parse and validate a raw JSON array into models in one native pass."""
+        return JsonUtils.list_adapter(model_class).validate_json(data)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def list_adapter(model_class: Type[T]) -> TypeAdapter:
+        """Return the cached ``TypeAdapter(list[model_class])``."""
+        return TypeAdapter(list[model_class])
@@ -0,0 +1,110 @@
+"""Process-wide, load-once indexes over JSON array fixture files."""
+
+import os
+import threading
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from core.utils.file import FileUtils
+from core.utils.json import JsonUtils
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class JsonIndexStore(Generic[T]):
+    """Dict indexes over the records of a JSON array file.
+
+    The file is parsed once per process and indexed by the given fields.
+    Records are validated into models on first access only, so large fixture
+    sets load quickly and every lookup is a dict hit; callers get a copy of
+    the cached model. The file is re-read when its modification time changes.
+    """
+
+    _stores: ClassVar[Dict[Tuple[str, type, Tuple[str, ...]], "JsonIndexStore"]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, file_path: str, model_class: Type[T], index_fields: Tuple[str, ...]
+    ):
+        self.path = FileUtils.get_file_path(file_path)
+        self.model_class = model_class
+        self.index_fields = index_fields
+        self._lock = threading.Lock()
+        # Replaced as a whole on reload, so readers always see one version
+        self._state: Optional[_StoreState] = None
+
+    @classmethod
+    def for_file(
+        cls, file_path: str, model_class: Type[T], index_fields: Tuple[str, ...]
+    ) -> "JsonIndexStore[T]":
+        """Return the shared store for a fixture file, creating it once."""
+        key = (FileUtils.get_file_path(file_path), model_class, tuple(index_fields))
+        with cls._stores_lock:
+            if key not in cls._stores:
+                cls._stores[key] = cls(file_path, model_class, tuple(index_fields))
+            return cls._stores[key]
+
+    def get(self, field: str, value: Any) -> Optional[T]:
+        """Return a copy of the first record whose ``field`` equals ``value``."""
+        state = self._refresh()
+        position = state.indexes[field].get(value)
+        return None if position is None else self._model(state, position)
+
+    def first(self) -> Optional[T]:
+        """Return a copy of the first record of the file."""
+        state = self._refresh()
+        return self._model(state, 0) if state.records else None
+
+    def __len__(self) -> int:
+        return len(self._refresh().records)
+
+    def _model(self, state: "_StoreState", position: int) -> T:
+        model = state.models.get(position)
+        if model is None:
+            model = JsonUtils.read_json_as_model(
+                state.records[position], self.model_class
+            )
+            state.models[position] = model
+        # Callers may mutate what they get, the cached model stays pristine
+        return model.model_copy(deep=True)
+
+    def _refresh(self) -> "_StoreState":
+        mtime = os.stat(self.path).st_mtime_ns
+        state = self._state
+        if state is not None and state.mtime == mtime:
+            return state
+        with self._lock:
+            state = self._state
+            if state is not None and state.mtime == mtime:
+                return state
+            records = JsonUtils.read_json_file(self.path)
+            indexes: Dict[str, Dict[Any, int]] = {f: {} for f in self.index_fields}
+            for position, record in enumerate(records):
+                for field, index in indexes.items():
+                    value = record.get(field)
+                    if value is not None:
+                        # Keep the first occurrence, like the linear scan did
+                        index.setdefault(value, position)
+            self._state = _StoreState(mtime, records, indexes, {})
+            return self._state
+
+
+class _StoreState(NamedTuple):
+    """One loaded version of the file."""
+
+    mtime: int
+    records: List[Dict[str, Any]]
+    indexes: Dict[str, Dict[Any, int]]
+    models: Dict[int, Any]
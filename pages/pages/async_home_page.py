@@ -0,0 +1,69 @@
+from playwright.async_api import Page
+
+from core.page.async_base_page import AsyncBasePage
+from pages.locators.home_page_locators import HomePageLocators
+from pages.pages.home_page import HomePage
+
+
+class AsyncHomePage(AsyncBasePage):
+    PATH = HomePage.PATH
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    async def open(self, base_url: str):
+        """Navigate straight to the home page (requires an authenticated context).
+
+        Args:
+            base_url (str): The application base URL.
+
+        Returns:
+            AsyncHomePage: The current instance.
+        """
+        await self.goto(f"{base_url.rstrip('/')}{self.PATH}")
+        return self
+
+    async def verify_header_displayed(self, expected_title: str):
+        """Verify the title, burger and cart buttons in one browser round trip.
+
+        Args:
+            expected_title (str): The expected title of the page.
+
+        Returns:
+            AsyncHomePage: The current instance.
+        """
+        await self.wait_for_elements(
+            [HomePageLocators.BUGER_BTN, HomePageLocators.SHOPPING_CART_BTN],
+            texts={HomePageLocators.PAGE_TITLE_LBL: expected_title},
+        )
+        return self
+
+    async def verify_page_title(self, expected_title: str):
+        """Verify the page title matches the expected title.
+
+        Args:
+            expected_title (str): The expected title of the page.
+
+        Returns:
+            AsyncHomePage: The current instance.
+        """
+        await self.expect_element_text(HomePageLocators.PAGE_TITLE_LBL, expected_title)
+        return self
+
+    async def verify_burger_button_visible(self):
+        """Verify the burger button is visible on the page.
+
+        Returns:
+            AsyncHomePage: The current instance.
+        """
+        await self.expect_element_visible(HomePageLocators.BUGER_BTN)
+        return self
+
+    async def verify_shopping_cart_button_visible(self):
+        """Verify the shopping cart button is visible on the page.
+
+        Returns:
+            AsyncHomePage: The current instance.
+        """
+        await self.expect_element_visible(HomePageLocators.SHOPPING_CART_BTN)
+        return self
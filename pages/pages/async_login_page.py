@@ -0,0 +1,34 @@
+from playwright.async_api import Page
+
+from configs.configs import Configs
+from core.page.async_base_page import AsyncBasePage
+from pages.locators.login_page_locators import LoginPageLocators
+
+
+class AsyncLoginPage(AsyncBasePage):
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    async def login(self, username: str = None, password: str = None):
+        """Log in, with the configured credentials unless others are given."""
+        await self.fill_username(username or Configs().AUTH_USERNAME)
+        await self.fill_password(password or Configs().AUTH_PASSWORD)
+        await self.click_login_button()
+        return self
+
+    async def is_displayed(self) -> bool:
+        """Return True when the login form is shown, e.g. after a session expired."""
+        return await self.locator(LoginPageLocators.LOGIN_BTN).count() > 0
+
+    async def fill_username(self, username: str):
+        await self.fill_input(LoginPageLocators.USERNAME_TXT, username)
+        return self
+
+    async def fill_password(self, password: str):
+        await self.fill_input(LoginPageLocators.PASSWORD_TXT, password)
+        return self
+
+    async def click_login_button(self):
+        await self.click_element(LoginPageLocators.LOGIN_BTN)
+        return self
@@ -0,0 +1,45 @@
+"""Page factory module for managing async page objects."""
+
+from playwright.async_api import Page
+
+from pages.pages.async_home_page import AsyncHomePage
+from pages.pages.async_login_page import AsyncLoginPage
+
+
+class AsyncPages:
+    """Factory class for creating and managing async page objects."""
+
+    def __init__(self, page: Page):
+        self._page = page
+        # Initialize pages on demand
+        self._login_page = None
+        self._home_page = None
+
+    @property
+    def login_page(self) -> AsyncLoginPage:
+        """Get login page instance.
+
+        Returns:
+            AsyncLoginPage: The login page object
+        """
+        if not self._login_page:
+            self._login_page = AsyncLoginPage(self._page)
+        return self._login_page
+
+    @property
+    def home_page(self) -> AsyncHomePage:
+        """Get home page instance.
+
+        Returns:
+            AsyncHomePage: The home page object
+        """
+        if not self._home_page:
+            self._home_page = AsyncHomePage(self._page)
+        return self._home_page
+
+    async def login_and_verify_home(self, base_url: str, expected_title: str):
+        """Smoke flow: open the login page, log in and verify the home header."""
+        await self.login_page.goto(base_url)
+        await self.login_page.login()
+        await self.home_page.verify_header_displayed(expected_title)
+        return self
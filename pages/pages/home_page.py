@@ -6,10 +6,24 @@ from pages.locators.home_page_locators import HomePageLocators
 
 
 class HomePage(BasePage):
+    PATH = "/inventory.html"
 
     def __init__(self, page: Page):
         super().__init__(page)
 
+    @allure.step("Open home page")
+    def open(self, base_url: str):
+        """Navigate straight to the home page (requires an authenticated context).
+
+        Args:
+            base_url (str): The application base URL.
+
+        Returns:
+            HomePage: The current instance for method chaining.
+        """
+        self.goto(f"{base_url.rstrip('/')}{self.PATH}")
+        return self
+
     @allure.step("Verify home page displays correctly")
     def verify_home_page_displays(self):
         expect(self.page.locator(HomePageLocators.PAGE_TITLE_LBL)).to_have_text(
@@ -19,6 +33,22 @@ class HomePage(BasePage):
         expect(self.page.locator(HomePageLocators.SHOPPING_CART_BTN)).to_be_visible()
         return self
 
+    @allure.step("Verify header shows '{expected_title}' with its buttons")
+    def verify_header_displayed(self, expected_title: str):
+        """Verify the title, burger and cart buttons in one browser round trip.
+
+        Args:
+            expected_title (str): The expected title of the page.
+
+        Returns:
+            HomePage: The current instance for method chaining.
+        """
+        self.wait_for_elements(
+            [HomePageLocators.BUGER_BTN, HomePageLocators.SHOPPING_CART_BTN],
+            texts={HomePageLocators.PAGE_TITLE_LBL: expected_title},
+        )
+        return self
+
     @allure.step("Verify page title is '{expected_title}'")
     def verify_page_title(self, expected_title: str):
         """Verify the page title matches the expected title.
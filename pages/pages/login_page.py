@@ -22,6 +22,10 @@ class LoginPage(BasePage):
         self.click_login_button()
         return self
 
+    def is_displayed(self) -> bool:
+        """Return True when the login form is shown, e.g. after a session expired."""
+        return self.locator(LoginPageLocators.LOGIN_BTN).count() > 0
+
     @allure.step("Fill username with {username}")
     def fill_username(self, username: str):
         self.fill_input(LoginPageLocators.USERNAME_TXT, username)
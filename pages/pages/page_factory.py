@@ -2,8 +2,8 @@
 
 from playwright.sync_api import Page
 
-from pages.home_page import HomePage
-from pages.login_page import LoginPage
+from pages.pages.home_page import HomePage
+from pages.pages.login_page import LoginPage
 
 
 class Pages:
@@ -0,0 +1,91 @@
+"""Async client for interacting with the IP Stack API."""
+
+import asyncio
+from typing import Iterable, List, Union
+
+from httpx import Response
+
+from configs.configs import Configs
+from core.api.async_base_request import AsyncBaseRequest
+from services.api.clients.ip_stack_api_client import MODE_RECORD, IpStackClient
+from services.api.endpoints.standard_ip_lookup_endpoint import IPEndpoints
+
+
+class AsyncIpStackClient(AsyncBaseRequest):
+    """Async client for interacting with the IP Stack API.
+
+    Use it as an async context manager so the connection pool is closed:
+
+        async with AsyncIpStackClient() as client:
+            responses = await client.get_basic_standard_ip_lookups(ips)
+    """
+
+    def __init__(self):
+        super().__init__(
+            base_url=IpStackClient.get_base_url(),
+            max_connections=Configs().API_MAX_CONNECTIONS,
+            concurrency=Configs().API_CONCURRENCY,
+            cache=IpStackClient.get_response_cache(),
+        )
+        self._access_key = Configs().IP_STACK_ACCESS_KEY
+        if Configs().IP_STACK_MODE == MODE_RECORD:
+            self.session.event_hooks["response"].append(self._archive_response)
+
+    @staticmethod
+    async def _archive_response(response: Response) -> None:
+        """Store the response in the shared replay archive."""
+        await response.aread()
+        IpStackClient.get_replay_archive().add(
+            response.request.method,
+            str(response.request.url),
+            response.status_code,
+            response.headers.get("Content-Type", "application/json"),
+            response.text,
+        )
+
+    async def get_basic_standard_ip_lookup(self, ip_address: str) -> Response:
+        """Get basic standard IP lookup information.
+
+        Args:
+            ip_address (str): The IP address to look up.
+
+        Returns:
+            Response: Raw API response.
+        """
+        return await self.get(
+            endpoint=IPEndpoints.get().LOOKUP.format(ip_address=ip_address),
+            params={"access_key": self._access_key},
+        )
+
+    async def get_hostname(self, ip_address: str) -> Response:
+        """Get hostname information for the given IP address.
+
+        Args:
+            ip_address (str): The IP address to look up.
+
+        Returns:
+            Response: Raw API response including hostname.
+        """
+        return await self.get(
+            endpoint=IPEndpoints.get().HOSTNAME.format(ip_address=ip_address),
+            params={"access_key": self._access_key},
+        )
+
+    async def get_basic_standard_ip_lookups(
+        self, ip_addresses: Iterable[str]
+    ) -> List[Union[Response, Exception]]:
+        """Look up many IP addresses concurrently.
+
+        Requests are bounded by the client's concurrency limit; a failed lookup
+        is returned in place of its response instead of cancelling the sweep.
+
+        Args:
+            ip_addresses (Iterable[str]): The IP addresses to look up.
+
+        Returns:
+            list: One response (or exception) per address, in input order.
+        """
+        return await asyncio.gather(
+            *(self.get_basic_standard_ip_lookup(ip) for ip in ip_addresses),
+            return_exceptions=True,
+        )
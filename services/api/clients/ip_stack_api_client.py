@@ -1,18 +1,98 @@
 """Client for interacting with the IP Stack API."""
 
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from configs.configs import Configs
 from core.api.base_request import BaseRequest
-from services.api.endpoints.standard_ip_lookup_endpoint import ip_endpoints
+from core.api.replay_archive import ReplayArchive
+from core.api.response_cache import ResponseCache
+from core.utils.json import JsonUtils
+from services.api.endpoints.standard_ip_lookup_endpoint import IPEndpoints
+from services.api.models.response.standard_ip_lookup.ip_response_model import IPResponse
+
+if TYPE_CHECKING:
+    from core.server.local_server import LocalServer
+
+# ipstack accepts at most 50 comma-separated addresses per bulk request
+BULK_LOOKUP_LIMIT = 50
+
+# IP_STACK_MODE values
+MODE_LIVE = "live"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
 
 
 class IpStackClient(BaseRequest):
     """Client for interacting with the IP Stack API."""
 
+    # Shared by every client in the process so lookups repeated across tests hit it
+    response_cache: Optional[ResponseCache] = None
+    # Shared recordings and the local server replaying them, see IP_STACK_MODE
+    replay_archive: Optional[ReplayArchive] = None
+    replay_server: Optional["LocalServer"] = None
+    _replay_lock = threading.RLock()
+
     def __init__(self):
-        super().__init__(base_url=Configs().IP_STACK_BASE_URL)
+        super().__init__(base_url=self.get_base_url(), cache=self.get_response_cache())
         self._access_key = Configs().IP_STACK_ACCESS_KEY
+        # Size the pool so every bulk worker keeps its own keep-alive connection
+        adapter = HTTPAdapter(pool_maxsize=Configs().API_MAX_CONNECTIONS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if Configs().IP_STACK_MODE == MODE_RECORD:
+            self.session.hooks["response"].append(self.get_replay_archive().record)
+
+    @classmethod
+    def get_base_url(cls) -> str:
+        """Return IP_STACK_BASE_URL, or the local replay server in replay mode."""
+        mode = Configs().IP_STACK_MODE
+        if mode not in (MODE_LIVE, MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"Unknown IP_STACK_MODE: {mode}")
+        if mode != MODE_REPLAY:
+            return Configs().IP_STACK_BASE_URL
+        # Only replay runs pay for the HTTP server import
+        from core.server.replay_server import replay_server
+
+        with cls._replay_lock:
+            if cls.replay_server is None:
+                archive = cls.get_replay_archive()
+                if not len(archive):
+                    raise FileNotFoundError(
+                        f"No recorded ipstack responses in {Configs().IP_STACK_ARCHIVE},"
+                        " run the suite once with IP_STACK_MODE=record"
+                    )
+                cls.replay_server = replay_server(
+                    archive,
+                    latency_ms=Configs().IP_STACK_REPLAY_LATENCY_MS,
+                    concurrency=Configs().IP_STACK_REPLAY_CONCURRENCY,
+                ).start()
+        return cls.replay_server.url
+
+    @classmethod
+    def get_replay_archive(cls) -> ReplayArchive:
+        """Return the shared archive; in record mode it is saved at exit."""
+        with cls._replay_lock:
+            if cls.replay_archive is None:
+                cls.replay_archive = ReplayArchive(Configs().IP_STACK_ARCHIVE)
+                if Configs().IP_STACK_MODE == MODE_RECORD:
+                    atexit.register(cls.replay_archive.save)
+        return cls.replay_archive
+
+    @classmethod
+    def get_response_cache(cls) -> Optional[ResponseCache]:
+        """Return the shared response cache, or None when API_CACHE_ENABLED is off."""
+        if not Configs().API_CACHE_ENABLED:
+            return None
+        if cls.response_cache is None:
+            cls.response_cache = ResponseCache.from_configs()
+        return cls.response_cache
 
     def get_basic_standard_ip_lookup(self, ip_address: str) -> Response:
         """Get basic standard IP lookup information.
@@ -24,7 +104,7 @@ class IpStackClient(BaseRequest):
             IPResponse: Parsed API response.
         """
         return self.get(
-            endpoint=ip_endpoints.LOOKUP.format(ip_address=ip_address),
+            endpoint=IPEndpoints.get().LOOKUP.format(ip_address=ip_address),
             params={"access_key": self._access_key},
         )
 
@@ -38,6 +118,83 @@ class IpStackClient(BaseRequest):
             IPResponse: Parsed API response including hostname.
         """
         return self.get(
-            endpoint=ip_endpoints.HOSTNAME.format(ip_address=ip_address),
+            endpoint=IPEndpoints.get().HOSTNAME.format(ip_address=ip_address),
             params={"access_key": self._access_key},
         )
+
+    def lookup_many(
+        self,
+        ip_addresses: Iterable[str],
+        chunk_size: int = BULK_LOOKUP_LIMIT,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Union[IPResponse, Exception]]]:
+        """Look up many IP addresses using ipstack bulk requests.
+
+        Addresses are deduplicated, split into comma-separated chunks and the
+        chunks are requested from a worker pool. Results are yielded as soon as
+        each chunk completes, so the order does not follow the input.
+
+        Args:
+            ip_addresses (Iterable[str]): The IP addresses to look up.
+            chunk_size (int): Addresses per bulk request, capped at the ipstack limit.
+            max_workers (int): Concurrent bulk requests. Defaults to API_CONCURRENCY.
+
+        Yields:
+            tuple: ``(ip, IPResponse)`` on success or ``(ip, exception)`` on failure.
+        """
+        stripped = (ip.strip() for ip in ip_addresses if ip)
+        unique_ips = list(dict.fromkeys(ip for ip in stripped if ip))
+        chunk_size = max(1, min(chunk_size, BULK_LOOKUP_LIMIT))
+        chunks = [
+            unique_ips[i : i + chunk_size]
+            for i in range(0, len(unique_ips), chunk_size)
+        ]
+        if not chunks:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or Configs().API_CONCURRENCY, len(chunks))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.get_basic_standard_ip_lookup, ",".join(chunk)
+                ): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                yield from self._unpack_bulk_result(futures[future], future)
+
+    def _unpack_bulk_result(
+        self, chunk: List[str], future
+    ) -> Iterator[Tuple[str, Union[IPResponse, Exception]]]:
+        """Map a finished bulk request back onto the addresses it covered.
+
+        A failed chunk (request errors, an open circuit, a passed deadline or a
+        body that is not JSON) is reported for each of its addresses so the
+        other chunks keep streaming.
+        """
+        try:
+            payload = future.result().json()
+        except Exception as error:
+            for ip in chunk:
+                yield ip, error
+            return
+
+        # A single address comes back as an object, several as a list
+        items = payload if isinstance(payload, list) else [payload]
+        if len(items) == 1 and isinstance(items[0], dict) and "error" in items[0]:
+            error = LookupError(f"ipstack error: {items[0]['error']}")
+            for ip in chunk:
+                yield ip, error
+            return
+
+        by_ip = {item.get("ip"): item for item in items if isinstance(item, dict)}
+        for ip in chunk:
+            item = by_ip.get(ip)
+            if item is None:
+                yield ip, LookupError(f"No result returned for '{ip}'")
+                continue
+            try:
+                yield ip, JsonUtils.read_json_as_model(item, IPResponse)
+            except ValidationError as error:
+                yield ip, error
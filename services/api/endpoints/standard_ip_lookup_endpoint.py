@@ -1,8 +1,8 @@
 """API endpoints configuration."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
-from configs.configs import Configs
 from core.utils.json import JsonUtils
 
 
@@ -28,6 +28,15 @@ class IPEndpoints:
             HOSTNAME=ip_stack.get("hostname"),
         )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get(cls) -> "IPEndpoints":
+        """Return the endpoints, read from disk on first use."""
+        return cls.init()
+
 
-# Initialize singleton instances
-ip_endpoints = IPEndpoints.init()
+def __getattr__(name: str):
+    # ``ip_endpoints`` used to be built at import time; resolve it on first use
+    if name == "ip_endpoints":
+        return IPEndpoints.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,64 @@
+from typing import Any, Dict, Iterable, Tuple
+
+from core.utils.columnar import ColumnarTable
+
+
 class IpModel:  # noqa: E501
     """Data model for IP information."""
 
+    __slots__ = (
+        "ip",
+        "type",
+        "continent_code",
+        "continent_name",
+        "country_code",
+        "country_name",
+        "region_code",
+        "region_name",
+        "city",
+        "zip",
+        "latitude",
+        "longitude",
+        "location",
+        "timezone",
+        "currency",
+        "connection",
+        "security",
+    )
+
     def __init__(self, data: dict):
-        self.ip = data.get("ip")
-        self.type = data.get("type")
-        self.continent_code = data.get("continent_code")
-        self.continent_name = data.get("continent_name")
-        self.country_code = data.get("country_code")
-        self.country_name = data.get("country_name")
-        self.region_code = data.get("region_code")
-        self.region_name = data.get("region_name")
-        self.city = data.get("city")
-        self.zip = data.get("zip")
-        self.latitude = data.get("latitude")
-        self.longitude = data.get("longitude")
-        self.location = data.get("location", {})
-        self.timezone = self.location.get("time_zone", {}) if self.location else {}
-        self.currency = self.location.get("currency", {}) if self.location else {}
-        self.connection = data.get("connection", {})
-        self.security = data.get("security", {})
+        for name, value in zip(self.__slots__, self.values(data)):
+            setattr(self, name, value)
+
+    @staticmethod
+    def values(data: dict) -> Tuple[Any, ...]:
+        """Return the field values of a raw IP record, in ``__slots__`` order."""
+        location = data.get("location") or {}
+        return (
+            data.get("ip"),
+            data.get("type"),
+            data.get("continent_code"),
+            data.get("continent_name"),
+            data.get("country_code"),
+            data.get("country_name"),
+            data.get("region_code"),
+            data.get("region_name"),
+            data.get("city"),
+            data.get("zip"),
+            data.get("latitude"),
+            data.get("longitude"),
+            location,
+            location.get("time_zone", {}),
+            location.get("currency", {}),
+            data.get("connection", {}),
+            data.get("security", {}),
+        )
+
+    @classmethod
+    def to_table(cls, records: Iterable[Dict[str, Any]]) -> ColumnarTable:
+        """Build a columnar table of IpModel field values from raw IP records.
+
+        The values are the ones an IpModel would hold, but no IpModel is
+        instantiated, so large record sets only cost one list or array per field.
+        """
+        return ColumnarTable.from_rows(cls.__slots__, map(cls.values, records))
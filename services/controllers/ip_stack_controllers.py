@@ -1,5 +1,7 @@
 import allure
 
+from core.utils.columnar import ColumnarTable
+
 from services.api.clients.ip_stack_api_client import IpStackClient
 from services.api.models.response.standard_ip_lookup.hostname_response_model import (
     HostnameResponse,
@@ -25,6 +27,39 @@ class IPStackController:
         assert response.status_code == 200
         return self.ip_client.convert_response_to_model(response, IPResponse)
 
+    @allure.step("Get IP information in bulk and convert to models")
+    def get_ip_info_models_api(self, ip_addresses):
+        """Return ``(ip, IPResponse | exception)`` pairs for many IP addresses.
+
+        The lookups run inside the step, in completion order.
+        """
+        return list(self.ip_client.lookup_many(ip_addresses))
+
+    @allure.step("Get IP information in bulk as a columnar table")
+    def get_ip_info_table_api(self, ip_addresses, columns=None):
+        """Collect bulk lookups into a ColumnarTable for bulk verification.
+
+        Failed lookups are attached to the report and fail the step.
+
+        Args:
+            ip_addresses: The IP addresses to look up.
+            columns: Model fields to keep, all IPResponse fields by default.
+        """
+        columns = columns or tuple(IPResponse.model_fields)
+        models, failures = [], {}
+        for ip, result in self.get_ip_info_models_api(ip_addresses):
+            if isinstance(result, IPResponse):
+                models.append(result)
+            else:
+                failures[ip] = repr(result)
+        if failures:
+            allure.attach(
+                name="Failed lookups",
+                body="\n".join(f"{ip}: {error}" for ip, error in failures.items()),
+            )
+        assert not failures, f"{len(failures)} IP lookups failed: {sorted(failures)}"
+        return ColumnarTable.from_objects(columns, models)
+
     @allure.step("Get hostname information for '{hostname}' and convert to model")
     def get_hostname_info_model_api(self, hostname):
         response = self.get_hostname_info_api(hostname)
@@ -1,12 +1,15 @@
-from typing import List
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 import allure
-from core.db.postgres_client import PostgresClient
+from core.utils.columnar import ColumnarTable
 from services.db.entites.user_entity import UserEntity
 from services.db.mock_data.clients.user_db_client import UserDBClient
 
+if TYPE_CHECKING:
+    from core.db.postgres_client import BulkResult, PostgresClient
+
 
 class UserController:
-    def __init__(self, db_client: PostgresClient):
+    def __init__(self, db_client: "PostgresClient"):
         self.db_client = db_client
 
     @allure.step("Get all user entities")
@@ -14,7 +17,33 @@ class UserController:
         result = UserDBClient(self.db_client).get_all_users()
         return [UserEntity(*r) for r in result]  # Alternative unpacking method
 
+    @allure.step("Get all users as a columnar table")
+    def get_all_user_table(self, itersize: int = 2000) -> ColumnarTable:
+        """Load every user into one column per field, streaming from the server."""
+        return ColumnarTable.from_rows(
+            UserEntity.COLUMNS, UserDBClient(self.db_client).iter_users(itersize)
+        )
+
+    def iter_user_entities(self, itersize: int = 2000) -> Iterator[UserEntity]:
+        """Stream user entities from a server-side cursor, ``itersize`` rows per fetch."""
+        for row in UserDBClient(self.db_client).iter_users(itersize):
+            yield UserEntity(*row)
+
+    def iter_user_entity_chunks(
+        self, chunk_size: int = 2000
+    ) -> Iterator[List[UserEntity]]:
+        """Stream user entities in lists of ``chunk_size`` for batch assertions."""
+        for rows in UserDBClient(self.db_client).iter_user_chunks(chunk_size):
+            yield [UserEntity(*row) for row in rows]
+
     @allure.step("Get user entity by id")
-    def get_user_entity_by_id(self, id: int) -> UserEntity:
+    def get_user_entity_by_id(self, id: int) -> Optional[UserEntity]:
+        """Return the user with ``id``, or None when there is no such user."""
         result = UserDBClient(self.db_client).get_user_by_id(id)
-        return UserEntity(*result)
+        return UserEntity(*result) if result is not None else None
+
+    @allure.step("Seed user entities in bulk")
+    def seed_user_entities(self, users: Iterable[UserEntity]) -> "BulkResult":
+        result = UserDBClient(self.db_client).upsert_users(users)
+        allure.attach(name="Bulk Seed", body=str(result))
+        return result
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class UserEntity:
     id: int
     name: str
     email: str
+
+    COLUMNS = ("id", "name", "email")
@@ -1,4 +1,4 @@
-from core.utils.json import JsonUtils
+from core.utils.json_store import JsonIndexStore
 from services.api.models.response.standard_ip_lookup.hostname_response_model import (
     HostnameResponse,
 )
@@ -6,26 +6,26 @@ from services.api.models.response.standard_ip_lookup.ip_response_model import IP
 
 
 class IpStackJsonClient:
-    ...
-
-    def get_hostname_info_model_api(self, ip: str) -> HostnameResponse:
-        """Fetch hostname information and convert to HostnameResponse model."""
-        host_names = JsonUtils.read_json_file_as_list_model(
+    def __init__(self):
+        self.host_names = JsonIndexStore.for_file(
             file_path="data/test_data/ip_stack/hostname.json",
             model_class=HostnameResponse,
+            index_fields=("ip", "hostname"),
         )
-        for host in host_names:
-            if host.ip == ip:
-                return host
-        return host_names[0]
-
-    def get_ip_info_model_api(self, ip: str) -> IPResponse:
-        """Fetch IP information and convert to IPResponse model."""
-        ip_infos = JsonUtils.read_json_file_as_list_model(
+        self.ip_infos = JsonIndexStore.for_file(
             file_path="data/test_data/ip_stack/lookup.json",
             model_class=IPResponse,
+            index_fields=("ip",),
         )
-        for info in ip_infos:
-            if info.ip == ip:
-                return info
-        return ip_infos[0]
+
+    def get_hostname_info_model_api(self, ip: str) -> HostnameResponse:
+        """Fetch hostname information and convert to HostnameResponse model."""
+        return self.host_names.get("ip", ip) or self.host_names.first()
+
+    def get_hostname_info_by_hostname(self, hostname: str) -> HostnameResponse:
+        """Fetch hostname information by hostname and convert to HostnameResponse model."""
+        return self.host_names.get("hostname", hostname) or self.host_names.first()
+
+    def get_ip_info_model_api(self, ip: str) -> IPResponse:
+        """Fetch IP information and convert to IPResponse model."""
+        return self.ip_infos.get("ip", ip) or self.ip_infos.first()
@@ -1,29 +1,92 @@
-from typing import List
-from core.db.postgres_client import PostgresClient
+import logging
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 from services.db.entites.user_entity import UserEntity
 
+if TYPE_CHECKING:
+    # Annotations only, so importing the client does not load psycopg2
+    from core.db.postgres_client import BulkResult, PostgresClient
+
+logger = logging.getLogger(__name__)
+
 
 class UserDBClient:
-    def __init__(self, db_client: PostgresClient):
+    def __init__(self, db_client: "PostgresClient"):
         self.db_client = db_client
+        self.db_client.prepare(
+            "user_by_id", "SELECT id, name, email FROM users WHERE id = $1"
+        )
 
     def get_all_users(self) -> List[tuple]:
         return self.db_client.execute_query("SELECT id, name, email FROM users")
 
-    def get_user_by_id(self, id: int) -> tuple:
-        return self.db_client.execute_query(
-            f"SELECT id, name, email FROM users WHERE id = {id}"
+    def iter_users(self, itersize: int = 2000) -> Iterator[tuple]:
+        return self.db_client.stream_query(
+            "SELECT id, name, email FROM users ORDER BY id", itersize=itersize
         )
 
+    def iter_user_chunks(self, chunk_size: int = 2000) -> Iterator[List[tuple]]:
+        return self.db_client.stream_query_chunks(
+            "SELECT id, name, email FROM users ORDER BY id", chunk_size=chunk_size
+        )
+
+    def get_user_by_id(self, id: int) -> Optional[tuple]:
+        rows = self.db_client.execute_prepared("user_by_id", (id,))
+        return rows[0] if rows else None
+
     def create_user(self, user: UserEntity) -> None:
         self.db_client.execute_query(
-            f"INSERT INTO users (id, name, email) VALUES ({user.id}, {user.name}, {user.email})"
+            "INSERT INTO users (id, name, email) VALUES (%s, %s, %s)",
+            (user.id, user.name, user.email),
         )
 
     def update_user(self, user: UserEntity) -> None:
         self.db_client.execute_query(
-            f"UPDATE users SET name = {user.name}, email = {user.email} WHERE id = {user.id}"
+            "UPDATE users SET name = %s, email = %s WHERE id = %s",
+            (user.name, user.email, user.id),
         )
 
     def delete_user(self, id: int) -> None:
-        self.db_client.execute_query(f"DELETE FROM users WHERE id = {id}")
+        self.db_client.execute_query("DELETE FROM users WHERE id = %s", (id,))
+
+    def create_users(
+        self, users: Iterable[UserEntity], chunk_size: int = 10000
+    ) -> "BulkResult":
+        """Insert many users with COPY, ``chunk_size`` rows per buffer."""
+        result = self.db_client.copy_rows(
+            "users",
+            ("id", "name", "email"),
+            ((user.id, user.name, user.email) for user in users),
+            chunk_size=chunk_size,
+        )
+        logger.info("create_users: %s", result)
+        return result
+
+    def upsert_users(
+        self, users: Iterable[UserEntity], chunk_size: int = 1000
+    ) -> "BulkResult":
+        """Insert or update many users with multi-row statements.
+
+        Only the last row of each id is sent, since one statement may not
+        update the same row twice.
+        """
+        latest = {user.id: user for user in users}
+        result = self.db_client.execute_batch_values(
+            "INSERT INTO users (id, name, email) VALUES %s "
+            "ON CONFLICT (id) DO UPDATE "
+            "SET name = EXCLUDED.name, email = EXCLUDED.email",
+            ((user.id, user.name, user.email) for user in latest.values()),
+            chunk_size=chunk_size,
+        )
+        logger.info("upsert_users: %s", result)
+        return result
+
+    def delete_users(self, ids: Iterable[int], chunk_size: int = 10000) -> "BulkResult":
+        """Delete many users, one ``DELETE ... USING (VALUES ...)`` per chunk."""
+        result = self.db_client.execute_batch_values(
+            "DELETE FROM users USING (VALUES %s) AS doomed (id) "
+            "WHERE users.id = doomed.id",
+            ((id,) for id in ids),
+            chunk_size=chunk_size,
+        )
+        logger.info("delete_users: %s", result)
+        return result
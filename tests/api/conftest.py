@@ -1,14 +1,32 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+The database client is imported by the fixture that uses it, so collecting
+the API suite does not load psycopg2 (nor Playwright with ``-p no:playwright``).
+requests and pydantic are still loaded by the test modules.
+"""
+
+import sys
 
 import pytest
-from core.db.postgres_client import PostgresClient
 
 from configs.configs import Configs
 
 
+def pytest_terminal_summary(terminalreporter):
+    """Report IP Stack response cache usage when the cache is enabled."""
+    client_module = sys.modules.get("services.api.clients.ip_stack_api_client")
+    if client_module is None:
+        return
+    cache = client_module.IpStackClient.response_cache
+    if cache is not None:
+        terminalreporter.write_sep("-", "ipstack response cache")
+        terminalreporter.write_line(str(cache.stats.as_dict()))
+
+
 @pytest.fixture(scope="session")
 def db_client():
-    """Fixture to provide a database client."""
+    """Fixture to provide a pooled database client shared by the session."""
+    from core.db.postgres_client import PostgresClient
 
     db = PostgresClient(
         host=Configs().DB_HOST,
@@ -16,7 +34,17 @@ def db_client():
         user=Configs().DB_USER,
         password=Configs().DB_PASSWORD,
         db=Configs().DB_NAME,
-    )  # Ensure to close the connection after tests are done
+        min_connections=Configs().DB_POOL_MIN,
+        max_connections=Configs().DB_POOL_MAX,
+        checkout_timeout=Configs().DB_POOL_TIMEOUT,
+    )  # Ensure to close the pool after tests are done
 
     yield db
     db.close()
+
+
+@pytest.fixture
+def db_connection(db_client):
+    """Fixture to check a connection out of the pool for one test."""
+    with db_client.connection() as conn:
+        yield conn
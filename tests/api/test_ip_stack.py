@@ -21,6 +21,15 @@ class TestIPStack:
 
         self.ip_stack.verify_ip_info_is_same(ip_response, ip_data)
 
+    def test_bulk_ip_lookup(self):
+        """Test bulk IP lookup streams one model per unique IP."""
+        ip_addresses = ["134.201.250.155", "134.201.250.155"]
+        results = dict(self.ip_stack.get_ip_info_models_api(ip_addresses))
+
+        assert list(results) == ["134.201.250.155"]
+        ip_data = self.ip_stack.get_ip_info_json("134.201.250.155")
+        self.ip_stack.verify_ip_info_is_same(results["134.201.250.155"], ip_data)
+
     def test_hostname_lookup(self):
         """Test IP lookup with hostname."""
         hostname_response = self.ip_stack.get_hostname_info_model_api("8.8.8.8")
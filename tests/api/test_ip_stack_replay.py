@@ -0,0 +1,151 @@
+"""Tests for the IP Stack replay server."""
+
+import copy
+import gzip
+import json
+
+import pytest
+from requests import HTTPError
+
+from configs.configs import Configs
+from core.api.replay_archive import ReplayArchive
+from core.server.replay_server import replay_server
+from services.api.clients import ip_stack_api_client
+from services.api.clients.ip_stack_api_client import IpStackClient
+from services.controllers.ip_stack_controllers import IPStackController
+
+
+@pytest.fixture(scope="module")
+def ip_stack_replay(tmp_path_factory):
+    """Local server replaying the JSON fixtures as recorded ipstack responses."""
+    archive = ReplayArchive(tmp_path_factory.mktemp("replay") / "ip_stack.json.gz")
+    for name, path in (
+        ("lookup", "/{ip}"),
+        ("hostname", "/{ip}?hostname=1"),
+    ):
+        with open(f"data/test_data/ip_stack/{name}.json") as f:
+            for item in json.load(f):
+                archive.add(
+                    "GET",
+                    path.format(ip=item["ip"]),
+                    200,
+                    "application/json",
+                    json.dumps(item),
+                )
+    with replay_server(archive, latency_ms=5, concurrency=4) as server:
+        yield server
+
+
+class TestIPStackReplay:
+    """Test cases for IP Stack API served from recordings."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, ip_stack_replay):
+        """Fixture providing an IP Stack controller pointed at the replay server."""
+        self.ip_stack = IPStackController()
+        self.ip_stack.ip_client.base_url = ip_stack_replay.url
+
+    def test_replayed_ip_lookup(self):
+        """Test IP lookup answered from the archive."""
+        ip_response = self.ip_stack.get_ip_info_model_api("134.201.250.155")
+        ip_data = self.ip_stack.get_ip_info_json("134.201.250.155")
+
+        self.ip_stack.verify_ip_info_is_same(ip_response, ip_data)
+
+    def test_replayed_hostname_lookup(self):
+        """Test hostname lookup answered from the archive."""
+        hostname_response = self.ip_stack.get_hostname_info_model_api("8.8.8.8")
+        hostname_data = self.ip_stack.get_hostname_info_json("8.8.8.8")
+
+        self.ip_stack.verify_hostname_info_is_same(hostname_response, hostname_data)
+
+    def test_unrecorded_request(self):
+        """Test a request that was never recorded is reported as such."""
+        with pytest.raises(HTTPError) as error:
+            self.ip_stack.get_ip_info_api("10.0.0.1")
+
+        assert error.value.response.status_code == 404
+        assert error.value.response.json()["error"]["type"] == "not_recorded"
+
+    def test_replayed_bulk_lookup_skips_blank_addresses(self):
+        """Test bulk lookup strips addresses and ignores blank ones."""
+        results = self.ip_stack.get_ip_info_models_api(
+            [" 134.201.250.155 ", "   ", "", "134.201.250.155"]
+        )
+
+        assert [ip for ip, _ in results] == ["134.201.250.155"]
+        ip_data = self.ip_stack.get_ip_info_json("134.201.250.155")
+        self.ip_stack.verify_ip_info_is_same(results[0][1], ip_data)
+
+
+class TestIpStackModes:
+    """Test cases for IP_STACK_MODE record and replay."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        """Fixture giving every test fresh shared client state and its own archive."""
+        self.monkeypatch = monkeypatch
+        self.archive_path = tmp_path / "ip_stack.json.gz"
+        self.saved_at_exit = []
+        monkeypatch.setattr(IpStackClient, "replay_archive", None)
+        monkeypatch.setattr(IpStackClient, "replay_server", None)
+        monkeypatch.setattr(
+            ip_stack_api_client.atexit, "register", self.saved_at_exit.append
+        )
+        yield
+        if IpStackClient.replay_server is not None:
+            IpStackClient.replay_server.stop()
+
+    def use_mode(self, mode: str, base_url: str = "") -> None:
+        configs = copy.copy(Configs())
+        configs.IP_STACK_MODE = mode
+        configs.IP_STACK_ARCHIVE = str(self.archive_path)
+        configs.IP_STACK_ACCESS_KEY = "secret"
+        configs.IP_STACK_REPLAY_LATENCY_MS = 0.0
+        configs.API_CACHE_ENABLED = False
+        if base_url:
+            configs.IP_STACK_BASE_URL = base_url
+        self.monkeypatch.setattr(ip_stack_api_client, "Configs", lambda: configs)
+
+    def test_record_mode_saves_responses_without_access_key(self, ip_stack_replay):
+        """Test responses are recorded and saved at exit, keyed without secrets."""
+        self.use_mode("record", base_url=ip_stack_replay.url)
+        client = IpStackClient()
+
+        response = client.get_basic_standard_ip_lookup("134.201.250.155")
+        for save in self.saved_at_exit:
+            save()
+
+        assert client.base_url == ip_stack_replay.url
+        archive = ReplayArchive(str(self.archive_path))
+        assert archive.get("GET", "/134.201.250.155")["body"] == response.text
+        assert b"secret" not in gzip.decompress(self.archive_path.read_bytes())
+
+    def test_replay_mode_serves_the_archive(self):
+        """Test get_base_url starts a local server answering from the archive."""
+        archive = ReplayArchive(str(self.archive_path))
+        archive.add("GET", "/8.8.8.8", 200, "application/json", '{"ip": "8.8.8.8"}')
+        archive.save()
+        self.use_mode("replay")
+
+        base_url = IpStackClient.get_base_url()
+        response = IpStackClient().get_basic_standard_ip_lookup("8.8.8.8")
+
+        assert base_url.startswith("http://127.0.0.1")
+        assert IpStackClient.get_base_url() == base_url
+        assert response.json() == {"ip": "8.8.8.8"}
+        assert self.saved_at_exit == []
+
+    def test_replay_mode_without_recordings(self):
+        """Test replaying an empty archive asks for a recording run."""
+        self.use_mode("replay")
+
+        with pytest.raises(FileNotFoundError, match="IP_STACK_MODE=record"):
+            IpStackClient.get_base_url()
+
+    def test_unknown_mode(self):
+        """Test a misspelled mode is rejected."""
+        self.use_mode("replya")
+
+        with pytest.raises(ValueError, match="Unknown IP_STACK_MODE"):
+            IpStackClient.get_base_url()
@@ -0,0 +1,14 @@
+"""Tests for pytest startup cost of the API suite."""
+
+from benchmarks.bench_startup import DEFAULT_FORBIDDEN, profile_collection
+
+
+class TestStartup:
+    """Test cases for import-light collection."""
+
+    def test_api_collection_imports(self):
+        """Test the API suite collects without loading Playwright or psycopg2."""
+        profile = profile_collection(["tests/api"], ["-p", "no:playwright"])
+
+        for package in DEFAULT_FORBIDDEN:
+            assert not profile.imported(package), f"{package} imported at collection"
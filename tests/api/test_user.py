@@ -21,3 +21,12 @@ class TestUserDb:
         allure.attach(name="User 1", body=str(users[1]))
         assert users[0].name == "Alice"
         assert users[1].name == "Bob"
+
+    @pytest.mark.skip(reason="Skipping test")
+    def test_users_data_streamed(self):
+        users = sorted(self.user_controller.get_all_user_entities(), key=lambda u: u.id)
+        streamed = list(self.user_controller.iter_user_entities(itersize=1))
+        chunks = list(self.user_controller.iter_user_entity_chunks(chunk_size=1))
+        allure.step("Verify streamed users match the full result")
+        assert streamed == users
+        assert [chunk[0] for chunk in chunks] == users
@@ -1,11 +1,244 @@
 """Pytest configuration and fixtures."""
 
-from datetime import datetime
+import json
+import os
+import re
+import time
+from pathlib import Path
 
 import allure
 import pytest
 
 from configs.configs import Configs
+from core.page.browser_pool import BrowserPool
+from core.page.failure_capture import ArtifactWriter, FailureCapture
+from core.page.network_router import NetworkRouter, StaticAssetCache
+from core.page.step_log import StepLog
+from core.page.step_timing import StepTimings
+from core.page.trace_capture import ArtifactRing, TraceCapture
+from core.page.storage_state_cache import StorageStateCache
+from pages.locators.home_page_locators import HomePageLocators
+from pages.pages.home_page import HomePage
+from pages.pages.login_page import LoginPage
+
+
+@pytest.fixture(scope="session")
+def browser_pool(launch_browser):
+    """One browser per xdist worker, shared by every test of that worker.
+
+    Launched through pytest-playwright's ``launch_browser``, so --browser,
+    --headed, launch args and ``connect_options`` all apply.
+    """
+    pool = BrowserPool(launch_browser)
+    yield pool
+    pool.write_timings("reports/setup_timings")
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser(browser_pool):
+    """Serve pytest-playwright's contexts from the worker's pooled browser."""
+    return browser_pool.browser
+
+
+@pytest.fixture(scope="session")
+def asset_cache():
+    """On-disk static asset cache, None when UI_ASSET_CACHE_DIR is empty."""
+    directory = Configs().UI_ASSET_CACHE_DIR
+    if not directory:
+        return None
+    return StaticAssetCache(directory, Configs().UI_ASSET_CACHE_TTL)
+
+
+@pytest.fixture
+def network_router(request, asset_cache):
+    """Per-test router; what it saved is attached to the report."""
+    router = NetworkRouter.from_configs(asset_cache)
+    yield router
+    if router.enabled:
+        savings = router.stats.as_dict()
+        request.node.user_properties.append(("network_savings", savings))
+        allure.attach(
+            json.dumps(savings, indent=4),
+            name="Network Savings",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="session")
+def artifact_writer():
+    """Background writer for failure artifacts, drained at the end of the run."""
+    writer = ArtifactWriter("reports/screenshots")
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def failure_capture(artifact_writer):
+    """Captures the test's pages if it fails, see UI_FAILURE_* settings.
+
+    The captured files are attached to the report once they are written.
+    """
+    configs = Configs()
+    capture = FailureCapture(
+        artifact_writer,
+        mode=configs.UI_FAILURE_CAPTURE,
+        image_type=configs.UI_SCREENSHOT_TYPE,
+        quality=configs.UI_SCREENSHOT_QUALITY,
+        full_page=configs.UI_SCREENSHOT_FULL_PAGE,
+    )
+    yield capture
+    capture.attach()
+
+
+@pytest.fixture(scope="session")
+def capture_rings():
+    """Ring buffers keeping the last UI_CAPTURE_KEEP traces/HAR files and videos.
+
+    One directory per xdist worker, so workers never prune each other's files.
+    """
+    configs = Configs()
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return (
+        ArtifactRing(configs.UI_CAPTURE_DIR, configs.UI_CAPTURE_KEEP, worker),
+        ArtifactRing("reports/videos", configs.UI_CAPTURE_KEEP, worker),
+    )
+
+
+@pytest.fixture
+def trace_capture(request, capture_rings):
+    """Trace/HAR/video recording of the test, following UI_CAPTURE_MODE."""
+    capture = TraceCapture.from_configs(*capture_rings)
+    capture.begin(
+        re.sub(r"[^A-Za-z0-9_.-]+", "_", request.node.name),
+        retry=getattr(request.node, "execution_count", 1) > 1,
+    )
+    yield capture
+    # Runs after the contexts are closed, when HAR files and videos are saved
+    report = getattr(request.node, "rep_call", None)
+    capture.finish(failed=bool(report and report.failed))
+
+
+@pytest.fixture
+def new_context(
+    trace_capture, new_context, browser_pool, network_router, failure_capture
+):
+    """pytest-playwright's context factory with routing and artifact capture.
+
+    Every context of a test, including pytest-playwright's ``context``, is
+    created here and its creation time recorded in the worker's pool.
+    ``trace_capture`` comes first so it is torn down after the contexts close.
+    """
+
+    def factory(**kwargs):
+        started = time.perf_counter()
+        context = new_context(**{**trace_capture.context_args(), **kwargs})
+        browser_pool.record_context(time.perf_counter() - started)
+        network_router.attach(context)
+        failure_capture.watch(context)
+        trace_capture.watch(context)
+        return context
+
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def step_log(request):
+    """Buffer page actions during the test and attach them when it ends."""
+    log = StepLog.start(Configs().UI_STEP_LOG)
+    yield log
+    report = getattr(request.node, "rep_call", None)
+    log.close(failed=bool(report and report.failed))
+
+
+@pytest.fixture(scope="session")
+def timing_export():
+    """Step timings of every test, written as JSON for trend tracking."""
+    tests = []
+    yield tests
+    path = Path("reports/timings")
+    path.mkdir(parents=True, exist_ok=True)
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    (path / f"{worker}.json").write_text(json.dumps(tests, indent=4))
+
+
+@pytest.fixture(autouse=True)
+def step_timings(request, timing_export):
+    """Time page-object steps; budgets come from ``@pytest.mark.budget``."""
+    timings = StepTimings.start(request.node.nodeid, Configs().UI_WEB_VITALS)
+    for marker in request.node.iter_markers("budget"):
+        timings.budget(*marker.args)
+    yield timings
+    timings.stop()
+    if timings.records:
+        timing_export.append(timings.as_dict())
+        allure.attach(
+            json.dumps(timings.as_dict(), indent=4),
+            name="Step Timings",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Fail a passing test whose steps exceeded their budgets.
+
+    Only steps of the test body count, fixture setup and teardown do not.
+    """
+    timings = StepTimings.active()
+    if timings is not None:
+        timings.phase = "call"
+    outcome = yield
+    if timings is not None:
+        timings.phase = "teardown"
+    if outcome.excinfo is None and timings is not None:
+        try:
+            timings.check_budgets()
+        except AssertionError as error:
+            outcome.force_exception(error)
+
+
+@pytest.fixture(scope="session")
+def storage_state_cache():
+    """Authenticated storage states shared by every worker of the run."""
+    return StorageStateCache(Configs().AUTH_STATE_DIR, Configs().AUTH_STATE_TTL)
+
+
+def _login_storage_state(new_context, storage_state_cache, user, env):
+    """Log in through the UI once and save the resulting storage state."""
+    context = new_context()
+    page = context.new_page()
+    login_page = LoginPage(page)
+    login_page.goto(Configs().BASE_URL)
+    login_page.login()
+    login_page.wait_for_element(HomePageLocators.PAGE_TITLE_LBL)
+    state = storage_state_cache.save(context, user, env)
+    context.close()
+    return state
+
+
+@pytest.fixture
+def authenticated_page(new_context, storage_state_cache):
+    """Page that starts on the home page, seeded from the cached login state.
+
+    The cached state is dropped when the login page shows up, so an expired
+    session triggers a fresh UI login.
+    """
+    user = Configs().AUTH_USERNAME
+    env = os.getenv("ACTIVE_ENV", "dev")
+    state = storage_state_cache.get(user, env)
+    if state is None:
+        state = _login_storage_state(new_context, storage_state_cache, user, env)
+    page = new_context(storage_state=state).new_page()
+    HomePage(page).open(Configs().BASE_URL)
+    if LoginPage(page).is_displayed():
+        storage_state_cache.invalidate(user, env)
+        state = _login_storage_state(new_context, storage_state_cache, user, env)
+        page = new_context(storage_state=state).new_page()
+        HomePage(page).open(Configs().BASE_URL)
+    yield page
+    if not page.is_closed() and LoginPage(page).is_displayed():
+        storage_state_cache.invalidate(user, env)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -13,17 +246,22 @@ def pytest_runtest_makereport(item):
     """Generate test report."""
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+    # Attach the buffered page actions while the failure is being reported
+    if rep.failed and StepLog.active() is not None:
+        StepLog.active().flush(failed=True)
 
-    # Take screenshot on test failure
-    if rep.when == "call" and rep.failed:
-        page = item.funcargs.get("page")
-        if page:
-            now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            file_name = f"reports/screenshots/{item.name}_{now}.png"
-            page.screenshot(path=file_name)
-            print(f"Screenshot saved: {file_name}")
-            allure.attach(
-                file_name,
-                name="Screenshot on failure",
-                attachment_type=allure.attachment_type.PNG,
-            )
+    # Capture the test's pages on failure, files are written in the background
+    capture = item.funcargs.get("failure_capture")
+    if rep.when == "call" and capture is not None:
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", item.name)
+        if rep.failed:
+            try:
+                capture.capture(name)
+            except Exception as error:
+                # Never let a broken capture hide the test's own failure
+                rep.sections.append(("Failure capture", f"Capture failed: {error!r}"))
+    traces = item.funcargs.get("trace_capture")
+    if rep.when == "call" and traces is not None:
+        traces.stop_traces(failed=rep.failed)
@@ -0,0 +1,33 @@
+"""Load smoke test against the local saucedemo stand-in."""
+
+import json
+
+import allure
+
+from core.page.async_base_page import run_async
+from core.page.load_runner import LoadProfile, LoadRunner
+from core.server.saucedemo_stub import saucedemo_stub
+from tests.ui.test_base import BaseTest
+
+
+class TestSauceDemoLoad(BaseTest):
+    """Replays the smoke flow with a few concurrent virtual users."""
+
+    def test_smoke_flow_under_load(self):
+        """Test the smoke flow stays error free with concurrent users."""
+        profile = LoadProfile(users=4, ramp_up=1, duration=2)
+        with saucedemo_stub() as server:
+            report = run_async(LoadRunner(server.url, profile=profile).run())
+        allure.attach(str(report), name="Load Report")
+        allure.attach(
+            json.dumps(report.as_dict(), indent=4),
+            name="Load Report JSON",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert report.successful_iterations >= profile.users
+        assert report.error_rate == 0, report
+        assert {step.name for step in report.steps} == {
+            "open_login",
+            "login",
+            "verify_home",
+        }
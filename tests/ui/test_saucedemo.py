@@ -19,9 +19,23 @@ class TestSauceDemo(BaseTest):
         self.home_page = HomePage(page)
         self.login_page.goto(Configs().BASE_URL)
 
+    @pytest.mark.budget("LoginPage.login", 5)
     def test_login(self):
         """Test the login functionality."""
         self.login_page.login()
         self.home_page.verify_page_title(
             "Swag Labs"
         ).verify_burger_button_visible().verify_shopping_cart_button_visible()
+
+
+class TestSauceDemoAuthenticated(BaseTest):
+    """Test cases starting from an already authenticated home page."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, authenticated_page: Page):
+        """Setup runs before each test."""
+        self.home_page = HomePage(authenticated_page)
+
+    def test_home_page_authenticated(self):
+        """Test the home page is reachable without logging in again."""
+        self.home_page.verify_header_displayed("Swag Labs")
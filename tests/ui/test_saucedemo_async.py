@@ -0,0 +1,62 @@
+"""Concurrent test suite for SauceDemo, driven by the async page objects."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from playwright.async_api import async_playwright
+
+from configs.configs import Configs
+from core.page.async_base_page import run_async
+from pages.pages.async_page_factory import AsyncPages
+from tests.ui.test_base import BaseTest
+
+CONCURRENT_USERS = 10
+
+
+async def login_users(
+    users: int,
+    browser_name: str,
+    launch_args: Dict[str, Any],
+    connect_options: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Log in ``users`` times concurrently, one context each in a single browser.
+
+    The browser is started like pytest-playwright's ``launch_browser`` does,
+    so --browser, --headed and ``connect_options`` apply here too.
+    """
+    async with async_playwright() as playwright:
+        browser_type = getattr(playwright, browser_name)
+        if connect_options:
+            browser = await browser_type.connect(**connect_options)
+        else:
+            browser = await browser_type.launch(**launch_args)
+
+        async def login_user():
+            context = await browser.new_context()
+            try:
+                pages = AsyncPages(await context.new_page())
+                await pages.login_and_verify_home(Configs().BASE_URL, "Swag Labs")
+            finally:
+                await context.close()
+
+        try:
+            await asyncio.gather(*(login_user() for _ in range(users)))
+        finally:
+            await browser.close()
+
+
+class TestSauceDemoAsync(BaseTest):
+    """Test cases running many users from one event loop."""
+
+    def test_concurrent_logins(
+        self, browser_name, browser_type_launch_args, connect_options
+    ):
+        """Test several users can log in and reach the home page concurrently."""
+        run_async(
+            login_users(
+                CONCURRENT_USERS,
+                browser_name,
+                browser_type_launch_args,
+                connect_options,
+            )
+        )
@@ -0,0 +1,70 @@
+"""Tests for AsyncBaseRequest retries, breaker and cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from core.api.async_base_request import AsyncBaseRequest
+from core.api.resilience import CircuitBreaker, RetryPolicy
+from core.api.response_cache import ResponseCache
+
+
+def make_client(statuses, cache=None):
+    """Client whose transport answers with ``statuses`` in order."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(statuses.pop(0), json={"ip": request.url.path})
+
+    client = AsyncBaseRequest(
+        "http://api.example.com",
+        cache=cache,
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0, jitter=0),
+        circuit_breaker=CircuitBreaker(),
+    )
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+async def call(client, method, endpoint):
+    async with client:
+        return await client.request(method, endpoint)
+
+
+class TestAsyncBaseRequest:
+    """Test cases for AsyncBaseRequest."""
+
+    def test_get_is_retried(self):
+        """Test a GET is retried on retryable statuses like the sync client."""
+        client, calls = make_client([503, 200])
+
+        response = asyncio.run(call(client, "GET", "ip"))
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert client.circuit_breaker.failures == 0
+
+    def test_post_is_not_retried(self):
+        """Test non-idempotent requests are sent once and reach the breaker."""
+        client, calls = make_client([503, 200])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(call(client, "POST", "users"))
+
+        assert len(calls) == 1
+        assert client.circuit_breaker.failures == 1
+
+    def test_get_is_served_from_the_shared_cache(self):
+        """Test a cached GET does not reach the upstream."""
+        cache = ResponseCache()
+        client, calls = make_client([200], cache=cache)
+        asyncio.run(call(client, "GET", "1.1.1.1"))
+        client, calls = make_client([], cache=cache)
+
+        response = asyncio.run(call(client, "GET", "1.1.1.1"))
+
+        assert calls == []
+        assert response.json() == {"ip": "/1.1.1.1"}
+        assert cache.stats.hits == 1
@@ -0,0 +1,113 @@
+"""Tests for the API attachment policy."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from core.api.attachment_policy import AttachmentPolicy
+
+
+class FakeAttach:
+    """Stands in for allure.attach, keeping what would be attached."""
+
+    def __init__(self):
+        self.inline = []
+        self.files = []
+
+    def __call__(self, name, body):
+        self.inline.append((name, body))
+
+    def file(self, path, name, attachment_type):
+        self.files.append((name, Path(path).read_bytes()))
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    fake = FakeAttach()
+    monkeypatch.setattr(
+        "core.api.attachment_policy.allure",
+        SimpleNamespace(attach=fake, attachment_type=allure.attachment_type),
+    )
+    return fake
+
+
+class TestAttachmentPolicy:
+    """Test cases for AttachmentPolicy."""
+
+    def test_small_body_is_kept(self):
+        """Test bodies under the cap are attached unchanged."""
+        assert AttachmentPolicy(max_body_bytes=10).render("short") == "short"
+
+    def test_truncate_keeps_head(self):
+        """Test oversized bodies keep their head and report the full size."""
+        rendered = AttachmentPolicy(max_body_bytes=4).render(b"0123456789")
+
+        assert rendered.startswith(b"0123")
+        assert b"10 bytes in total" in rendered
+
+    def test_sample_keeps_head_and_tail(self):
+        """Test sampling keeps both ends of the body."""
+        rendered = AttachmentPolicy(max_body_bytes=4, oversize="sample").render(
+            "0123456789"
+        )
+
+        assert rendered.startswith("01") and rendered.endswith("89")
+        assert "6 bytes omitted" in rendered
+
+    @pytest.mark.parametrize("oversize", ["truncate", "sample"])
+    def test_zero_cap_keeps_nothing(self, oversize):
+        """Test a zero cap never lets the body through."""
+        rendered = AttachmentPolicy(max_body_bytes=0, oversize=oversize).render(
+            "0123456789"
+        )
+
+        assert "0123" not in rendered
+
+    def test_large_bodies_are_written_whole_to_a_file(self, attached):
+        """Test bodies above the file threshold skip truncation."""
+        policy = AttachmentPolicy(max_body_bytes=100, file_threshold_bytes=500)
+
+        policy.attach("Response Content", b"x" * 1000)
+
+        assert attached.files == [("Response Content", b"x" * 1000)]
+        assert attached.inline == []
+
+    def test_default_settings_spill_large_bodies(self, attached):
+        """Test the shipped API_ATTACH_* defaults reach the file path."""
+        body = "y" * (2 * 1024 * 1024)
+
+        AttachmentPolicy.from_configs().attach("Response Content", body)
+
+        ((name, data),) = attached.files
+        assert name == "Response Content"
+        assert len(data) == len(body)
+        assert attached.inline == []
+
+    def test_bodies_under_the_file_threshold_are_capped(self, attached):
+        """Test inline bodies are still truncated to max_body_bytes."""
+        policy = AttachmentPolicy(max_body_bytes=100, file_threshold_bytes=5000)
+
+        policy.attach("Response Content", b"x" * 1000)
+
+        ((name, body),) = attached.inline
+        assert body.startswith("x" * 100) and len(body) < 200
+        assert attached.files == []
+
+    def test_on_failure_mode_renders_lazily(self, attached):
+        """Test "on_failure" only builds and attaches bodies of failed calls."""
+        policy = AttachmentPolicy(mode="on_failure")
+        recorder = policy.recorder()
+        recorder.add("Passed", lambda: pytest.fail("rendered a passing call"))
+        recorder.commit(failed=False)
+
+        recorder.add("Failed", lambda: "body")
+        recorder.commit(failed=True)
+
+        assert attached.inline == [("Failed", "body")]
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected instead of attaching nothing."""
+        with pytest.raises(ValueError):
+            AttachmentPolicy(mode="sometimes")
@@ -0,0 +1,48 @@
+"""Tests for the worker-scoped browser pool."""
+
+import json
+
+from core.page.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+
+
+class TestBrowserPool:
+    """Test cases for BrowserPool."""
+
+    def test_browser_is_launched_once(self):
+        """Test the launch callable runs on first use only."""
+        launched = []
+        pool = BrowserPool(lambda: launched.append(FakeBrowser()) or launched[-1])
+
+        assert pool.browser is pool.browser
+        assert len(launched) == 1
+
+    def test_disconnected_browser_is_relaunched(self):
+        """Test a crashed or closed browser is replaced on next use."""
+        launched = []
+        pool = BrowserPool(lambda: launched.append(FakeBrowser()) or launched[-1])
+        pool.browser.close()
+
+        assert pool.browser is launched[1]
+
+    def test_timings_are_written_per_worker(self, tmp_path):
+        """Test setup timings land in ``<worker>.json``."""
+        pool = BrowserPool(FakeBrowser, worker="gw1")
+        pool.browser
+        pool.record_context(0.25)
+
+        data = json.loads(pool.write_timings(str(tmp_path)).read_text())
+
+        assert data["worker"] == "gw1"
+        assert data["contexts"] == 1
+        assert data["context_seconds_total"] == 0.25
@@ -0,0 +1,176 @@
+"""Tests for the columnar table and its builders."""
+
+from array import array
+
+import pytest
+from requests import HTTPError
+
+from core.utils.columnar import ColumnarTable
+from services.api.models.response.ip_model import IpModel
+from services.api.models.response.standard_ip_lookup.ip_response_model import IPResponse
+from services.controllers.ip_stack_controllers import IPStackController
+
+COLUMNS = ("id", "name", "score")
+ROWS = [(1, "a", 0.5), (2, "b", 1.5), (3, "c", 2.5)]
+
+RECORD = {
+    "ip": "134.201.250.155",
+    "type": "ipv4",
+    "country_code": "US",
+    "country_name": "United States",
+    "region_code": "CA",
+    "region_name": "California",
+    "city": "Huntington Beach",
+    "zip": "92648",
+    "latitude": 33.7,
+    "longitude": -118.0,
+    "location": {"time_zone": {"id": "America/Los_Angeles"}, "currency": None},
+}
+
+
+class TestColumnarTable:
+    """Test cases for ColumnarTable."""
+
+    def test_numeric_columns_use_arrays(self):
+        """Test int and float columns are stored as typed arrays."""
+        table = ColumnarTable.from_rows(COLUMNS, ROWS)
+
+        assert isinstance(table.column("id"), array)
+        assert isinstance(table.column("score"), array)
+        assert table.column("name") == ["a", "b", "c"]
+        assert table[-1].as_dict() == {"id": 3, "name": "c", "score": 2.5}
+
+    def test_mixed_values_fall_back_to_a_list(self):
+        """Test a column keeps working once a value does not fit the array."""
+        table = ColumnarTable.from_rows(("id",), [(1,), (None,), (2**70,)])
+
+        assert table.column("id") == [1, None, 2**70]
+
+    def test_equal_tables_with_different_storage(self):
+        """Test an array column equals a list column with the same values."""
+        left = ColumnarTable.from_rows(COLUMNS, ROWS)
+        right = ColumnarTable(
+            COLUMNS, {name: list(left.column(name)) for name in COLUMNS}
+        )
+
+        assert left == right
+        assert left.mismatches(right) == {}
+
+    def test_mismatches_report_changed_positions(self):
+        """Test differing values are reported per column."""
+        left = ColumnarTable.from_rows(COLUMNS, ROWS)
+        right = ColumnarTable.from_rows(
+            COLUMNS, [(1, "a", 0.5), (2, "x", 9.0), ROWS[2]]
+        )
+
+        assert left.mismatches(right) == {"name": [1], "score": [1]}
+
+    def test_mismatches_report_length_differences(self):
+        """Test rows missing from the shorter table count as mismatches."""
+        left = ColumnarTable.from_rows(COLUMNS, ROWS)
+        right = ColumnarTable.from_rows(COLUMNS, ROWS[:1])
+
+        expected = {name: [1, 2] for name in COLUMNS}
+        assert left.mismatches(right) == expected
+        assert right.mismatches(left) == expected
+
+    def test_mismatches_report_missing_columns(self):
+        """Test a column only one table has mismatches on every row."""
+        left = ColumnarTable.from_rows(COLUMNS, ROWS)
+        right = ColumnarTable.from_rows(
+            ("id", "name", "rank"), [r[:2] + (0,) for r in ROWS]
+        )
+
+        assert left.mismatches(right) == {"score": [0, 1, 2], "rank": [0, 1, 2]}
+
+    def test_diff_matches_rows_by_key(self):
+        """Test diff reports missing, extra and changed rows by key."""
+        expected = ColumnarTable.from_rows(COLUMNS, ROWS)
+        actual = ColumnarTable.from_rows(
+            COLUMNS, [(3, "c", 2.5), (2, "x", 1.5), (4, "d", 0.0)]
+        )
+
+        diff = expected.diff(actual, "id")
+
+        assert diff.missing == [1]
+        assert diff.extra == [4]
+        assert diff.changed == [(2, "name", "b", "x")]
+
+    def test_different_column_lengths_are_rejected(self):
+        """Test a table cannot be built from ragged columns."""
+        with pytest.raises(ValueError):
+            ColumnarTable(("a", "b"), {"a": [1], "b": []})
+
+    @pytest.mark.parametrize("bad_row", [(4, "d"), (4, "d", 3.5, "extra")])
+    def test_rows_of_the_wrong_length_are_rejected(self, bad_row):
+        """Test a short or long row is reported with its index."""
+        with pytest.raises(ValueError, match="Row 3 has"):
+            ColumnarTable.from_rows(COLUMNS, [*ROWS, bad_row])
+
+    def test_short_first_row_is_rejected(self):
+        """Test the first row cannot define fewer columns than declared."""
+        with pytest.raises(ValueError, match="Row 0 has 2 values for 3 columns"):
+            ColumnarTable.from_rows(COLUMNS, [(1, "a"), *ROWS])
+
+
+class TestIpModelTable:
+    """Test cases for IpModel.to_table."""
+
+    def test_table_holds_the_model_values(self):
+        """Test derived fields match what an IpModel holds."""
+        records = [RECORD, {"ip": "8.8.8.8", "location": None}]
+
+        table = IpModel.to_table(records)
+
+        expected = ColumnarTable.from_objects(
+            IpModel.__slots__, (IpModel(record) for record in records)
+        )
+        assert table == expected
+        assert table[0].timezone == {"id": "America/Los_Angeles"}
+        assert table[0].currency is None
+        assert table[1].location == {}
+        assert table[1].timezone == {}
+
+
+def ip_response() -> IPResponse:
+    return IPResponse.model_validate(
+        {key: value for key, value in RECORD.items() if key != "location"}
+    )
+
+
+class FakeIpClient:
+    def __init__(self, results):
+        self.results = results
+
+    def lookup_many(self, ip_addresses):
+        return iter(self.results)
+
+
+class TestIpInfoTable:
+    """Test cases for IPStackController.get_ip_info_table_api."""
+
+    def make_controller(self, results) -> IPStackController:
+        controller = object.__new__(IPStackController)
+        controller.ip_client = FakeIpClient(results)
+        return controller
+
+    def test_successful_lookups_become_rows(self):
+        """Test every successful lookup is a row of the table."""
+        response = ip_response()
+        controller = self.make_controller([(response.ip, response)])
+
+        table = controller.get_ip_info_table_api([response.ip], ("ip", "city"))
+
+        assert [row.as_tuple() for row in table] == [(response.ip, "Huntington Beach")]
+
+    def test_failed_lookups_fail_the_step(self):
+        """Test a failed lookup is reported instead of silently dropped."""
+        response = ip_response()
+        controller = self.make_controller(
+            [(response.ip, response), ("10.0.0.1", HTTPError("502 Bad Gateway"))]
+        )
+
+        with pytest.raises(
+            AssertionError, match=r"1 IP lookups failed: \['10.0.0.1'\]"
+        ):
+            controller.get_ip_info_table_api([response.ip, "10.0.0.1"])
@@ -0,0 +1,152 @@
+"""Tests for loading and validating the env file settings."""
+
+import os
+
+import pytest
+
+from configs import configs
+from configs.configs import Configs
+
+
+class TestConfigs:
+    """Test cases for Configs."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        """Fixture running every test against its own env file."""
+        (tmp_path / "configs").mkdir()
+        self.env_file = tmp_path / "configs" / ".env.unit"
+        self.monkeypatch = monkeypatch
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ACTIVE_ENV", "unit")
+        for name in (
+            "DB_PORT",
+            "DB_PASSWORD",
+            "HEADLESS",
+            "UI_CAPTURE_MODE",
+            "API_ATTACH_OVERSIZE",
+        ):
+            monkeypatch.delenv(name, raising=False)
+        Configs.clear_cache()
+        yield
+        Configs.clear_cache()
+
+    def write(self, *lines: str) -> None:
+        self.env_file.write_text("\n".join(lines) + "\n")
+
+    def test_values_are_converted_to_field_types(self):
+        """Test values are typed, comments skipped and missing ones defaulted."""
+        self.write(
+            "# database",
+            "DB_PORT = 6543",
+            "DB_POOL_TIMEOUT=2.5",
+            "HEADLESS=Yes",
+            "RECORD_VIDEO=off",
+            "BASE_URL=https://example.com/?a=b",
+        )
+
+        settings = Configs()
+
+        assert settings.DB_PORT == 6543
+        assert settings.DB_POOL_TIMEOUT == 2.5
+        assert settings.HEADLESS is True
+        assert settings.RECORD_VIDEO is False
+        assert settings.BASE_URL == "https://example.com/?a=b"
+        assert settings.DB_HOST == "localhost"
+
+    def test_invalid_values_are_reported_together(self):
+        """Test every bad value and malformed line is listed in one error."""
+        self.write("DB_PORT=abc", "HEADLESS=maybe", "NOT A SETTING", "API_TIMEOUT=5")
+
+        with pytest.raises(ValueError) as error:
+            Configs()
+
+        message = str(error.value)
+        assert "DB_PORT='abc' is not a valid int" in message
+        assert "HEADLESS='maybe' is not a valid bool" in message
+        assert "line 3 is not KEY=VALUE" in message
+
+    def test_values_outside_choices_are_rejected(self):
+        """Test misspelled modes fail at load time, not inside a fixture."""
+        self.write(
+            "UI_CAPTURE_MODE=failure",
+            "IP_STACK_MODE=Replay",
+            "UI_SCREENSHOT_TYPE=png",
+            "API_ATTACH_MODE=on_failure",
+        )
+
+        with pytest.raises(ValueError) as error:
+            Configs()
+
+        message = str(error.value)
+        assert "UI_CAPTURE_MODE='failure' is not one of sampled" in message
+        assert "IP_STACK_MODE='Replay' is not one of live, record, replay" in message
+        assert "UI_SCREENSHOT_TYPE" not in message
+        assert "API_ATTACH_MODE" not in message
+
+    def test_defaults_are_valid_choices(self):
+        """Test settings left unset take their default without errors."""
+        self.write("DB_PORT=6543")
+
+        settings = Configs()
+
+        assert settings.UI_CAPTURE_MODE == "sampled"
+        assert settings.API_ATTACH_OVERSIZE == "truncate"
+
+    def test_environment_fills_empty_values(self):
+        """Test empty or missing file values fall back to the process environment."""
+        self.write("DB_PASSWORD=", "DB_PORT=6543")
+        self.monkeypatch.setenv("DB_PASSWORD", "from-env")
+        self.monkeypatch.setenv("DB_PORT", "1111")
+
+        settings = Configs()
+
+        assert settings.DB_PASSWORD == "from-env"
+        assert settings.DB_PORT == 6543
+
+    def test_settings_are_cached(self):
+        """Test repeated lookups return the loaded instance."""
+        self.write("DB_PORT=6543")
+
+        assert Configs() is Configs()
+
+    def test_changed_file_is_reloaded_after_recheck(self):
+        """Test a modified env file is picked up once the recheck interval passed."""
+        self.monkeypatch.setattr(configs, "RECHECK_SECONDS", 0.0)
+        self.write("DB_PORT=6543")
+        first = Configs()
+        self.write("DB_PORT=7654")
+        mtime = os.stat(self.env_file).st_mtime_ns + 1_000_000_000
+        os.utime(self.env_file, ns=(mtime, mtime))
+
+        second = Configs()
+
+        assert first.DB_PORT == 6543
+        assert second.DB_PORT == 7654
+
+    def test_file_is_not_rechecked_within_interval(self):
+        """Test the file is not stat'ed again before RECHECK_SECONDS."""
+        self.monkeypatch.setattr(configs, "RECHECK_SECONDS", 3600.0)
+        self.write("DB_PORT=6543")
+        first = Configs()
+        self.write("DB_PORT=7654")
+
+        assert Configs() is first
+
+    def test_clear_cache_reloads(self):
+        """Test clear_cache makes the next lookup read the file again."""
+        self.monkeypatch.setattr(configs, "RECHECK_SECONDS", 3600.0)
+        self.write("DB_PORT=6543")
+        Configs()
+        self.write("DB_PORT=7654", "API_TIMEOUT=5")
+
+        Configs.clear_cache()
+
+        assert Configs().DB_PORT == 7654
+
+    def test_missing_env_file(self):
+        """Test an unknown environment names the file it looked for."""
+        self.monkeypatch.setenv("ACTIVE_ENV", "missing")
+
+        with pytest.raises(FileNotFoundError, match="configs/.env.missing"):
+            Configs()
@@ -0,0 +1,173 @@
+"""Tests for failure artifacts and their background writer."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from core.page.failure_capture import ArtifactWriter, FailureCapture
+
+
+class FakePage:
+    def __init__(self, data: bytes = b"frame", closed: bool = False, error=None):
+        self.data = data
+        self.closed = closed
+        self.error = error
+        self.options = None
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def screenshot(self, **options) -> bytes:
+        if self.error:
+            raise self.error
+        self.options = options
+        return self.data
+
+    def content(self) -> str:
+        return "<html></html>"
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    attachments = []
+
+    def attach_file(path, name, attachment_type):
+        attachments.append((name, Path(path).read_bytes()))
+
+    monkeypatch.setattr(
+        "core.page.failure_capture.allure",
+        SimpleNamespace(
+            attach=SimpleNamespace(file=attach_file),
+            attachment_type=allure.attachment_type,
+        ),
+    )
+    return attachments
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = ArtifactWriter(str(tmp_path / "screenshots"))
+    yield writer
+    writer.close()
+
+
+def context(*pages):
+    return SimpleNamespace(pages=list(pages))
+
+
+class TestArtifactWriter:
+    """Test cases for ArtifactWriter."""
+
+    def test_identical_frames_are_written_once(self, writer):
+        """Test a repeated frame returns the path of the first one."""
+        first = writer.submit("test_a", b"frame", "jpeg")
+        second = writer.submit("test_b", b"frame", "jpeg")
+        other = writer.submit("test_c", b"other", "jpeg")
+        writer.flush()
+
+        assert first == second != other
+        assert first.read_bytes() == b"frame"
+        assert sorted(p.name for p in writer.directory.iterdir()) == sorted(
+            [first.name, other.name]
+        )
+
+    def test_write_errors_do_not_stop_the_writer(self, tmp_path, caplog):
+        """Test an unwritable directory is logged and later artifacts still land."""
+        blocked = tmp_path / "blocked"
+        blocked.write_text("a file, not a directory")
+        writer = ArtifactWriter(str(blocked))
+        try:
+            writer.submit("test_a", b"frame", "jpeg")
+            writer.flush()
+            writer.directory = tmp_path / "screenshots"
+            path = writer.submit("test_a", b"frame", "jpeg")
+            writer.flush()
+        finally:
+            writer.close()
+
+        assert "Could not write artifact" in caplog.text
+        assert path.read_bytes() == b"frame"
+
+
+class TestFailureCapture:
+    """Test cases for FailureCapture."""
+
+    def test_open_pages_are_captured_as_jpeg(self, writer, attached):
+        """Test every open page is queued and attached, closed ones skipped."""
+        capture = FailureCapture(writer, quality=50)
+        first, closed, second = FakePage(b"1"), FakePage(closed=True), FakePage(b"2")
+        capture.watch(context(first, closed))
+        capture.watch(context(second))
+
+        paths = capture.capture("test_login")
+        assert attached == []
+        capture.attach()
+
+        assert [path.read_bytes() for path in paths] == [b"1", b"2"]
+        assert attached == [
+            ("Failure screenshot test_login", b"1"),
+            ("Failure screenshot test_login_2", b"2"),
+        ]
+        assert first.options == {"type": "jpeg", "full_page": False, "quality": 50}
+
+    def test_identical_frames_are_attached_once(self, writer, attached):
+        """Test pages showing the same frame produce one file and one attachment."""
+        capture = FailureCapture(writer)
+        capture.watch(context(FakePage(b"same"), FakePage(b"same")))
+
+        paths = capture.capture("test_login")
+        capture.attach()
+        capture.attach()
+
+        assert len(paths) == 1
+        assert attached == [("Failure screenshot test_login", b"same")]
+
+    def test_unwritten_frames_are_not_attached(self, tmp_path, attached, caplog):
+        """Test a frame the writer could not store is logged, not attached."""
+        blocked = tmp_path / "blocked"
+        blocked.write_text("a file, not a directory")
+        writer = ArtifactWriter(str(blocked))
+        capture = FailureCapture(writer)
+        capture.watch(context(FakePage()))
+        try:
+            capture.capture("test_login")
+            capture.attach()
+        finally:
+            writer.close()
+
+        assert attached == []
+        assert "was not written" in caplog.text
+
+    def test_a_failing_page_is_skipped(self, writer, attached, caplog):
+        """Test one crashed page does not prevent capturing the others."""
+        capture = FailureCapture(writer)
+        capture.watch(context(FakePage(error=RuntimeError("crashed")), FakePage()))
+
+        paths = capture.capture("test_login")
+
+        assert len(paths) == 1
+        assert "Could not capture page 0 of test_login" in caplog.text
+
+    def test_dom_mode_stores_html(self, writer, attached):
+        """Test the DOM mode captures page content instead of pixels."""
+        capture = FailureCapture(writer, mode="dom")
+        capture.watch(context(FakePage()))
+
+        [path] = capture.capture("test_login")
+
+        assert path.suffix == ".html"
+
+    def test_off_mode_captures_nothing(self, writer, attached):
+        """Test the off mode neither attaches nor writes."""
+        capture = FailureCapture(writer, mode="off")
+        capture.watch(context(FakePage()))
+
+        assert capture.capture("test_login") == []
+        assert attached == []
+
+    def test_unknown_mode_is_rejected(self, writer):
+        """Test a typo in UI_FAILURE_CAPTURE fails fast."""
+        with pytest.raises(ValueError):
+            FailureCapture(writer, mode="video")
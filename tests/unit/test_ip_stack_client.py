@@ -0,0 +1,49 @@
+"""Tests for IP Stack bulk lookups."""
+
+import json
+
+from requests import Response
+
+from core.api.resilience import CircuitOpenError
+from services.api.clients.ip_stack_api_client import IpStackClient
+from services.api.models.response.standard_ip_lookup.ip_response_model import IPResponse
+
+with open("data/test_data/ip_stack/lookup.json") as f:
+    RECORD = json.load(f)[0]
+
+
+def bulk_response(addresses: str) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        [{**RECORD, "ip": ip} for ip in addresses.split(",")]
+    ).encode()
+    return response
+
+
+class TestLookupMany:
+    """Test cases for IpStackClient.lookup_many."""
+
+    def test_open_circuit_fails_only_its_chunk(self, monkeypatch):
+        """Test a chunk rejected by the breaker does not end the stream."""
+
+        def lookup(addresses):
+            if "10.0.0.1" in addresses.split(","):
+                raise CircuitOpenError("Circuit open for ipstack")
+            return bulk_response(addresses)
+
+        client = IpStackClient()
+        monkeypatch.setattr(client, "get_basic_standard_ip_lookup", lookup)
+
+        results = dict(
+            client.lookup_many(
+                ["10.0.0.1", "10.0.0.2", "1.1.1.1", "8.8.8.8"],
+                chunk_size=2,
+                max_workers=2,
+            )
+        )
+
+        assert isinstance(results["10.0.0.1"], CircuitOpenError)
+        assert results["10.0.0.2"] is results["10.0.0.1"]
+        assert isinstance(results["1.1.1.1"], IPResponse)
+        assert results["8.8.8.8"].ip == "8.8.8.8"
@@ -0,0 +1,76 @@
+"""Tests for the JSON fixture index store."""
+
+import json
+import os
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from core.utils.json_store import JsonIndexStore
+
+
+class Record(BaseModel):
+    id: int
+    ip: Optional[str] = None
+    tags: List[str] = []
+
+
+def write_records(path, records) -> str:
+    path.write_text(json.dumps(records), encoding="utf-8")
+    return str(path)
+
+
+class TestJsonIndexStore:
+    """Test cases for JsonIndexStore."""
+
+    def test_lookup_returns_first_occurrence(self, tmp_path):
+        """Test an index hit returns the first record with that value."""
+        file_path = write_records(
+            tmp_path / "records.json",
+            [{"id": 1, "ip": "a"}, {"id": 2, "ip": "a"}, {"id": 3, "ip": None}],
+        )
+        store = JsonIndexStore(file_path, Record, ("id", "ip"))
+
+        assert store.get("ip", "a").id == 1
+        assert store.get("id", 3).ip is None
+        assert store.get("id", 4) is None
+        assert store.first().id == 1
+        assert len(store) == 3
+
+    def test_mutating_a_result_does_not_leak(self, tmp_path):
+        """Test callers get copies, so changes stay local to one caller."""
+        file_path = write_records(tmp_path / "records.json", [{"id": 1, "tags": []}])
+        store = JsonIndexStore(file_path, Record, ("id",))
+
+        first = store.get("id", 1)
+        first.ip = "changed"
+        first.tags.append("changed")
+
+        again = store.get("id", 1)
+        assert again is not first
+        assert again.ip is None
+        assert again.tags == []
+
+    def test_reloads_when_the_file_changes(self, tmp_path):
+        """Test a newer file replaces records and indexes together."""
+        path = tmp_path / "records.json"
+        write_records(path, [{"id": 1, "ip": "a"}])
+        store = JsonIndexStore(str(path), Record, ("id", "ip"))
+        assert store.get("ip", "a").id == 1
+
+        write_records(path, [{"id": 2, "ip": "b"}, {"id": 3, "ip": "c"}])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert store.get("ip", "a") is None
+        assert store.get("ip", "c").id == 3
+        assert len(store) == 2
+
+    def test_for_file_shares_one_store(self, tmp_path):
+        """Test the registry returns the same store for the same arguments."""
+        file_path = write_records(tmp_path / "records.json", [{"id": 1}])
+
+        store = JsonIndexStore.for_file(file_path, Record, ("id",))
+
+        assert JsonIndexStore.for_file(file_path, Record, ("id",)) is store
+        assert JsonIndexStore.for_file(file_path, Record, ("ip",)) is not store
@@ -0,0 +1,163 @@
+"""Tests for the JSON readers and writers."""
+
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from core.utils.json import JsonUtils
+
+
+class Item(BaseModel):
+    id: int
+    name: Optional[str] = None
+
+
+ITEMS = [
+    {"id": 1, "name": "comma, and ] bracket"},
+    {"id": 2, "name": 'quote " and \\ escape'},
+    {"id": 3, "name": None},
+    {"id": 4, "name": "ünïcode"},
+]
+
+
+class TestJsonStreaming:
+    """Test cases for the streaming JSON array and JSON Lines helpers."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+    def test_iter_json_array_across_chunk_boundaries(self, tmp_path, chunk_size):
+        """Test items decode the same whatever the chunk size."""
+        path = tmp_path / "items.json"
+        path.write_text(json.dumps(ITEMS, indent=2), encoding="utf-8")
+
+        items = list(JsonUtils.iter_json_array(str(path), chunk_size=chunk_size))
+
+        assert items == ITEMS
+
+    @pytest.mark.parametrize("chunk_size", [1, 3])
+    def test_iter_json_array_numbers_cut_by_a_chunk(self, tmp_path, chunk_size):
+        """Test a number split across chunks is not decoded early."""
+        path = tmp_path / "numbers.json"
+        path.write_text("[12.5, 300,4e2 ,-7]", encoding="utf-8")
+
+        items = list(JsonUtils.iter_json_array(str(path), chunk_size=chunk_size))
+
+        assert items == [12.5, 300, 400.0, -7]
+
+    def test_iter_json_array_validates_models(self, tmp_path):
+        """Test items are validated into the model class when given."""
+        path = tmp_path / "items.json"
+        path.write_text(json.dumps(ITEMS), encoding="utf-8")
+
+        items = list(JsonUtils.iter_json_array(str(path), Item))
+
+        assert [item.id for item in items] == [1, 2, 3, 4]
+        assert isinstance(items[0], Item)
+
+    def test_iter_json_array_empty(self, tmp_path):
+        """Test an empty array yields nothing."""
+        path = tmp_path / "empty.json"
+        path.write_text(" [ ] ", encoding="utf-8")
+
+        assert list(JsonUtils.iter_json_array(str(path))) == []
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            ('{"id": 1}', "not an array"),
+            ('[{"id": 1},', "Unexpected end"),
+            ("[,,1]", "Empty element"),
+            ("[1,,2]", "Empty element"),
+            ("[1,]", "Empty element"),
+            ("[1 2]", "Expected ',' or ']'"),
+            ("[1] [2]", "after the JSON array"),
+            ("[1]x", "after the JSON array"),
+        ],
+    )
+    def test_iter_json_array_rejects_invalid_files(self, tmp_path, content, message):
+        """Test non-array, truncated and malformed files raise ValueError."""
+        path = tmp_path / "invalid.json"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=message):
+            list(JsonUtils.iter_json_array(str(path)))
+
+    def test_json_array_round_trip(self, tmp_path):
+        """Test write_json_array output is read back by iter_json_array."""
+        path = str(tmp_path / "items.json")
+
+        count = JsonUtils.write_json_array(path, (Item(**item) for item in ITEMS))
+
+        assert count == 4
+        assert JsonUtils.read_json_file(path) == ITEMS
+        assert list(JsonUtils.iter_json_array(path)) == ITEMS
+
+    def test_json_lines_round_trip_skips_blank_lines(self, tmp_path):
+        """Test JSON Lines are written one per line and blank lines skipped."""
+        path = tmp_path / "items.jsonl"
+
+        assert JsonUtils.write_json_lines(str(path), ITEMS) == 4
+        path.write_text(path.read_text(encoding="utf-8") + "\n  \n", encoding="utf-8")
+
+        assert list(JsonUtils.iter_json_lines(str(path))) == ITEMS
+        models = list(JsonUtils.iter_json_lines(str(path), Item))
+        assert models[3].name == "ünïcode"
+
+    def test_missing_files_raise(self, tmp_path):
+        """Test the streaming readers report missing files."""
+        missing = str(tmp_path / "missing.json")
+
+        with pytest.raises(FileNotFoundError):
+            list(JsonUtils.iter_json_array(missing))
+        with pytest.raises(FileNotFoundError):
+            list(JsonUtils.iter_json_lines(missing))
+
+    def test_iter_json_file_as_models_picks_reader_by_suffix(self, tmp_path):
+        """Test .jsonl files are read as lines and others as arrays."""
+        JsonUtils.write_json_lines(str(tmp_path / "items.jsonl"), ITEMS)
+        JsonUtils.write_json_array(str(tmp_path / "items.json"), ITEMS)
+
+        for name in ("items.jsonl", "items.json"):
+            models = JsonUtils.iter_json_file_as_models(str(tmp_path / name), Item)
+            assert [model.id for model in models] == [1, 2, 3, 4]
+
+
+class TestJsonModelValidation:
+    """Test cases for validating JSON into models."""
+
+    def test_list_adapter_is_cached_per_model(self):
+        """Test the TypeAdapter is built once per model class."""
+        assert JsonUtils.list_adapter(Item) is JsonUtils.list_adapter(Item)
+
+    def test_bytes_validate_into_models(self):
+        """Test raw JSON bytes validate straight into models."""
+        data = json.dumps(ITEMS).encode("utf-8")
+
+        models = JsonUtils.read_json_bytes_as_list_model(data, Item)
+
+        assert [model.model_dump() for model in models] == ITEMS
+        assert JsonUtils.read_json_bytes_as_model(b'{"id": "5"}', Item).id == 5
+
+    def test_python_and_bytes_validation_agree(self):
+        """Test decoded and raw input give the same models."""
+        from_python = JsonUtils.read_json_as_list_model(ITEMS, Item)
+        from_bytes = JsonUtils.read_json_bytes_as_list_model(json.dumps(ITEMS), Item)
+
+        assert from_python == from_bytes
+
+    def test_invalid_items_raise_validation_error(self):
+        """Test a wrong type fails validation instead of passing through."""
+        with pytest.raises(ValidationError):
+            JsonUtils.read_json_bytes_as_list_model(b'[{"id": "x"}]', Item)
+
+    def test_read_json_file_as_list_model(self, tmp_path):
+        """Test a JSON array file is read into models."""
+        path = tmp_path / "items.json"
+        path.write_bytes(json.dumps(ITEMS).encode("utf-8"))
+
+        models = JsonUtils.read_json_file_as_list_model(str(path), Item)
+
+        assert [model.id for model in models] == [1, 2, 3, 4]
+        with pytest.raises(FileNotFoundError):
+            JsonUtils.read_json_file_as_list_model(str(tmp_path / "no.json"), Item)
@@ -0,0 +1,94 @@
+"""Tests for the virtual-user load runner."""
+
+import asyncio
+import time
+
+from core.page.load_runner import LoadProfile, LoadReport, LoadRunner
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+class TestLoadRunner:
+    """Test cases for LoadRunner."""
+
+    def test_users_get_their_own_context(self):
+        """Test every virtual user runs in a separate context, closed at the end."""
+        seen = set()
+
+        async def flow(pages, steps, base_url):
+            seen.add(id(pages._page))
+            await asyncio.sleep(0)
+
+        runner = LoadRunner(
+            "http://stub", flow=flow, profile=LoadProfile(users=3, ramp_up=0)
+        )
+        browser = FakeBrowser()
+        deadline = time.perf_counter() + 0.05
+
+        async def run_users():
+            await asyncio.gather(
+                *(runner._virtual_user(browser, user, deadline) for user in range(3))
+            )
+
+        asyncio.run(run_users())
+
+        assert len(browser.contexts) == 3
+        assert all(context.closed for context in browser.contexts)
+        assert len(seen) == 3
+
+    def test_failed_iterations_are_counted_apart(self):
+        """Test failures are counted separately and not as successes."""
+        calls = []
+
+        async def flow(pages, steps, base_url):
+            calls.append(None)
+            await asyncio.sleep(0)
+            if len(calls) % 2:
+                raise AssertionError("header missing")
+
+        runner = LoadRunner(
+            "http://stub", flow=flow, profile=LoadProfile(users=1, ramp_up=0)
+        )
+
+        asyncio.run(runner._virtual_user(FakeBrowser(), 0, time.perf_counter() + 0.05))
+
+        assert runner.failed_iterations + runner.successful_iterations == len(calls)
+        assert runner.failed_iterations == (len(calls) + 1) // 2
+
+
+class TestLoadReport:
+    """Test cases for LoadReport."""
+
+    def test_throughput_counts_successful_iterations_only(self):
+        """Test failed iterations add to the error rate, not the throughput."""
+        report = LoadReport(
+            profile=LoadProfile(users=2),
+            seconds=10.0,
+            successful_iterations=30,
+            failed_iterations=10,
+            steps=[],
+        )
+
+        assert report.iterations == 40
+        assert report.throughput == 3.0
+        assert report.error_rate == 0.25
+        assert report.as_dict()["successful_iterations"] == 30
+        assert "30 successful and 10 failed iterations" in str(report)
@@ -0,0 +1,159 @@
+"""Tests for request routing and the static asset cache."""
+
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from core.page.network_router import NetworkRouter, StaticAssetCache
+
+URL = "https://www.saucedemo.com/static/js/main.js"
+
+
+class FakeResponse:
+    def __init__(self, status: int = 200, headers=None, body: bytes = b"asset"):
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.headers = headers or {}
+        self._body = body
+
+    def body(self) -> bytes:
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, responses: Optional[List[FakeResponse]] = None):
+        self.responses = responses or []
+        self.fetched: List[Optional[Dict[str, str]]] = []
+        self.outcome = None
+
+    def abort(self, reason: str) -> None:
+        self.outcome = ("abort", reason)
+
+    def continue_(self) -> None:
+        self.outcome = ("continue", None)
+
+    def fetch(self, headers: Optional[Dict[str, str]] = None) -> FakeResponse:
+        self.fetched.append(headers)
+        return self.responses.pop(0)
+
+    def fulfill(self, **kwargs) -> None:
+        self.outcome = ("fulfill", kwargs)
+
+
+def make_request(url: str = URL, resource_type: str = "script", method: str = "GET"):
+    return SimpleNamespace(
+        url=url, resource_type=resource_type, method=method, headers={"accept": "*/*"}
+    )
+
+
+def route(router: NetworkRouter, response: Optional[FakeResponse] = None, **request):
+    fake = FakeRoute([response] if response else [])
+    router._handle(fake, make_request(**request))
+    return fake
+
+
+class TestNetworkRouter:
+    """Test cases for NetworkRouter."""
+
+    def test_blocked_requests_are_counted_without_bytes(self, tmp_path):
+        """Test blocked types and domains are aborted and counted."""
+        router = NetworkRouter("image", "ads.example.com", StaticAssetCache(tmp_path))
+
+        image = route(router, resource_type="image")
+        tracker = route(router, url="https://cdn.ads.example.com/t.js")
+
+        assert image.outcome == tracker.outcome == ("abort", "blockedbyclient")
+        assert router.stats.blocked_requests == 2
+        assert router.stats.saved_bytes == 0
+        assert "blocked_bytes" not in router.stats.as_dict()
+
+    def test_uncacheable_requests_continue(self):
+        """Test requests pass through untouched without a cache."""
+        router = NetworkRouter(blocked_types="image")
+
+        assert route(router).outcome == ("continue", None)
+        assert router.stats.saved_requests == 0
+
+    def test_second_request_is_served_from_the_cache(self, tmp_path):
+        """Test a downloaded asset is fulfilled from disk next time."""
+        router = NetworkRouter(asset_cache=StaticAssetCache(tmp_path))
+
+        route(router, FakeResponse(headers={"content-encoding": "gzip"}))
+        cached = route(router)
+
+        assert cached.fetched == []
+        assert cached.outcome[1]["body"] == b"asset"
+        assert "content-encoding" not in cached.outcome[1]["headers"]
+        assert router.stats.as_dict() == {
+            "blocked_requests": 0,
+            "cached_requests": 1,
+            "cached_bytes": 5,
+            "revalidated_requests": 0,
+            "network_requests": 1,
+            "network_bytes": 5,
+            "saved_requests": 1,
+            "saved_bytes": 5,
+        }
+
+    def test_stale_asset_is_revalidated_with_its_etag(self, tmp_path, monkeypatch):
+        """Test an expired asset sends If-None-Match and reuses the body on 304."""
+        cache = StaticAssetCache(tmp_path, ttl_seconds=60)
+        router = NetworkRouter(asset_cache=cache)
+        route(router, FakeResponse(headers={"etag": '"v1"'}))
+        now = time.time() + 120
+        monkeypatch.setattr("core.page.network_router.time.time", lambda: now)
+
+        revalidated = route(router, FakeResponse(status=304))
+
+        assert revalidated.fetched[0]["if-none-match"] == '"v1"'
+        assert revalidated.outcome[1]["body"] == b"asset"
+        assert router.stats.revalidated_requests == 1
+        assert cache.is_fresh(cache.get(URL)[0])
+
+    def test_changed_asset_replaces_the_cached_one(self, tmp_path, monkeypatch):
+        """Test a 200 answer to the revalidation updates the cache."""
+        router = NetworkRouter(asset_cache=StaticAssetCache(tmp_path, ttl_seconds=60))
+        route(router, FakeResponse(headers={"etag": '"v1"'}))
+        now = time.time() + 120
+        monkeypatch.setattr("core.page.network_router.time.time", lambda: now)
+
+        route(router, FakeResponse(headers={"etag": '"v2"'}, body=b"new"))
+
+        assert route(router).outcome[1]["body"] == b"new"
+
+
+class TestStaticAssetCache:
+    """Test cases for StaticAssetCache freshness."""
+
+    def test_max_age_overrides_the_default_ttl(self, tmp_path):
+        """Test Cache-Control max-age sets the expiry."""
+        cache = StaticAssetCache(tmp_path, ttl_seconds=3600)
+        cache.put(URL, 200, {"Cache-Control": "public, max-age=0"}, b"x")
+
+        assert not cache.is_fresh(cache.get(URL)[0])
+
+    def test_default_ttl_applies_without_cache_control(self, tmp_path):
+        """Test assets without max-age stay fresh for ttl_seconds."""
+        cache = StaticAssetCache(tmp_path, ttl_seconds=3600)
+        cache.put(URL, 200, {}, b"x")
+
+        meta = cache.get(URL)[0]
+        assert cache.is_fresh(meta)
+        assert meta["expires"] <= time.time() + 3600
+
+    def test_no_store_is_not_cached(self, tmp_path):
+        """Test no-store responses never reach the disk."""
+        cache = StaticAssetCache(tmp_path)
+        cache.put(URL, 200, {"cache-control": "no-store"}, b"x")
+
+        assert cache.get(URL) is None
+
+    def test_no_cache_is_always_revalidated(self, tmp_path):
+        """Test no-cache responses are stored stale, with their validators."""
+        cache = StaticAssetCache(tmp_path)
+        headers = {"cache-control": "no-cache", "Last-Modified": "Mon, 01 Jan 2024"}
+        cache.put(URL, 200, headers, b"x")
+
+        meta = cache.get(URL)[0]
+        assert not cache.is_fresh(meta)
+        assert cache.validators(meta) == {"if-modified-since": "Mon, 01 Jan 2024"}
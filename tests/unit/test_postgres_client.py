@@ -0,0 +1,348 @@
+"""Tests for the pooled PostgreSQL client, run against a fake pool."""
+
+import threading
+from typing import IO, Any, List, Optional
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from core.db import postgres_client
+from core.db.postgres_client import BulkResult, PostgresClient
+from services.controllers.user_db_controllers import UserController
+from services.db.entites.user_entity import UserEntity
+from services.db.mock_data.clients.user_db_client import UserDBClient
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection", name: Optional[str] = None):
+        self.conn = conn
+        self.name = name
+        self.description = None
+        self.itersize = 2000
+        self._rows: List[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query: str, params: Any = None) -> None:
+        self.conn.executed.append((query, params))
+        self._rows = list(self.conn.results.pop(0)) if self.conn.results else []
+        self.description = [("column",)] if self._rows or self.name else None
+
+    def copy_expert(self, statement: str, buffer: IO[str]) -> None:
+        self.conn.executed.append((statement, buffer.read()))
+
+    def fetchall(self) -> List[tuple]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size: int) -> List[tuple]:
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+
+class FakeConnection:
+    def __init__(self):
+        self.prepared = {}
+        self.autocommit = False
+        self.closed = 0
+        # Raised by rollback, like a connection the server dropped
+        self.rollback_error: Optional[Exception] = None
+        self.executed: List[tuple] = []
+        # Rows returned by the next statements, one entry per execute
+        self.results: List[List[tuple]] = []
+
+    def cursor(self, name: Optional[str] = None) -> FakeCursor:
+        return FakeCursor(self, name)
+
+    def commit(self) -> None:
+        self.executed.append(("COMMIT", None))
+
+    def rollback(self) -> None:
+        if self.rollback_error:
+            raise self.rollback_error
+        self.executed.append(("ROLLBACK", None))
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class FakePool:
+    """Behaves like ThreadedConnectionPool: raises once ``maxconn`` are out."""
+
+    def __init__(self, minconn: int, maxconn: int, **kwargs: Any):
+        self.maxconn = maxconn
+        self.idle = [FakeConnection()]
+        self.used: List[FakeConnection] = []
+        self.discarded: List[FakeConnection] = []
+
+    def getconn(self) -> FakeConnection:
+        if len(self.used) >= self.maxconn:
+            raise PoolError("connection pool exhausted")
+        conn = self.idle.pop() if self.idle else FakeConnection()
+        self.used.append(conn)
+        return conn
+
+    def putconn(self, conn: FakeConnection, close: bool = False) -> None:
+        self.used.remove(conn)
+        (self.discarded if close else self.idle).append(conn)
+
+    def closeall(self) -> None:
+        self.idle.clear()
+
+
+def make_client(monkeypatch, **kwargs: Any) -> PostgresClient:
+    monkeypatch.setattr(postgres_client, "ThreadedConnectionPool", FakePool)
+    return PostgresClient("localhost", 5432, "user", "secret", "db", **kwargs)
+
+
+class TestPostgresClient:
+    """Test cases for PostgresClient."""
+
+    def test_connections_run_in_autocommit(self, monkeypatch):
+        """Test pooled connections are handed out in autocommit mode."""
+        client = make_client(monkeypatch)
+
+        with client.connection() as conn:
+            assert conn.autocommit is True
+        assert client.pool.used == []
+
+    def test_checkout_waits_for_a_returned_connection(self, monkeypatch):
+        """Test a full pool blocks the next checkout instead of raising."""
+        client = make_client(monkeypatch, max_connections=1, checkout_timeout=5)
+        acquired = threading.Event()
+
+        def borrow():
+            with client.connection():
+                acquired.set()
+
+        with client.connection():
+            worker = threading.Thread(target=borrow)
+            worker.start()
+            assert not acquired.wait(0.1)
+        worker.join(5)
+
+        assert acquired.is_set()
+
+    def test_checkout_times_out_when_the_pool_stays_full(self, monkeypatch):
+        """Test the wait is bounded by checkout_timeout."""
+        client = make_client(monkeypatch, max_connections=1, checkout_timeout=0.05)
+
+        with client.connection():
+            with pytest.raises(PoolError, match="No pooled connection"):
+                with client.connection():
+                    pass
+
+        with client.connection():
+            pass
+
+    def test_transaction_rolls_back_on_error(self, monkeypatch):
+        """Test a failing block is rolled back and autocommit restored."""
+        client = make_client(monkeypatch)
+
+        with pytest.raises(RuntimeError):
+            with client.transaction() as cursor:
+                cursor.execute("DELETE FROM users")
+                raise RuntimeError("boom")
+
+        conn = client.pool.idle[0]
+        assert conn.executed[-1] == ("ROLLBACK", None)
+        assert conn.autocommit is True
+
+    def test_transaction_drops_a_connection_closed_by_the_server(self, monkeypatch):
+        """Test a closed connection is not reset and is discarded by the pool."""
+        client = make_client(monkeypatch)
+        conn = client.pool.idle[0]
+
+        with pytest.raises(psycopg2.OperationalError, match="server closed"):
+            with client.transaction():
+                conn.closed = 2
+                raise psycopg2.OperationalError("server closed the connection")
+
+        assert ("ROLLBACK", None) not in conn.executed
+        assert client.pool.discarded == [conn]
+        assert client.pool.used == [] and client.pool.idle == []
+
+    def test_failed_rollback_keeps_the_original_error(self, monkeypatch, caplog):
+        """Test a rollback error is logged, the connection closed and discarded."""
+        client = make_client(monkeypatch)
+        conn = client.pool.idle[0]
+        conn.rollback_error = psycopg2.InterfaceError("connection already closed")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with client.transaction():
+                raise RuntimeError("boom")
+
+        assert "failed to reset" in caplog.text
+        assert client.pool.discarded == [conn]
+
+        with client.transaction() as cursor:
+            cursor.execute("SELECT 1")
+        assert client.pool.idle[0] is not conn
+
+    @pytest.mark.parametrize("name", ["user by id", "x; DROP TABLE users", "1st", ""])
+    def test_prepare_rejects_unsafe_names(self, monkeypatch, name):
+        """Test statement names must be plain identifiers."""
+        client = make_client(monkeypatch)
+
+        with pytest.raises(ValueError, match="Invalid prepared statement name"):
+            client.prepare(name, "SELECT 1")
+
+    def test_statement_is_prepared_once_per_connection(self, monkeypatch):
+        """Test PREPARE runs on the first execution only."""
+        client = make_client(monkeypatch)
+        client.prepare("user_by_id", "SELECT * FROM users WHERE id = $1")
+
+        client.execute_prepared("user_by_id", (1,))
+        client.execute_prepared("user_by_id", (2,))
+
+        statements = [query for query, _ in client.pool.idle[0].executed]
+        assert statements == [
+            "PREPARE user_by_id AS SELECT * FROM users WHERE id = $1",
+            "EXECUTE user_by_id (%s)",
+            "EXECUTE user_by_id (%s)",
+        ]
+
+    def test_changed_query_is_prepared_again(self, monkeypatch):
+        """Test re-registering a name with new SQL replaces the statement."""
+        client = make_client(monkeypatch)
+        client.prepare("user_by_id", "SELECT id FROM users WHERE id = $1")
+        client.execute_prepared("user_by_id", (1,))
+
+        client.prepare("user_by_id", "SELECT id, name FROM users WHERE id = $1")
+        client.execute_prepared("user_by_id", (1,))
+
+        conn = client.pool.idle[0]
+        statements = [query for query, _ in conn.executed]
+        assert statements[2:] == [
+            "DEALLOCATE user_by_id",
+            "PREPARE user_by_id AS SELECT id, name FROM users WHERE id = $1",
+            "EXECUTE user_by_id (%s)",
+        ]
+        assert conn.prepared == {
+            "user_by_id": "SELECT id, name FROM users WHERE id = $1"
+        }
+
+    def test_copy_rows_keeps_empty_strings_apart_from_null(self, monkeypatch):
+        """Test COPY text rows write NULL as \\N and escape special characters."""
+        client = make_client(monkeypatch)
+        # Quoting identifiers needs a live connection
+        monkeypatch.setattr(
+            postgres_client.sql.Composed, "as_string", lambda self, context: "COPY"
+        )
+
+        result = client.copy_rows(
+            "users",
+            ("id", "name", "email"),
+            [(1, "", None), (2, "tab\there", "back\\slash\nline")],
+            chunk_size=1,
+        )
+
+        copies = [
+            data for query, data in client.pool.idle[0].executed if query == "COPY"
+        ]
+        assert copies == ["1\t\t\\N\n", "2\ttab\\there\tback\\\\slash\\nline\n"]
+        assert (result.rows, result.chunks) == (2, 2)
+
+    def test_stream_runs_in_a_read_only_transaction(self, monkeypatch):
+        """Test streaming sets READ ONLY, fetches in chunks and rolls back."""
+        client = make_client(monkeypatch)
+        conn = client.pool.idle[0]
+        conn.results = [[], [(1,), (2,), (3,)]]
+
+        chunks = list(client.stream_query_chunks("SELECT id FROM users", chunk_size=2))
+
+        assert chunks == [[(1,), (2,)], [(3,)]]
+        assert conn.executed == [
+            ("SET TRANSACTION READ ONLY", None),
+            ("SELECT id FROM users", None),
+            ("ROLLBACK", None),
+        ]
+        assert conn.autocommit is True
+        assert client.pool.used == []
+
+    def test_closing_a_stream_returns_the_connection(self, monkeypatch):
+        """Test a partly consumed stream releases its connection on close."""
+        client = make_client(monkeypatch, max_connections=1, checkout_timeout=0.05)
+        client.pool.idle[0].results = [[], [(1,), (2,), (3,)]]
+
+        rows = client.stream_query("SELECT id FROM users", itersize=1)
+        assert next(rows) == (1,)
+        rows.close()
+
+        assert client.pool.used == []
+        assert client.pool.idle[0].executed[-1] == ("ROLLBACK", None)
+        with client.connection():
+            pass
+
+
+class TestUserDBClient:
+    """Test cases for the bulk user helpers."""
+
+    class RecordingClient:
+        def __init__(self):
+            self.rows: List[tuple] = []
+
+        def prepare(self, name: str, query: str) -> None:
+            pass
+
+        def execute_batch_values(self, query, rows, chunk_size=1000, template=None):
+            self.rows = list(rows)
+            return BulkResult(len(self.rows), 0.0, 1)
+
+    def test_upsert_keeps_the_last_row_per_id(self):
+        """Test duplicate ids collapse to their last row before batching."""
+        db_client = self.RecordingClient()
+
+        UserDBClient(db_client).upsert_users(
+            [
+                UserEntity(1, "Alice", "old@example.com"),
+                UserEntity(2, "Bob", "bob@example.com"),
+                UserEntity(1, "Alice", "new@example.com"),
+            ]
+        )
+
+        assert db_client.rows == [
+            (1, "Alice", "new@example.com"),
+            (2, "Bob", "bob@example.com"),
+        ]
+
+
+class TestUserController:
+    """Test cases for UserController against the fake pool."""
+
+    def test_missing_user_is_none(self, monkeypatch):
+        """Test an unknown id returns None instead of failing to unpack."""
+        controller = UserController(make_client(monkeypatch))
+
+        assert controller.get_user_entity_by_id(404) is None
+
+    def test_user_by_id(self, monkeypatch):
+        """Test a found row is returned as a UserEntity."""
+        client = make_client(monkeypatch)
+        # PREPARE returns nothing, EXECUTE returns the row
+        client.pool.idle[0].results = [[], [(1, "Alice", "alice@example.com")]]
+
+        user = UserController(client).get_user_entity_by_id(1)
+
+        assert (user.id, user.name, user.email) == (1, "Alice", "alice@example.com")
+
+    def test_streamed_users_match_the_full_result(self, monkeypatch):
+        """Test streamed and chunked users equal the eagerly fetched list."""
+        client = make_client(monkeypatch)
+        rows = [(1, "Alice", "alice@example.com"), (2, "Bob", "bob@example.com")]
+        # Full fetch, then SET TRANSACTION + SELECT for each stream
+        client.pool.idle[0].results = [rows, [], rows, [], rows]
+        controller = UserController(client)
+
+        users = controller.get_all_user_entities()
+        streamed = list(controller.iter_user_entities(itersize=1))
+        chunks = list(controller.iter_user_entity_chunks(chunk_size=1))
+
+        assert len(users) == 2
+        assert streamed == users
+        assert [chunk[0] for chunk in chunks] == users
@@ -0,0 +1,118 @@
+"""Tests for the recorded response archive."""
+
+import gzip
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from core.api import replay_archive
+from core.api.replay_archive import ReplayArchive, make_key
+
+
+def save_entries(path: str, worker: int, count: int) -> None:
+    for index in range(count):
+        archive = ReplayArchive(path)
+        archive.add("GET", f"/{worker}.{index}", 200, "application/json", "{}")
+        archive.save()
+
+
+class TestReplayArchive:
+    """Test cases for ReplayArchive."""
+
+    def test_keys_drop_secrets_and_sort_params(self):
+        """Test the key ignores access keys and parameter order."""
+        assert make_key("get", "http://api/8.8.8.8?hostname=1&access_key=x&a=2") == (
+            "GET /8.8.8.8?a=2&hostname=1"
+        )
+        assert make_key("GET", "http://api") == "GET /"
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test a saved archive is read back with the same entries."""
+        path = tmp_path / "ip_stack.json.gz"
+        archive = ReplayArchive(str(path))
+        archive.add("GET", "/8.8.8.8?access_key=secret", 200, "application/json", "{}")
+        archive.save()
+
+        loaded = ReplayArchive(str(path))
+
+        assert loaded.get("GET", "/8.8.8.8?access_key=other") == {
+            "status": 200,
+            "content_type": "application/json",
+            "body": "{}",
+        }
+        assert b"secret" not in gzip.decompress(path.read_bytes())
+        assert not path.with_name(f"{path.name}.lock").exists()
+
+    def test_concurrent_processes_keep_every_entry(self, tmp_path):
+        """Test workers saving at the same time never drop each other's entries."""
+        path = str(tmp_path / "ip_stack.json.gz")
+        workers = [
+            multiprocessing.Process(target=save_entries, args=(path, worker, 5))
+            for worker in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert len(ReplayArchive(path)) == 20
+
+    def test_stale_lock_is_broken(self, tmp_path, monkeypatch):
+        """Test a lock left by a crashed process does not block saving."""
+        monkeypatch.setattr(replay_archive, "STALE_LOCK_SECONDS", 1.0)
+        path = tmp_path / "ip_stack.json.gz"
+        lock = path.with_name(f"{path.name}.lock")
+        lock.touch()
+        stale = time.time() - 10
+        os.utime(lock, (stale, stale))
+        archive = ReplayArchive(str(path))
+        archive.add("GET", "/8.8.8.8", 200, "application/json", "{}")
+
+        archive.save()
+
+        assert len(ReplayArchive(str(path))) == 1
+
+    def test_held_lock_times_out(self, tmp_path):
+        """Test a live lock makes the second holder give up after the timeout."""
+        lock = tmp_path / "ip_stack.json.gz.lock"
+
+        with replay_archive._file_lock(lock, timeout=5):
+            with pytest.raises(TimeoutError):
+                with replay_archive._file_lock(lock, timeout=0.1):
+                    pass
+
+    def test_unknown_version_is_rejected(self, tmp_path):
+        """Test archives from another format version are not misread."""
+        path = tmp_path / "ip_stack.json.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"version": 99, "entries": {}}, f)
+
+        with pytest.raises(ValueError, match="Unsupported replay archive version"):
+            ReplayArchive(str(path))
+
+    def test_import_har_filters_by_host(self, tmp_path):
+        """Test HAR entries of other hosts are skipped."""
+        har = {
+            "log": {
+                "entries": [
+                    {
+                        "request": {"method": "GET", "url": f"http://{host}/8.8.8.8"},
+                        "response": {
+                            "status": 200,
+                            "content": {"mimeType": "application/json", "text": "{}"},
+                        },
+                    }
+                    for host in ("api.ipstack.com", "www.saucedemo.com")
+                ]
+            }
+        }
+        har_path = tmp_path / "session.har"
+        har_path.write_text(json.dumps(har))
+        archive = ReplayArchive()
+
+        assert archive.import_har(str(har_path), host="api.ipstack.com") == 1
+        assert archive.get("GET", "http://api.ipstack.com/8.8.8.8")["body"] == "{}"
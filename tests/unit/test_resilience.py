@@ -0,0 +1,120 @@
+"""Tests for retries and the circuit breaker."""
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response
+from requests.exceptions import ChunkedEncodingError
+
+from core.api.base_request import BaseRequest
+from core.api.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FakeSession:
+    """Returns (or raises) the queued outcomes in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = Response()
+        response.status_code = outcome
+        response._content = b"{}"
+        return response
+
+
+def make_client(session: FakeSession, breaker: CircuitBreaker) -> BaseRequest:
+    client = BaseRequest(
+        "http://api.example.com",
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0, jitter=0),
+        circuit_breaker=breaker,
+    )
+    client.session = session
+    return client
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state changes."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_lets_one_probe_through(self, monkeypatch):
+        """Test only one caller gets the trial call, success closes the circuit."""
+        now = 100.0
+        monkeypatch.setattr("core.api.resilience.time.monotonic", lambda: now)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+        now = 111.0
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        """Test a failed trial call opens the circuit again."""
+        now = 100.0
+        monkeypatch.setattr("core.api.resilience.time.monotonic", lambda: now)
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+        for _ in range(3):
+            breaker.record_failure()
+        now = 111.0
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.probing
+
+
+class TestRetries:
+    """Test cases for BaseRequest retries."""
+
+    def test_get_is_retried_on_retryable_status(self):
+        """Test a GET is retried until it succeeds."""
+        session = FakeSession(503, 502, 200)
+        breaker = CircuitBreaker()
+
+        response = make_client(session, breaker).get("ip")
+
+        assert response.status_code == 200
+        assert session.calls == 3
+        assert breaker.failures == 0
+
+    def test_post_is_not_retried(self):
+        """Test non-idempotent requests are sent once."""
+        session = FakeSession(RequestsConnectionError("reset"), 200)
+        breaker = CircuitBreaker()
+
+        with pytest.raises(RequestsConnectionError):
+            make_client(session, breaker).post("users", json={})
+
+        assert session.calls == 1
+        assert breaker.failures == 1
+
+    def test_other_request_errors_count_as_failures(self):
+        """Test exceptions other than connection errors reach the breaker."""
+        session = FakeSession(ChunkedEncodingError("truncated"))
+        breaker = CircuitBreaker()
+
+        with pytest.raises(ChunkedEncodingError):
+            make_client(session, breaker).get("ip")
+
+        assert breaker.failures == 1
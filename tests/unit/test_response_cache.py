@@ -0,0 +1,98 @@
+"""Tests for the API response cache."""
+
+import json
+
+import pytest
+from requests import Response
+
+from core.api.response_cache import ResponseCache
+
+URL = "http://api.example.com/134.201.250.155"
+
+
+def make_response(body, status_code: int = 200) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    response.url = URL
+    return response
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_hit_after_set_with_normalized_params(self):
+        """Test a stored response is returned for the same params in any order."""
+        cache = ResponseCache()
+        cache.set("GET", URL, {"a": 1, "b": 2}, make_response({"ip": "1"}))
+
+        cached = cache.get("GET", URL, {"b": 2, "a": 1})
+
+        assert cached.json() == {"ip": "1"}
+        assert cache.stats.hits == 1
+
+    def test_expired_entry_is_a_miss(self, monkeypatch):
+        """Test entries are dropped once their TTL passed."""
+        cache = ResponseCache(default_ttl=10)
+        now = 1000.0
+        monkeypatch.setattr("core.api.response_cache.time.time", lambda: now)
+        cache.set("GET", URL, None, make_response({"ip": "1"}))
+
+        now = 1011.0
+
+        assert cache.get("GET", URL) is None
+        assert len(cache) == 0
+
+    def test_ttl_override_by_path(self):
+        """Test a matching override replaces the default TTL, 0 disables caching."""
+        cache = ResponseCache(
+            ttl_overrides=ResponseCache.parse_ttl_overrides("/check*=60, /134.*=0")
+        )
+
+        assert cache.ttl_for("http://api.example.com/check/1") == 60
+        cache.set("GET", URL, None, make_response({"ip": "1"}))
+        assert cache.get("GET", URL) is None
+
+    def test_invalid_ttl_override(self):
+        """Test malformed overrides are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache.parse_ttl_overrides("/check*")
+
+    def test_lru_eviction_by_size(self):
+        """Test the least recently used entry is evicted over the size cap."""
+        body = {"data": "x" * 100}
+        size = len(make_response(body).content)
+        cache = ResponseCache(max_bytes=size * 2)
+        for name in ("a", "b"):
+            cache.set("GET", f"{URL}/{name}", None, make_response(body))
+        cache.get("GET", f"{URL}/a")
+
+        cache.set("GET", f"{URL}/c", None, make_response(body))
+
+        assert cache.get("GET", f"{URL}/b") is None
+        assert cache.get("GET", f"{URL}/a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_error_payload_is_not_cached(self):
+        """Test ipstack errors reported with HTTP 200 are not cached."""
+        cache = ResponseCache()
+        error = {"success": False, "error": {"code": 104, "type": "usage_limit"}}
+
+        cache.set("GET", URL, None, make_response(error))
+
+        assert cache.get("GET", URL) is None
+        assert cache.stats.stores == 0
+
+    def test_disk_backend_round_trip(self, tmp_path):
+        """Test entries are stored as JSON files and read by a new cache."""
+        ResponseCache(directory=str(tmp_path)).set(
+            "GET", URL, None, make_response({"ip": "1"})
+        )
+        (entry,) = tmp_path.glob("*.json")
+        assert json.loads(entry.read_text())["status_code"] == 200
+
+        cached = ResponseCache(directory=str(tmp_path)).get("GET", URL)
+
+        assert cached.json() == {"ip": "1"}
+        assert cached.headers["content-type"] == "application/json"
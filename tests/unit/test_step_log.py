@@ -0,0 +1,95 @@
+"""Tests for the buffered page action log."""
+
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from core.page import step_log
+from core.page.step_log import StepLog
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    attachments = []
+
+    def attach(body=None, name=None, attachment_type=None):
+        attachments.append((name, body))
+
+    monkeypatch.setattr(
+        "core.page.step_log.allure",
+        SimpleNamespace(attach=attach, attachment_type=allure.attachment_type),
+    )
+    yield attachments
+    active = StepLog.active()
+    if active is not None:
+        active.close()
+
+
+class TestStepLog:
+    """Test cases for StepLog."""
+
+    def test_actions_are_attached_in_order_on_close(self, attached):
+        """Test buffered actions become one attachment when the test ends."""
+        StepLog.start("all")
+        step_log.log("Element Clicked", "Clicked on element '{}'", "#login")
+        step_log.log("Input Filled", "Filled input '{}' with text: {}", "#user", "bob")
+        assert attached == []
+
+        StepLog.active().close()
+
+        [(name, body)] = attached
+        lines = body.splitlines()
+        assert name == "Page Actions"
+        assert lines[0].endswith("[Element Clicked] Clicked on element '#login'")
+        assert lines[1].endswith("[Input Filled] Filled input '#user' with text: bob")
+        assert StepLog.active() is None
+
+    def test_failures_verbosity_keeps_only_failed_tests(self, attached):
+        """Test the failures level drops the log of a passing test."""
+        StepLog.start("failures")
+        step_log.log("Page Title", "{}", "Swag Labs")
+        StepLog.active().close(failed=False)
+
+        StepLog.start("failures")
+        step_log.log("Page Title", "{}", "Swag Labs")
+        StepLog.active().close(failed=True)
+
+        assert len(attached) == 1
+
+    def test_off_records_nothing(self, attached):
+        """Test the off level neither buffers nor attaches."""
+        StepLog.start("off")
+        step_log.log("Page Title", "{}", "Swag Labs")
+        StepLog.active().close(failed=True)
+
+        assert attached == []
+
+    def test_flush_attaches_what_was_logged_so_far(self, attached):
+        """Test a mid-test flush (on failure) does not repeat lines at close."""
+        StepLog.start("all")
+        step_log.log("Page Title", "{}", "first")
+        StepLog.active().flush(failed=True)
+        step_log.log("Page Title", "{}", "second")
+        StepLog.active().close()
+
+        assert [body.split("] ")[1] for _, body in attached] == ["first", "second"]
+
+    def test_bad_template_is_kept_with_its_args(self, attached):
+        """Test a template that does not match its args is still logged."""
+        StepLog.start("all")
+        step_log.log("Broken", "{} and {}", "only one")
+        StepLog.active().close()
+
+        assert attached[0][1].endswith("[Broken] {} and {} ('only one',)")
+
+    def test_without_active_log_attaches_immediately(self, attached):
+        """Test log() falls back to a direct attachment."""
+        step_log.log("Element Clicked", "Clicked on element '{}'", "#login")
+
+        assert attached == [("Element Clicked", "Clicked on element '#login'")]
+
+    def test_unknown_verbosity_is_rejected(self):
+        """Test a typo in UI_STEP_LOG fails fast."""
+        with pytest.raises(ValueError):
+            StepLog("verbose")
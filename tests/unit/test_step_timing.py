@@ -0,0 +1,124 @@
+"""Tests for page-object step timing and budgets."""
+
+import asyncio
+
+import pytest
+
+from core.page.step_timing import (
+    BudgetExceeded,
+    StepTimings,
+    instrument,
+    record_navigation,
+    record_navigation_async,
+)
+
+METRICS = {"load": 250.0, "dom_content_loaded": 120.0}
+
+
+class LoginPage:
+    def login(self):
+        return "logged in"
+
+    async def login_async(self):
+        await asyncio.sleep(0)
+        return "logged in"
+
+    def _helper(self):
+        return "private"
+
+
+instrument(LoginPage, kind="step")
+
+
+class FakePage:
+    def evaluate(self, script):
+        return dict(METRICS)
+
+
+class FakeAsyncPage:
+    async def evaluate(self, script):
+        return dict(METRICS)
+
+
+@pytest.fixture
+def timings():
+    timings = StepTimings.start("test_login")
+    timings.phase = "call"
+    yield timings
+    timings.stop()
+
+
+class TestStepTimings:
+    """Test cases for StepTimings and instrument."""
+
+    def test_sync_and_async_steps_are_recorded(self, timings):
+        """Test coroutine methods are timed until they complete."""
+        page = LoginPage()
+
+        assert page.login() == "logged in"
+        assert asyncio.run(page.login_async()) == "logged in"
+        assert page._helper() == "private"
+
+        assert [(r.name, r.kind) for r in timings.records] == [
+            ("LoginPage.login", "step"),
+            ("LoginPage.login_async", "step"),
+        ]
+
+    def test_nothing_is_recorded_without_a_registry(self):
+        """Test instrumented methods run untimed outside a test."""
+        assert StepTimings.active() is None
+        assert LoginPage().login() == "logged in"
+
+    def test_budgets_only_check_the_call_phase(self, timings):
+        """Test setup and teardown steps never fail a budget."""
+        timings.budget("LoginPage.*", 1.0)
+        for phase in ("setup", "call", "teardown"):
+            timings.phase = phase
+            timings.record(f"LoginPage.{phase}", "step", timings.origin, 2.0)
+
+        [(timing, limit)] = timings.violations()
+        assert (timing.name, limit) == ("LoginPage.call", 1.0)
+        with pytest.raises(BudgetExceeded, match="LoginPage.call took 2.000s"):
+            timings.check_budgets()
+
+    def test_fast_steps_pass_their_budget(self, timings):
+        """Test steps under the budget raise nothing."""
+        timings.record("LoginPage.login", "step", timings.origin, 0.5)
+
+        timings.check_budgets([("LoginPage.login", 1.0)])
+
+    def test_records_are_exported_with_their_phase(self, timings):
+        """Test the JSON export keeps the phase of every record."""
+        timings.record("LoginPage.login", "step", timings.origin, 0.5)
+
+        [record] = timings.as_dict()["records"]
+        assert record["phase"] == "call"
+        assert record["seconds"] == 0.5
+
+
+class TestNavigationTiming:
+    """Test cases for Navigation Timing and Web Vitals."""
+
+    def test_web_vitals_are_off_by_default(self, timings):
+        """Test goto costs no extra evaluate unless UI_WEB_VITALS is set."""
+        record_navigation(FakePage(), "https://www.saucedemo.com/")
+
+        assert timings.records == []
+
+    def test_sync_navigation_is_recorded_when_enabled(self, timings):
+        """Test the load time becomes the navigation's duration."""
+        timings.web_vitals = True
+
+        record_navigation(FakePage(), "https://www.saucedemo.com/")
+
+        [record] = timings.records
+        assert (record.kind, record.seconds) == ("navigation", 0.25)
+        assert record.metrics == METRICS
+
+    def test_async_navigation_is_recorded_when_enabled(self, timings):
+        """Test async pages record their navigations too."""
+        timings.web_vitals = True
+
+        asyncio.run(record_navigation_async(FakeAsyncPage(), "https://example.com/"))
+
+        assert [record.name for record in timings.records] == ["https://example.com/"]
@@ -0,0 +1,66 @@
+"""Tests for the authenticated storage state cache."""
+
+import json
+import os
+
+from core.page.storage_state_cache import StorageStateCache
+
+STATE = {"cookies": [{"name": "session-username", "value": "standard_user"}]}
+
+
+class FakeContext:
+    def storage_state(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(STATE, f)
+        return STATE
+
+
+class TestStorageStateCache:
+    """Test cases for StorageStateCache."""
+
+    def test_saved_state_is_returned_as_a_dict(self, tmp_path):
+        """Test get() hands back the loaded state, not a file path."""
+        cache = StorageStateCache(str(tmp_path))
+
+        assert cache.save(FakeContext(), "standard_user", "dev") == STATE
+        assert cache.get("standard_user", "dev") == STATE
+        assert list(tmp_path.iterdir()) == [cache.path("standard_user", "dev")]
+
+    def test_loaded_state_survives_invalidation(self, tmp_path):
+        """Test a state already read stays usable after the file is removed."""
+        cache = StorageStateCache(str(tmp_path))
+        cache.save(FakeContext(), "standard_user", "dev")
+
+        state = cache.get("standard_user", "dev")
+        cache.invalidate("standard_user", "dev")
+
+        assert state == STATE
+        assert cache.get("standard_user", "dev") is None
+
+    def test_expired_state_is_dropped(self, tmp_path):
+        """Test states older than the TTL are ignored and deleted."""
+        cache = StorageStateCache(str(tmp_path), ttl_seconds=60)
+        cache.save(FakeContext(), "standard_user", "dev")
+        path = cache.path("standard_user", "dev")
+        stale = path.stat().st_mtime - 120
+        os.utime(path, (stale, stale))
+
+        assert cache.get("standard_user", "dev") is None
+        assert not path.exists()
+
+    def test_corrupt_state_is_dropped(self, tmp_path):
+        """Test an unreadable file counts as a miss."""
+        cache = StorageStateCache(str(tmp_path))
+        path = cache.path("standard_user", "dev")
+        path.write_text("{not json", encoding="utf-8")
+
+        assert cache.get("standard_user", "dev") is None
+        assert not path.exists()
+
+    def test_states_are_kept_per_user_and_env(self, tmp_path):
+        """Test users and environments get separate files."""
+        cache = StorageStateCache(str(tmp_path))
+
+        assert cache.path("a", "dev") != cache.path("b", "dev")
+        assert cache.path("a", "dev") != cache.path("a", "staging")
+        assert cache.path("", "dev").name == "dev__anonymous.json"
@@ -0,0 +1,157 @@
+"""Tests for the trace capture policy and the artifact ring."""
+
+import os
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from core.page.trace_capture import ArtifactRing, TraceCapture
+
+
+def make_file(ring: ArtifactRing, name: str, age: int):
+    path = ring.directory / name
+    path.write_bytes(name.encode())
+    mtime = 1_700_000_000 - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    files = []
+
+    def attach_file(source, name, extension):
+        files.append((name, extension, open(source, "rb").read()))
+
+    monkeypatch.setattr(
+        "core.page.trace_capture.allure",
+        SimpleNamespace(attach=SimpleNamespace(file=attach_file)),
+    )
+    return files
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = self
+        self.started = False
+
+    def start(self, **options):
+        self.started = True
+
+    def stop(self, path=None):
+        if path is not None:
+            path.write_bytes(b"trace")
+
+    def on(self, event, callback):
+        pass
+
+
+class TestArtifactRing:
+    """Test cases for ArtifactRing."""
+
+    def test_oldest_files_are_pruned(self, tmp_path):
+        """Test only the newest ``keep`` files survive."""
+        ring = ArtifactRing(str(tmp_path), keep=2)
+        old = make_file(ring, "old.zip", age=30)
+        middle = make_file(ring, "middle.zip", age=20)
+        new = make_file(ring, "new.zip", age=10)
+
+        assert ring.add(new) == new
+        assert not old.exists()
+        assert middle.exists() and new.exists()
+
+    def test_workers_get_their_own_directory(self, tmp_path):
+        """Test pruning in one worker never deletes another worker's files."""
+        gw0 = ArtifactRing(str(tmp_path), keep=1, worker="gw0")
+        gw1 = ArtifactRing(str(tmp_path), keep=1, worker="gw1")
+        kept = make_file(gw1, "a.zip", age=30)
+
+        gw0.add(make_file(gw0, "b.zip", age=20))
+        gw0.add(make_file(gw0, "c.zip", age=10))
+
+        assert gw0.directory == tmp_path / "gw0"
+        assert kept.exists()
+        assert [f.name for f in gw0.directory.iterdir()] == ["c.zip"]
+
+
+class TestTraceCapture:
+    """Test cases for TraceCapture policies."""
+
+    @pytest.mark.parametrize(
+        "mode, retry, recording",
+        [
+            ("off", False, False),
+            ("always", False, True),
+            ("failures", False, True),
+            ("retries", False, False),
+            ("retries", True, True),
+        ],
+    )
+    def test_recording_decision(self, tmp_path, mode, retry, recording):
+        """Test which tests are recorded per mode."""
+        capture = TraceCapture(ArtifactRing(str(tmp_path)), mode=mode)
+
+        assert capture.begin("test_login", retry=retry) is recording
+
+    def test_sampled_mode_uses_the_percentage(self, tmp_path):
+        """Test sampling records roughly the configured share of tests."""
+        capture = TraceCapture(
+            ArtifactRing(str(tmp_path)),
+            mode="sampled",
+            sample_percent=25,
+            rng=random.Random(1),
+        )
+
+        recorded = sum(capture.begin(f"test_{i}") for i in range(1000))
+
+        assert 200 < recorded < 300
+
+    def test_failures_mode_keeps_only_failed_tests(self, tmp_path):
+        """Test passing tests drop their recording in failures mode."""
+        capture = TraceCapture(ArtifactRing(str(tmp_path)), mode="failures")
+        capture.begin("test_login")
+
+        assert capture.keep(failed=True)
+        assert not capture.keep(failed=False)
+
+    def test_kept_traces_are_attached(self, tmp_path, attached):
+        """Test kept trace zips are attached to the report, not linked."""
+        capture = TraceCapture(ArtifactRing(str(tmp_path)), mode="always")
+        capture.begin("test_login")
+        context = FakeContext()
+        capture.watch(context)
+
+        [path] = capture.stop_traces(failed=False)
+
+        assert context.started
+        assert attached == [("Playwright trace: test_login_0.zip", "zip", b"trace")]
+        assert path.exists()
+
+    def test_kept_har_files_are_attached(self, tmp_path, attached):
+        """Test HAR files are recorded in the ring and attached on finish."""
+        capture = TraceCapture(
+            ArtifactRing(str(tmp_path)), mode="always", kinds=["har"]
+        )
+        capture.begin("test_login")
+        har_path = capture.context_args()["record_har_path"]
+        with open(har_path, "w") as f:
+            f.write("{}")
+
+        capture.finish(failed=False)
+
+        assert attached == [("HAR: test_login_0.har", "har", b"{}")]
+
+    def test_dropped_har_files_are_deleted(self, tmp_path, attached):
+        """Test HAR files of passing tests are removed in failures mode."""
+        capture = TraceCapture(
+            ArtifactRing(str(tmp_path)), mode="failures", kinds=["har"]
+        )
+        capture.begin("test_login")
+        har_path = capture.context_args()["record_har_path"]
+        with open(har_path, "w") as f:
+            f.write("{}")
+
+        assert capture.finish(failed=False) == []
+        assert not os.path.exists(har_path)
+        assert attached == []